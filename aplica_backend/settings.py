@@ -261,6 +261,62 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# Hirebase ingestion
+# "serial" processes pages inside hirebase_task, "pipelined" does the same while
+# prefetching upcoming pages, and "parallel" fans them out as Celery chords.
+HIREBASE_INGESTION_MODE = os.environ.get("HIREBASE_INGESTION_MODE", "serial")
+# Number of pages in flight at once in parallel mode.
+HIREBASE_CONCURRENCY = int(os.environ.get("HIREBASE_CONCURRENCY", "4"))
+# Pages downloaded ahead of the page being written in pipelined mode.
+HIREBASE_PREFETCH_PAGES = int(os.environ.get("HIREBASE_PREFETCH_PAGES", "2"))
+# Jobs requested per Hirebase page.
+HIREBASE_PAGE_LIMIT = int(os.environ.get("HIREBASE_PAGE_LIMIT", "100"))
+# Decode the jobs array of each page incrementally instead of loading the whole body;
+# keeps worker memory flat for large pages. Pipelined mode ignores it (with a
+# warning) and decodes its prefetched pages whole.
+HIREBASE_STREAMING = os.environ.get("HIREBASE_STREAMING", "False") == "True"
+# Jobs written per INSERT ... ON CONFLICT statement.
+HIREBASE_UPSERT_BATCH_SIZE = int(os.environ.get("HIREBASE_UPSERT_BATCH_SIZE", "100"))
+# Hours an interrupted sync's page checkpoint can be resumed for.
+HIREBASE_CHECKPOINT_MAX_AGE = float(os.environ.get("HIREBASE_CHECKPOINT_MAX_AGE", "24"))
+# Seconds a running sync's lock lasts without being refreshed (it is refreshed per
+# page). Must exceed the slowest page, retries included; a checkpoint is only
+# resumed once its run's lock has expired.
+HIREBASE_SYNC_LOCK_TIMEOUT = int(os.environ.get("HIREBASE_SYNC_LOCK_TIMEOUT", "1800"))
+# HTTP client: connect/read timeouts in seconds, retries with exponential backoff.
+HIREBASE_CONNECT_TIMEOUT = float(os.environ.get("HIREBASE_CONNECT_TIMEOUT", "10"))
+HIREBASE_READ_TIMEOUT = float(os.environ.get("HIREBASE_READ_TIMEOUT", "300"))
+HIREBASE_MAX_RETRIES = int(os.environ.get("HIREBASE_MAX_RETRIES", "3"))
+HIREBASE_BACKOFF_BASE = float(os.environ.get("HIREBASE_BACKOFF_BASE", "1"))
+HIREBASE_BACKOFF_MAX = float(os.environ.get("HIREBASE_BACKOFF_MAX", "60"))
+HIREBASE_POOL_SIZE = int(os.environ.get("HIREBASE_POOL_SIZE", "10"))
+# Sync run summaries kept for the hirebase_sync_runs command and /metrics/.
+HIREBASE_TELEMETRY_RUNS = int(os.environ.get("HIREBASE_TELEMETRY_RUNS", "100"))
+# Bearer token required to scrape /metrics/; leave empty to allow unauthenticated scrapes.
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+# Seconds a /jobs/ count is cached; a finished sync invalidates counts earlier.
+JOB_COUNT_CACHE_TIMEOUT = int(os.environ.get("JOB_COUNT_CACHE_TIMEOUT", "600"))
+# On PostgreSQL, report the planner's estimate instead of counting when it expects
+# at least this many matching jobs; 0 always counts exactly.
+JOB_COUNT_ESTIMATE_THRESHOLD = int(os.environ.get("JOB_COUNT_ESTIMATE_THRESHOLD", "0"))
+# Seconds a rendered /jobs/ page is cached; a finished sync invalidates pages earlier.
+# 0 disables the response cache.
+JOB_RESPONSE_CACHE_TIMEOUT = int(os.environ.get("JOB_RESPONSE_CACHE_TIMEOUT", "300"))
+# Cache-Control lifetimes of /jobs/, /locations/ and /location-field/ responses for
+# browsers (max-age) and the CDN (s-maxage), which is purged after syncs.
+HTTP_CACHE_MAX_AGE = int(os.environ.get("HTTP_CACHE_MAX_AGE", "60"))
+HTTP_CACHE_S_MAXAGE = int(os.environ.get("HTTP_CACHE_S_MAXAGE", "3600"))
+# Dotted path of the CDN purge backend (see job_board.purge).
+SURROGATE_PURGE_BACKEND = os.environ.get(
+    "SURROGATE_PURGE_BACKEND", "job_board.purge.LoggingPurgeBackend"
+)
+FASTLY_API_TOKEN = os.environ.get("FASTLY_API_TOKEN", "")
+FASTLY_SERVICE_ID = os.environ.get("FASTLY_SERVICE_ID", "")
+FASTLY_SOFT_PURGE = os.environ.get("FASTLY_SOFT_PURGE", "False") == "True"
+# Redis database the job_board tests use instead of REDIS_URL's; it is flushed around
+# each test, so it must not hold anything else.
+TEST_REDIS_URL = os.environ.get("TEST_REDIS_URL", "redis://localhost:6379/15")
+
 # Django REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Job
+from .models import Job, Location, SyncState
 import csv
 from django.http import HttpResponse
 
@@ -119,3 +119,15 @@ class JobAdmin(admin.ModelAdmin):
         return response
 
     export_as_csv.short_description = "Export Selected as CSV"
+
+
+@admin.register(SyncState)
+class SyncStateAdmin(admin.ModelAdmin):
+    list_display = ["source", "high_water_date_posted", "last_success_at"]
+    readonly_fields = ["updated_at"]
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ["city", "country", "region"]
+    search_fields = ["city", "country", "region"]
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, post_save, pre_save
 
 
 class JobBoardConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "job_board"
+
+    def ready(self):
+        from .locations import sync_saved_job_locations
+        from .models import Job
+        from .ranges import set_range_columns
+        from .rendering import rerender_job_json
+        from .search import ensure_search_index
+
+        post_migrate.connect(ensure_search_index, sender=self)
+        pre_save.connect(set_range_columns, sender=Job)
+        pre_save.connect(rerender_job_json, sender=Job)
+        post_save.connect(sync_saved_job_locations, sender=Job)
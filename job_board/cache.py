@@ -0,0 +1,165 @@
+"""
+Redis caching of data derived from the jobs table: ``/jobs/`` counts and pages.
+
+Cached entries are keyed by the dataset generation, a counter bumped whenever
+ingestion or cleanup writes jobs, so a finished sync invalidates everything
+at once without scanning keys; entries of old generations simply expire.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import redis
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+
+from . import utils
+from .filters import JOB_POSTED_WINDOWS, job_posted_step
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "job_board:dataset:generation"
+COUNT_KEY_PREFIX = "job_board:count:"
+RESPONSE_KEY_PREFIX = "job_board:response:"
+
+
+def dataset_generation() -> int:
+    """Return the current dataset generation (0 before the first bump)."""
+    return int(utils.redis_client.get(GENERATION_KEY) or 0)
+
+
+def bump_dataset_generation() -> Optional[int]:
+    """Start a new dataset generation, invalidating everything cached for the old one."""
+    try:
+        generation = utils.redis_client.incr(GENERATION_KEY)
+    except redis.RedisError as e:
+        logger.warning(f"Could not bump the dataset generation: {e}")
+        return None
+    logger.debug(f"Dataset generation is now {generation}.")
+    return generation
+
+
+def _float_param(value: Optional[str]) -> Optional[str]:
+    try:
+        return repr(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_filters(params: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Reduce ``/jobs/`` query params to the filters that select rows.
+
+    Filters the list view ignores (empty or invalid values) are dropped, and
+    values are normalized the way the view compares them: ``q``, ``job_type``
+    and ``location_type`` match case-insensitively, so they are lower-cased;
+    ``location`` is matched exactly, so only its whitespace is trimmed. A
+    ``job_posted`` filter adds the current ``job_posted_step``, which its
+    cutoff is counted from.
+    """
+    filters = {}
+    q = " ".join((params.get("q") or "").split()).lower()
+    if q:
+        filters["q"] = q
+    location = [part.strip() for part in (params.get("location") or "").split(",")]
+    location = ",".join(location[:3]).rstrip(",")
+    if location:
+        filters["location"] = location
+    for name in ["job_type", "location_type"]:
+        value = (params.get(name) or "").strip().lower()
+        if value:
+            filters[name] = value
+    if params.get("job_posted") in JOB_POSTED_WINDOWS:
+        filters["job_posted"] = params["job_posted"]
+        # The cutoff moves with time, not with the dataset generation.
+        filters["job_posted_step"] = job_posted_step()
+    for name in ["salary_min", "salary_max", "yoe_min", "yoe_max"]:
+        value = _float_param(params.get(name))
+        if value is not None:
+            filters[name] = value
+    return filters
+
+
+def filter_signature(params: Mapping[str, str]) -> str:
+    """Stable digest of the normalized filters in ``params``."""
+    filters = json.dumps(normalize_filters(params), sort_keys=True)
+    return hashlib.sha1(filters.encode()).hexdigest()
+
+
+def get_cached_count(signature: str) -> Optional[Tuple[int, bool]]:
+    """Return ``(count, exact)`` cached for the current generation, if any."""
+    try:
+        key = f"{COUNT_KEY_PREFIX}{dataset_generation()}:{signature}"
+        cached = utils.redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read a cached job count: {e}")
+        return None
+    if cached is None:
+        return None
+    count, exact = cached.split(":")
+    return int(count), exact == "1"
+
+
+def set_cached_count(signature: str, count: int, exact: bool):
+    try:
+        key = f"{COUNT_KEY_PREFIX}{dataset_generation()}:{signature}"
+        utils.redis_client.set(
+            key, f"{count}:{int(exact)}", ex=settings.JOB_COUNT_CACHE_TIMEOUT
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Could not cache a job count: {e}")
+
+
+def estimate_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Return the PostgreSQL planner's row estimate for ``queryset``.
+
+    Returns None on other databases. The estimate comes from table statistics
+    and can be off by a wide margin for selective filters.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def response_cache_key(name: str, params: Mapping[str, Any]) -> Optional[str]:
+    """
+    Key for a response of view ``name`` to the normalized ``params``.
+
+    The key pins the current generation, so it must be taken before the
+    response is built. Returns None when Redis is unavailable.
+    """
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    try:
+        generation = dataset_generation()
+    except redis.RedisError as e:
+        logger.warning(f"Could not read the dataset generation: {e}")
+        return None
+    return f"{RESPONSE_KEY_PREFIX}{name}:{generation}:{digest}"
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    try:
+        return utils.redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read a cached response: {e}")
+        return None
+
+
+def set_cached_response(key: str, body: bytes):
+    try:
+        utils.redis_client.set(
+            key, body.decode(), ex=settings.JOB_RESPONSE_CACHE_TIMEOUT
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Could not cache a response: {e}")
@@ -0,0 +1,126 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+
+class SyncCheckpoint:
+    """
+    Redis-backed record of the pages a Hirebase sync has completed or failed.
+
+    A checkpoint lives from the start of a run until the run finishes with no
+    failed pages. If a worker dies mid-run, the next ``hirebase_task`` resumes
+    it: completed pages are skipped and failed pages are retried. Checkpoints
+    older than ``HIREBASE_CHECKPOINT_MAX_AGE`` hours are discarded, because
+    page contents drift as new jobs are posted.
+
+    The running sync also holds a lock (``SET NX EX``) refreshed as it
+    processes pages. Only one sync runs at a time, and a checkpoint is only
+    resumed once its owner has stopped refreshing the lock for
+    ``HIREBASE_SYNC_LOCK_TIMEOUT`` seconds.
+    """
+
+    KEY_PREFIX = "job_board:hirebase:checkpoint:"
+
+    def __init__(self, source: str = "hirebase"):
+        self.meta_key = f"{self.KEY_PREFIX}{source}:meta"
+        self.completed_key = f"{self.KEY_PREFIX}{source}:completed"
+        self.failed_key = f"{self.KEY_PREFIX}{source}:failed"
+        self.lock_key = f"{self.KEY_PREFIX}{source}:lock"
+        self.timeout = int(settings.HIREBASE_CHECKPOINT_MAX_AGE * 60 * 60)
+        self.lock_timeout = settings.HIREBASE_SYNC_LOCK_TIMEOUT
+
+    def acquire_lock(self, token: str) -> bool:
+        """Take the sync lock for ``token``; False while another sync holds it."""
+        return bool(
+            utils.redis_client.set(self.lock_key, token, nx=True, ex=self.lock_timeout)
+        )
+
+    def refresh_lock(self, token: str) -> bool:
+        """
+        Extend the lock held by ``token``, retaking it if it expired meanwhile.
+
+        Returns:
+            bool: False if another sync has taken the lock.
+        """
+        owner = utils.redis_client.get(self.lock_key)
+        if owner == token:
+            utils.redis_client.expire(self.lock_key, self.lock_timeout)
+            return True
+        if owner is None:
+            return self.acquire_lock(token)
+        return False
+
+    def release_lock(self, token: Optional[str]):
+        if token and utils.redis_client.get(self.lock_key) == token:
+            utils.redis_client.delete(self.lock_key)
+
+    def start(self, run_id: str, first_run: bool, limit: int):
+        """Discard any previous checkpoint and start recording a new run."""
+        self.clear()
+        utils.redis_client.hset(
+            self.meta_key,
+            mapping={
+                "run_id": run_id,
+                "first_run": int(first_run),
+                "limit": limit,
+                "started_at": timezone.now().isoformat(),
+            },
+        )
+        utils.redis_client.expire(self.meta_key, self.timeout)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the interrupted run's metadata, or None if there is nothing to resume.
+
+        Returns:
+            dict: ``run_id``, ``first_run``, ``limit`` and ``started_at`` of the run.
+        """
+        meta = utils.redis_client.hgetall(self.meta_key)
+        if not meta:
+            return None
+        started_at = datetime.fromisoformat(meta["started_at"])
+        if timezone.now() - started_at > timedelta(
+            hours=settings.HIREBASE_CHECKPOINT_MAX_AGE
+        ):
+            logger.info(f"Discarding stale Hirebase checkpoint from {started_at}.")
+            self.clear()
+            return None
+        return {
+            "run_id": meta["run_id"],
+            "first_run": bool(int(meta["first_run"])),
+            "limit": int(meta["limit"]),
+            "started_at": started_at,
+        }
+
+    def completed_pages(self) -> Set[int]:
+        return {int(page) for page in utils.redis_client.smembers(self.completed_key)}
+
+    def failed_pages(self) -> Dict[int, int]:
+        """Return the retry list as ``{page: failed attempts}``."""
+        return {
+            int(page): int(attempts)
+            for page, attempts in utils.redis_client.hgetall(self.failed_key).items()
+        }
+
+    def mark_completed(self, page: int):
+        pipe = utils.redis_client.pipeline()
+        pipe.sadd(self.completed_key, page)
+        pipe.hdel(self.failed_key, page)
+        pipe.expire(self.completed_key, self.timeout)
+        pipe.execute()
+
+    def mark_failed(self, page: int):
+        pipe = utils.redis_client.pipeline()
+        pipe.hincrby(self.failed_key, page, 1)
+        pipe.expire(self.failed_key, self.timeout)
+        pipe.execute()
+
+    def clear(self):
+        utils.redis_client.delete(self.meta_key, self.completed_key, self.failed_key)
@@ -0,0 +1,101 @@
+"""
+Facet counts for the ``/jobs/`` filter chips.
+
+``compute_facets`` counts in the database in one query: a ``UNION ALL`` of
+one ``GROUP BY`` per facet (``job_type``, ``location_type``, country through
+the Location table, visa, and the salary and experience buckets, grouped by a
+``CASE`` on the bucket bounds), so only ``(facet, value, count)`` rows leave
+the database. ``GROUPING SETS`` would cover the job columns on PostgreSQL, but
+not the country counts, which need the join. ``JobFacetsView`` caches the
+result per normalized filter set and dataset generation, so the counts run
+once per sync.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from django.db.models import Case, CharField, Count, F, Q, QuerySet, Value, When
+
+# Lower bounds of the salary buckets, on the annualized salary_min.
+SALARY_BUCKETS = [0, 50_000, 100_000, 150_000, 200_000]
+# Lower bounds of the years-of-experience buckets, on yoe_min.
+YOE_BUCKETS = [0, 1, 3, 5, 10]
+
+
+def _bucket(field: str, bounds: List[float]) -> Case:
+    """The index (as text) of the bucket ``field`` falls in, or NULL."""
+    whens = []
+    for index, bound in enumerate(bounds):
+        bucket = Q(**{f"{field}__gte": bound})
+        if index + 1 < len(bounds):
+            bucket &= Q(**{f"{field}__lt": bounds[index + 1]})
+        whens.append(When(bucket, then=Value(str(index))))
+    return Case(*whens, output_field=CharField())
+
+
+def _buckets(counts: Dict[str, int], bounds: List[float]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "min": bound,
+            "max": bounds[index + 1] if index + 1 < len(bounds) else None,
+            "count": counts.get(str(index), 0),
+        }
+        for index, bound in enumerate(bounds)
+    ]
+
+
+def _values(counts: Dict[Optional[str], int]) -> List[Dict[str, Any]]:
+    """Facet values, most jobs first."""
+    rows = sorted((-count, value) for value, count in counts.items() if value)
+    return [{"value": value, "count": -count} for count, value in rows]
+
+
+def compute_facets(queryset: QuerySet) -> Dict[str, Any]:
+    """
+    Count the jobs in ``queryset`` by each facet.
+
+    Returns:
+        dict: ``count`` of matching jobs and ``facets``: ``job_type``,
+        ``location_type`` and ``country`` value counts (a job in several
+        cities of one country counts once), ``visa_sponsored`` counts, and
+        ``salary`` and ``yoe`` buckets by the (annualized) minimum, each with
+        ``min``, ``max`` (None for the last) and ``count``.
+    """
+    queryset = queryset.order_by()
+    facets = {
+        "job_type": F("job_type"),
+        "location_type": F("location_type"),
+        "country": F("location_entries__country"),
+        "visa": Case(
+            When(visa_sponsored=True, then=Value("true")),
+            default=Value("false"),
+            output_field=CharField(),
+        ),
+        "salary": _bucket("salary_min", SALARY_BUCKETS),
+        "yoe": _bucket("yoe_min", YOE_BUCKETS),
+    }
+    parts = [
+        queryset.values(facet=Value(name, output_field=CharField()), value=value)
+        .annotate(count=Count("pk", distinct=name == "country"))
+        .values_list("facet", "value", "count")
+        for name, value in facets.items()
+    ]
+    counts = {name: {} for name in facets}
+    for name, value, count in parts[0].union(*parts[1:], all=True):
+        counts[name][value] = count
+
+    visa = counts["visa"].get("true", 0)
+    total = visa + counts["visa"].get("false", 0)
+    return {
+        "count": total,
+        "facets": {
+            "job_type": _values(counts["job_type"]),
+            "location_type": _values(counts["location_type"]),
+            "country": _values(counts["country"]),
+            "visa_sponsored": [
+                {"value": True, "count": visa},
+                {"value": False, "count": total - visa},
+            ],
+            "salary": _buckets(counts["salary"], SALARY_BUCKETS),
+            "yoe": _buckets(counts["yoe"], YOE_BUCKETS),
+        },
+    }
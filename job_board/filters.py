@@ -0,0 +1,79 @@
+"""
+The ``/jobs/`` query filters, shared by the listing and facet endpoints.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Mapping, Optional
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .locations import filter_by_location
+from .search import search_jobs
+
+JOB_POSTED_WINDOWS = {
+    "last_24_hour": timezone.timedelta(hours=24),
+    "last_3_days": timezone.timedelta(days=3),
+    "last_7_days": timezone.timedelta(days=7),
+}
+# Relative job_posted cutoffs move in steps of this size, so a listing with a
+# job_posted filter (and its cache entries and ETag) changes once per step.
+JOB_POSTED_STEP = timezone.timedelta(hours=1)
+RANGE_FILTERS = {
+    "salary_min": "salary_min__gte",
+    "salary_max": "salary_max__lte",
+    "yoe_min": "yoe_min__gte",
+    "yoe_max": "yoe_max__lte",
+}
+
+
+def job_posted_step(now: Optional[datetime] = None) -> int:
+    """Number of the ``JOB_POSTED_STEP`` that ``now`` (default: now) falls in."""
+    now = now or timezone.now()
+    return int(now.timestamp() // JOB_POSTED_STEP.total_seconds())
+
+
+def job_posted_cutoff(window: timedelta, now: Optional[datetime] = None) -> datetime:
+    """
+    Oldest ``date_posted`` within ``window``, counted from the start of the
+    current ``JOB_POSTED_STEP``.
+    """
+    start = datetime.fromtimestamp(
+        job_posted_step(now) * JOB_POSTED_STEP.total_seconds(), tz=dt_timezone.utc
+    )
+    return start - window
+
+
+def filter_jobs(
+    queryset: QuerySet, params: Mapping[str, str], relevance: bool = False
+) -> QuerySet:
+    """
+    Apply the ``/jobs/`` filters in ``params`` to ``queryset``.
+
+    Filters with empty or invalid values are ignored. See ``JobListView`` for
+    the parameters; ``relevance`` orders ``q`` matches by search rank.
+    """
+    q = (params.get("q") or "").strip()
+    if q:
+        queryset = search_jobs(queryset, q, relevance=relevance)
+    # Expecting format: city,country,region (any can be omitted)
+    queryset = filter_by_location(queryset, params.get("location"))
+    job_type = params.get("job_type")
+    if job_type:
+        queryset = queryset.filter(job_type__icontains=job_type)
+    location_type = params.get("location_type")
+    if location_type:
+        queryset = queryset.filter(location_type__icontains=location_type)
+    window = JOB_POSTED_WINDOWS.get(params.get("job_posted"))
+    if window:
+        queryset = queryset.filter(date_posted__gte=job_posted_cutoff(window))
+    # Range filters on the typed columns (see job_board.ranges): the job's
+    # minimum must be at least the *_min value, its maximum at most *_max.
+    for param, lookup in RANGE_FILTERS.items():
+        value = params.get(param)
+        if value is not None:
+            try:
+                queryset = queryset.filter(**{lookup: float(value)})
+            except ValueError:
+                pass
+    return queryset
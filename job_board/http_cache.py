@@ -0,0 +1,115 @@
+"""
+HTTP caching headers for the read endpoints, for browsers and the CDN.
+
+Listing responses only change when jobs are written or deleted, which bumps
+the dataset generation (see job_board.cache). ``generation_etag`` derives a
+weak ETag from it, so revalidations get a 304 without touching the
+database, and ``GenerationCacheMixin`` adds ``Cache-Control`` and a
+``Surrogate-Key`` header naming what the response depends on:
+
+- ``jobs``: every job listing; ``locations``: the location endpoints.
+- ``jobs:country:<slug>`` (also ``city``/``region``): listings filtered to a
+  location. A job can only appear in them if it has that location.
+- ``jobs:unscoped``: listings without a location filter, which any job can
+  appear in.
+
+When a sync or cleanup finishes, ``job_surrogate_keys`` maps the jobs it
+wrote or deleted to the keys of the listings they can appear in, which are
+then purged (see job_board.purge).
+"""
+
+import hashlib
+import logging
+from typing import Iterable, List, Optional
+
+import redis
+from django.conf import settings
+from django.utils.text import slugify
+
+from .cache import dataset_generation
+from .filters import JOB_POSTED_WINDOWS, job_posted_step
+
+logger = logging.getLogger(__name__)
+
+LOCATION_PARTS = ["city", "country", "region"]
+# Past this many keys a purge falls back to every listing.
+MAX_PURGE_KEYS = 256
+
+
+def location_key(part: str, value: str) -> str:
+    """Surrogate key of listings filtered to ``value`` for a location ``part``."""
+    return f"jobs:{part}:{slugify(value, allow_unicode=True)}"
+
+
+def listing_surrogate_keys(location: Optional[str]) -> List[str]:
+    """Surrogate keys for a ``/jobs/`` response with the given location filter."""
+    parts = [part.strip() for part in (location or "").split(",")][:3]
+    keys = [
+        location_key(name, value) for name, value in zip(LOCATION_PARTS, parts) if value
+    ]
+    return ["jobs"] + (keys or ["jobs:unscoped"])
+
+
+def job_surrogate_keys(job_locations: Iterable[Optional[list]]) -> List[str]:
+    """
+    Keys to purge after jobs with ``job_locations`` were written or deleted.
+
+    Returns no keys for no jobs, and just ``jobs`` when a finer purge would
+    take more than ``MAX_PURGE_KEYS`` keys.
+    """
+    keys = set()
+    for locations in job_locations:
+        keys.update(["jobs:unscoped", "locations"])
+        for location in locations or []:
+            for part in LOCATION_PARTS:
+                value = (location.get(part) or "").strip()
+                if value:
+                    keys.add(location_key(part, value))
+    if len(keys) > MAX_PURGE_KEYS:
+        return ["jobs", "locations"]
+    return sorted(keys)
+
+
+def generation_etag(request, *args, **kwargs) -> Optional[str]:
+    """
+    Weak ETag for a response to ``request`` in the current dataset generation
+    (and ``job_posted_step``, for a ``job_posted`` filter).
+
+    ``condition(etag_func=...)`` callback; returns None (no ETag, no 304s)
+    when Redis is unavailable.
+    """
+    try:
+        generation = dataset_generation()
+    except redis.RedisError as e:
+        logger.warning(f"Could not read the dataset generation: {e}")
+        return None
+    variant = f"{request.get_full_path()}|{getattr(request, 'accepted_media_type', '')}"
+    digest = hashlib.sha1(variant.encode()).hexdigest()[:16]
+    if request.GET.get("job_posted") in JOB_POSTED_WINDOWS:
+        # The job_posted cutoff moves on without a new generation.
+        return f'W/"g{generation}-t{job_posted_step()}-{digest}"'
+    return f'W/"g{generation}-{digest}"'
+
+
+class GenerationCacheMixin:
+    """
+    Add ``Cache-Control`` and ``Surrogate-Key`` to successful GET responses.
+
+    Views decorate ``get`` with ``condition(etag_func=generation_etag)`` for
+    the ETag and 304s, and override ``get_surrogate_keys``.
+    """
+
+    def get_surrogate_keys(self) -> List[str]:
+        return []
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method in ("GET", "HEAD") and response.status_code in (200, 304):
+            response["Cache-Control"] = (
+                f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+                f"s-maxage={settings.HTTP_CACHE_S_MAXAGE}"
+            )
+            keys = self.get_surrogate_keys()
+            if keys:
+                response["Surrogate-Key"] = " ".join(keys)
+        return response
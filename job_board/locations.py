@@ -0,0 +1,162 @@
+"""
+The normalized ``Location`` table behind the location filters and endpoints.
+
+Each job's ``locations`` JSON is mirrored as links to ``Location`` rows, one
+per distinct (city, country, region). ``sync_job_locations`` runs after every
+ingestion batch (and on ``Job.save()``), so the ``/jobs/`` location filter is
+an indexed lookup on a few thousand locations joined to the link table, and
+``/locations/`` and ``/location-field/`` read the locations instead of every
+job. ``prune_locations`` drops locations no job links to any more.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+
+from .models import Job, Location
+
+LOCATION_PARTS = ["city", "country", "region"]
+
+LocationParts = Tuple[str, str, str]
+JobLink = Location.jobs.through
+
+
+def location_parts(location) -> Optional[LocationParts]:
+    """The trimmed ``(city, country, region)`` of a location dict, if any part is set."""
+    if not isinstance(location, dict):
+        return None
+    parts = []
+    for name in LOCATION_PARTS:
+        value = location.get(name)
+        parts.append(value.strip()[:255] if isinstance(value, str) else "")
+    return tuple(parts) if any(parts) else None
+
+
+def parse_location_filter(value: Optional[str]) -> Dict[str, str]:
+    """The parts named by a ``city,country,region`` filter (any can be omitted)."""
+    parts = [part.strip() for part in (value or "").split(",")][:3]
+    return {name: part for name, part in zip(LOCATION_PARTS, parts) if part}
+
+
+def filter_by_location(queryset: QuerySet, value: Optional[str]) -> QuerySet:
+    """Restrict ``queryset`` to jobs with a location matching the ``location`` filter."""
+    parts = parse_location_filter(value)
+    if not parts:
+        return queryset
+    # Matching locations -> their links -> jobs by primary key, so neither the
+    # jobs nor the links are scanned.
+    links = JobLink.objects.filter(
+        location_id__in=Location.objects.filter(**parts).values("pk")
+    )
+    return queryset.filter(pk__in=links.values("job_id"))
+
+
+def _has_jobs() -> Exists:
+    return Exists(JobLink.objects.filter(location_id=OuterRef("pk")))
+
+
+def linked_locations() -> QuerySet:
+    """Locations at least one job links to."""
+    return Location.objects.filter(_has_jobs())
+
+
+def _location_ids(
+    parts: Iterable[LocationParts], location_model=Location
+) -> Dict[LocationParts, int]:
+    """IDs of the locations with ``parts``, creating the missing ones."""
+    parts = set(parts)
+    if not parts:
+        return {}
+    location_model.objects.bulk_create(
+        [
+            location_model(city=city, country=country, region=region)
+            for city, country, region in parts
+        ],
+        ignore_conflicts=True,
+    )
+    rows = location_model.objects.filter(
+        city__in={city for city, _, _ in parts},
+        country__in={country for _, country, _ in parts},
+    ).values_list("city", "country", "region", "pk")
+    return {
+        (city, country, region): pk
+        for city, country, region, pk in rows
+        if (city, country, region) in parts
+    }
+
+
+def sync_job_locations(
+    job_locations: Mapping[str, Optional[list]], location_model=Location
+):
+    """
+    Replace the location links of each job ID in ``job_locations`` with the
+    locations in its ``locations`` JSON.
+    """
+    if not job_locations:
+        return
+    link_model = location_model.jobs.through
+    wanted = {
+        job_id: {
+            parts for parts in map(location_parts, locations or []) if parts is not None
+        }
+        for job_id, locations in job_locations.items()
+    }
+    with transaction.atomic():
+        ids = _location_ids(
+            (parts for found in wanted.values() for parts in found), location_model
+        )
+        link_model.objects.filter(job_id__in=list(wanted)).delete()
+        link_model.objects.bulk_create(
+            [
+                link_model(job_id=job_id, location_id=ids[parts])
+                for job_id, found in wanted.items()
+                for parts in found
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def sync_saved_job_locations(sender, instance: Job, update_fields=None, **kwargs):
+    """``post_save`` hook: keep a saved job's location links current."""
+    if update_fields is not None and "locations" not in update_fields:
+        return
+    sync_job_locations({instance._id: instance.locations})
+
+
+def backfill_job_locations(
+    batch_size: int = 500, job_model=Job, location_model=Location
+) -> int:
+    """
+    Rebuild the location links of every job from its ``locations`` JSON.
+
+    Args:
+        batch_size: Jobs read and synced per batch.
+        job_model, location_model: The models to use (migrations pass their
+            historical ones).
+
+    Returns:
+        int: Number of jobs synced.
+    """
+    synced = 0
+    last_id = None
+    queryset = job_model.objects.order_by("_id").values_list("_id", "locations")
+    while True:
+        batch = queryset if last_id is None else queryset.filter(_id__gt=last_id)
+        rows: List[Tuple[str, Optional[list]]] = list(batch[:batch_size])
+        if not rows:
+            return synced
+        sync_job_locations(dict(rows), location_model)
+        synced += len(rows)
+        last_id = rows[-1][0]
+
+
+def prune_locations() -> int:
+    """
+    Delete locations no job links to.
+
+    Returns:
+        int: Number of locations deleted.
+    """
+    deleted, _ = Location.objects.filter(~_has_jobs()).delete()
+    return deleted
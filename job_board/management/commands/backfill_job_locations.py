@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from job_board.locations import backfill_job_locations, prune_locations
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the Location table and job location links from every job's "
+        "locations JSON (after migrating), then prune unused locations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        synced = backfill_job_locations(batch_size=options["batch_size"])
+        pruned = prune_locations()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced the locations of {synced} jobs; pruned {pruned} locations."
+            )
+        )
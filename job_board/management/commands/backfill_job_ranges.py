@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from job_board.ranges import backfill_range_columns
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the typed salary and experience columns of every job from its "
+        "salary_range and yoe_range (after migrating, or changing job_board.ranges)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        updated = backfill_range_columns(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated salary and experience columns of {updated} jobs."
+            )
+        )
@@ -0,0 +1,108 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand
+from job_board.dates import _parse_cached, legacy_parse_datetime, parse_datetime
+
+# Shapes of ``date_posted`` seen in Hirebase payloads, with rough weights.
+SAMPLE_FORMATS = [
+    (lambda ts: ts.strftime("%Y-%m-%dT%H:%M:%S"), 40),
+    (lambda ts: ts.strftime("%Y-%m-%dT%H:%M:%S.%f"), 25),
+    (lambda ts: ts.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z", 15),
+    (lambda ts: ts.strftime("%Y-%m-%dT%H:%M:%SZ"), 10),
+    (lambda ts: ts.strftime("%Y-%m-%dT%H:%M:%S+00:00"), 5),
+    (lambda ts: ts.strftime("%Y-%m-%d %H:%M:%S"), 4),
+    (lambda ts: ts.strftime("%Y-%m-%d"), 1),
+]
+
+
+def sample_timestamps(count, distinct, seed=0):
+    """Build ``count`` timestamps drawn from ``distinct`` values, newest first."""
+    rng = random.Random(seed)
+    now = datetime.now(dt_timezone.utc).replace(microsecond=0)
+    formats, weights = zip(*SAMPLE_FORMATS)
+    pool = []
+    for index in range(distinct):
+        posted = now - timedelta(
+            minutes=5 * index, microseconds=rng.randrange(1_000_000)
+        )
+        pool.append(rng.choices(formats, weights)[0](posted))
+    # Jobs arrive sorted by date_posted, so repeats cluster together.
+    return sorted((rng.choice(pool) for _ in range(count)), reverse=True)
+
+
+class Command(BaseCommand):
+    help = "Compare the ingestion datetime parser with the legacy strptime parser."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=100_000,
+            help="Timestamps parsed per run (default: 100000).",
+        )
+        parser.add_argument(
+            "--distinct",
+            type=int,
+            default=5_000,
+            help="Distinct timestamp strings in the sample (default: 5000).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per parser; the fastest is reported (default: 3).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def _time(self, parse, sample, repeat, before_run=None):
+        best = None
+        for _ in range(repeat):
+            if before_run:
+                before_run()
+            started = time.perf_counter()
+            for value in sample:
+                parse(value)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def handle(self, *args, **options):
+        sample = sample_timestamps(
+            options["samples"], options["distinct"], options["seed"]
+        )
+        repeat = max(1, options["repeat"])
+
+        legacy = self._time(legacy_parse_datetime, sample, repeat)
+        cold = self._time(parse_datetime, sample, repeat, _parse_cached.cache_clear)
+        uncached = self._time(_parse_cached.__wrapped__, sample, repeat)
+
+        legacy_failures = sum(
+            1 for value in sample if legacy_parse_datetime(value) is None
+        )
+        failures = sum(1 for value in sample if parse_datetime(value) is None)
+        mismatches = sum(
+            1
+            for value in set(sample)
+            if legacy_parse_datetime(value) is not None
+            and legacy_parse_datetime(value) != parse_datetime(value)
+        )
+
+        self.stdout.write(
+            f"{len(sample)} timestamps, {len(set(sample))} distinct, best of {repeat} runs"
+        )
+        for label, seconds in [
+            ("legacy strptime", legacy),
+            ("fast, no cache", uncached),
+            ("fast, cold cache", cold),
+        ]:
+            per_call = seconds / len(sample) * 1e9 if sample else 0
+            self.stdout.write(
+                f"  {label:<17} {seconds * 1000:9.1f} ms  {per_call:7.0f} ns/call  "
+                f"{legacy / seconds if seconds else 0:5.1f}x"
+            )
+        self.stdout.write(
+            f"Unparsed: legacy {legacy_failures}, fast {failures}; "
+            f"results differing where legacy parses: {mismatches}"
+        )
@@ -0,0 +1,190 @@
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from job_board import utils
+from job_board.cache import bump_dataset_generation
+from job_board.checkpoint import SyncCheckpoint
+from job_board.locations import prune_locations
+from job_board.models import Job, SyncState
+from job_board.standin import load_fixture_jobs, start_standin_server, synthetic_jobs
+from job_board.tasks import HIREBASE_SOURCE, hirebase_task
+
+
+class Command(BaseCommand):
+    help = (
+        "Run hirebase_task end to end against an in-process Hirebase stand-in and "
+        "report pages/sec, rows/sec and fetch vs. database time. Writes to the "
+        "configured database; use a development database. Refuses to overwrite "
+        "jobs already in the database unless --force is given. Only jobs the "
+        "run created are deleted afterwards, CDN purges are only logged, the "
+        "suggestion index is not rebuilt and no sync telemetry is recorded."
+    )
+    # IDs per query, below SQLite's bound-parameter limit.
+    ID_BATCH_SIZE = 500
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            choices=["serial", "pipelined"],
+            default="serial",
+            help="Ingestion mode. Parallel mode needs Celery workers, so benchmark "
+            "it against a hirebase_standin server instead.",
+        )
+        parser.add_argument(
+            "--fixtures",
+            help="Directory of fixtures written by record_hirebase_fixtures.",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=2000,
+            help="Number of synthetic jobs to serve when --fixtures is not given.",
+        )
+        parser.add_argument("--latency-ms", type=float, default=200)
+        parser.add_argument("--jitter-ms", type=float, default=50)
+        parser.add_argument("--error-rate", type=float, default=0)
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=2,
+            help="Number of runs; later runs measure re-syncing unchanged data.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the ingested jobs instead of deleting them afterwards.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Run even if served jobs are already in the database; they are "
+            "overwritten with the served data and kept.",
+        )
+
+    def handle(self, *args, **options):
+        if SyncCheckpoint().load():
+            raise CommandError(
+                "An interrupted Hirebase sync is waiting to resume; clear it with "
+                "`hirebase_sync_state --clear-checkpoint` before benchmarking."
+            )
+        if options["fixtures"]:
+            jobs = load_fixture_jobs(options["fixtures"])
+        else:
+            jobs = synthetic_jobs(options["jobs"])
+        if not jobs:
+            raise CommandError("No jobs to serve.")
+        job_ids = {job.get("_id") or job.get("id") for job in jobs} - {None}
+        existing_ids = self._existing_ids(job_ids)
+        if existing_ids and not options["force"]:
+            raise CommandError(
+                f"{len(existing_ids)} of the served jobs are already in the database "
+                "and would be overwritten with the served data; use a development "
+                "database or pass --force."
+            )
+        if existing_ids:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(existing_ids)} of the served jobs are already in the "
+                    "database; the benchmark overwrites them and keeps them."
+                )
+            )
+
+        server = start_standin_server(
+            jobs,
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+            error_rate=options["error_rate"],
+        )
+        saved_env = {
+            key: os.environ.get(key) for key in ("JOB_API_ENDPOINT", "JOB_API_KEY")
+        }
+        saved_state = SyncState.objects.filter(source=HIREBASE_SOURCE).first()
+        os.environ["JOB_API_ENDPOINT"] = server.url
+        os.environ["JOB_API_KEY"] = "benchmark"
+        utils._client = None
+        self.stdout.write(
+            f"Serving {len(jobs)} jobs at {server.url} "
+            f"({options['latency_ms']}ms +{options['jitter_ms']}ms latency, "
+            f"{options['error_rate']:.0%} errors); mode {options['mode']}."
+        )
+        # Never purge the configured CDN for benchmark rows.
+        purge_settings = override_settings(
+            SURROGATE_PURGE_BACKEND="job_board.purge.LoggingPurgeBackend"
+        )
+        purge_settings.enable()
+        try:
+            for run in range(1, options["runs"] + 1):
+                started = time.monotonic()
+                summary = hirebase_task(
+                    first_run=True,
+                    mode=options["mode"],
+                    refresh_derived=False,
+                    record_telemetry=False,
+                )
+                wall = time.monotonic() - started
+                if not summary:
+                    raise CommandError("hirebase_task failed; see the logs.")
+                self._report(run, summary, wall)
+        finally:
+            purge_settings.disable()
+            server.shutdown()
+            server.server_close()
+            utils._client = None
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            SyncState.objects.filter(source=HIREBASE_SOURCE).delete()
+            if saved_state:
+                saved_state.save()
+            if not options["keep"]:
+                created_ids = list(job_ids - existing_ids)
+                for start in range(0, len(created_ids), self.ID_BATCH_SIZE):
+                    batch = created_ids[start : start + self.ID_BATCH_SIZE]
+                    Job.objects.filter(_id__in=batch).delete()
+                prune_locations()
+            # Cached listings may have seen the benchmark's rows.
+            bump_dataset_generation()
+
+    def _existing_ids(self, job_ids):
+        """The subset of ``job_ids`` already in the database before the run."""
+        job_ids = list(job_ids)
+        existing = set()
+        for start in range(0, len(job_ids), self.ID_BATCH_SIZE):
+            batch = job_ids[start : start + self.ID_BATCH_SIZE]
+            existing.update(
+                Job.objects.filter(_id__in=batch).values_list("_id", flat=True)
+            )
+        return existing
+
+    def _report(self, run, summary, wall):
+        rows = (
+            summary["created"]
+            + summary["changed"]
+            + summary["unchanged"]
+            + summary["failed"]
+        )
+        pages = summary["pages"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Run {run}: {pages} pages, {rows} rows in {wall:.2f}s -> "
+                f"{pages / wall:.2f} pages/sec, {rows / wall:.1f} rows/sec"
+            )
+        )
+        self.stdout.write(
+            f"  created {summary['created']}, changed {summary['changed']}, "
+            f"unchanged {summary['unchanged']}, failed {summary['failed']}"
+        )
+        accounted = (
+            summary["fetch_seconds"]
+            + summary["parse_seconds"]
+            + summary["write_seconds"]
+        )
+        self.stdout.write(
+            f"  fetch {summary['fetch_seconds']:.2f}s, parse {summary['parse_seconds']:.2f}s, "
+            f"database {summary['write_seconds']:.2f}s, "
+            f"other {max(0.0, wall - accounted):.2f}s"
+        )
+        self.stdout.write(f"  client: {utils.get_hirebase_client().stats.snapshot()}")
@@ -0,0 +1,109 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from job_board.models import Job
+from job_board.rendering import (
+    FragmentJSONRenderer,
+    render_job_json,
+    render_jobs_array,
+)
+from job_board.serializers import JobListSerializer
+from job_board.standin import synthetic_jobs
+from job_board.tasks import get_job_id, job_defaults
+
+
+def envelope(results):
+    """A /jobs/ response body around ``results``; the pagination is representative."""
+    return {
+        "pagination": {
+            "count": 12345,
+            "count_exact": True,
+            "page": 2,
+            "limit": 10,
+            "next": "http://localhost:8000/jobs/?page=3",
+            "previous": "http://localhost:8000/jobs/",
+            "total_pages": 1235,
+        },
+        "results": results,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rendering /jobs/ pages by serializing every job with "
+        "JobListSerializer against joining pre-rendered JSON. Uses synthetic "
+        "jobs in memory; nothing is written to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-sizes",
+            default="10,100",
+            help="Comma-separated page sizes to time (default: 10,100).",
+        )
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=200,
+            help="Pages rendered per run (default: 200).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per path; the fastest is reported (default: 3).",
+        )
+
+    def _time(self, render, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            render()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def handle(self, *args, **options):
+        page_sizes = [int(size) for size in options["page_sizes"].split(",")]
+        pages, repeat = options["pages"], max(1, options["repeat"])
+        jobs = []
+        for job_data in synthetic_jobs(max(page_sizes)):
+            job = Job(_id=get_job_id(job_data), **job_defaults(job_data))
+            job.rendered_json = render_job_json(job)
+            jobs.append(job)
+
+        serializer_renderer = JSONRenderer()
+        fragment_renderer = FragmentJSONRenderer()
+        self.stdout.write(f"{pages} pages per run, best of {repeat} runs")
+        for size in page_sizes:
+            page = jobs[:size]
+
+            def serialize():
+                for _ in range(pages):
+                    data = JobListSerializer(page, many=True).data
+                    serializer_renderer.render(envelope(data))
+
+            def join():
+                for _ in range(pages):
+                    fragment_renderer.render(envelope(render_jobs_array(page)))
+
+            serialized = self._time(serialize, repeat)
+            joined = self._time(join, repeat)
+            expected = serializer_renderer.render(
+                envelope(JobListSerializer(page, many=True).data)
+            )
+            same = expected == fragment_renderer.render(
+                envelope(render_jobs_array(page))
+            )
+            self.stdout.write(f"  page size {size}:")
+            for label, seconds in [
+                ("serializer", serialized),
+                ("pre-rendered", joined),
+            ]:
+                self.stdout.write(
+                    f"    {label:<13} {seconds * 1000:9.1f} ms  "
+                    f"{seconds / pages * 1e6:8.0f} us/page  "
+                    f"{serialized / seconds if seconds else 0:6.1f}x"
+                )
+            self.stdout.write(f"    byte-identical output: {'yes' if same else 'NO'}")
@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand, CommandError
+from job_board.standin import (
+    HirebaseStandinServer,
+    load_fixture_jobs,
+    synthetic_jobs,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local stand-in for the Hirebase API that serves recorded fixtures "
+        "or synthetic jobs with configurable latency and error rates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--fixtures",
+            help="Directory of fixtures written by record_hirebase_fixtures.",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=5000,
+            help="Number of synthetic jobs to serve when --fixtures is not given.",
+        )
+        parser.add_argument("--latency-ms", type=float, default=0)
+        parser.add_argument("--jitter-ms", type=float, default=0)
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0,
+            help="Fraction of requests answered with a 503 (0-1).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options["fixtures"]:
+            jobs = load_fixture_jobs(options["fixtures"])
+            if not jobs:
+                raise CommandError(f"No fixtures found in {options['fixtures']}.")
+        else:
+            jobs = synthetic_jobs(options["jobs"], seed=options["seed"])
+
+        server = HirebaseStandinServer(
+            (options["host"], options["port"]),
+            jobs,
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+            error_rate=options["error_rate"],
+            seed=options["seed"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Serving {len(jobs)} jobs at {server.url}. "
+                f"Point JOB_API_ENDPOINT there (any JOB_API_KEY works). Ctrl+C to stop."
+            )
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
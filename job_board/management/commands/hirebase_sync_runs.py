@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand
+from job_board.telemetry import IngestionMetrics
+
+
+class Command(BaseCommand):
+    help = "Print the most recent Hirebase sync runs with their timings and row counts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-n",
+            "--runs",
+            type=int,
+            default=10,
+            help="Number of runs to show, newest first (default: 10).",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the raw run summaries as JSON."
+        )
+
+    def handle(self, *args, **options):
+        runs = IngestionMetrics().recent_runs(options["runs"])
+        if options["json"]:
+            self.stdout.write(json.dumps(runs, indent=2))
+            return
+        if not runs:
+            self.stdout.write("No Hirebase sync runs recorded yet.")
+            return
+
+        self.stdout.write(
+            f"{'finished':<20} {'mode':<9} {'status':<10} {'pages':>5} {'secs':>8} "
+            f"{'rows/s':>8} {'fetch':>7} {'parse':>7} {'write':>7} "
+            f"{'created':>7} {'changed':>7} {'unchgd':>7} {'failed':>6}"
+        )
+        for run in runs:
+            status = run["status"] + ("*" if run["first_run"] else "")
+            line = (
+                f"{run['finished_at'][:19]:<20} {run['mode']:<9} {status:<10} "
+                f"{run['pages']:>5} {run['duration_seconds']:>8.1f} "
+                f"{run['rows_per_second']:>8.1f} {run['fetch_seconds']:>7.1f} "
+                f"{run['parse_seconds']:>7.1f} {run['write_seconds']:>7.1f} "
+                f"{run['created']:>7} {run['changed']:>7} {run['unchanged']:>7} "
+                f"{run['failed']:>6}"
+            )
+            if run["status"] == "complete":
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.WARNING(line))
+            if run["failed_pages"]:
+                self.stdout.write(f"    pages not fetched: {run['failed_pages']}")
+        self.stdout.write("* full resync (first_run)")
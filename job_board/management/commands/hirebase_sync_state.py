@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from job_board.checkpoint import SyncCheckpoint
+from job_board.models import SyncState
+from job_board.tasks import HIREBASE_SOURCE
+
+
+class Command(BaseCommand):
+    help = "Show (or reset) the Hirebase sync watermark and any interrupted-run checkpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Clear the watermark so the next run syncs until the usual stop rules.",
+        )
+        parser.add_argument(
+            "--clear-checkpoint",
+            action="store_true",
+            help="Forget the interrupted run so the next run starts from page 1.",
+        )
+
+    def handle(self, *args, **options):
+        if options["clear_checkpoint"]:
+            SyncCheckpoint().clear()
+            self.stdout.write(self.style.SUCCESS("Hirebase sync checkpoint cleared."))
+            return
+        if options["reset"]:
+            SyncState.objects.filter(source=HIREBASE_SOURCE).delete()
+            self.stdout.write(self.style.SUCCESS("Hirebase sync watermark cleared."))
+            return
+
+        state = SyncState.objects.filter(source=HIREBASE_SOURCE).first()
+        if not state:
+            self.stdout.write("No Hirebase sync has completed yet.")
+        else:
+            self.stdout.write(f"High-water date_posted: {state.high_water_date_posted}")
+            self.stdout.write(f"Boundary job IDs ({len(state.boundary_ids)}):")
+            for job_id in state.boundary_ids:
+                self.stdout.write(f"  {job_id}")
+            self.stdout.write(f"Last successful sync: {state.last_success_at}")
+
+        checkpoint = SyncCheckpoint()
+        run = checkpoint.load()
+        if not run:
+            self.stdout.write("No interrupted run to resume.")
+            return
+        failed_pages = checkpoint.failed_pages()
+        self.stdout.write(
+            f"Interrupted run {run['run_id']} started at {run['started_at']} "
+            f"({'full resync' if run['first_run'] else 'incremental'}, limit {run['limit']}):"
+        )
+        self.stdout.write(f"  Completed pages: {len(checkpoint.completed_pages())}")
+        self.stdout.write(
+            f"  Retry list: {', '.join(f'{page} ({attempts} failures)' for page, attempts in sorted(failed_pages.items())) or 'empty'}"
+        )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from job_board.search import install_search_index, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the job full-text search index from the jobs table "
+        "(e.g. after restoring a SQLite backup)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        with transaction.atomic(using=options["database"]):
+            # Also restores missing SQLite triggers; a no-op when they exist.
+            install_search_index(connection)
+            indexed = rebuild_search_index(connection)
+        if indexed is None:
+            self.stdout.write(
+                self.style.WARNING("This database has no full-text search index.")
+            )
+            return
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt: {indexed} jobs."))
@@ -0,0 +1,35 @@
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from job_board.standin import write_fixture
+from job_board.utils import get_hirebase_client
+
+
+class Command(BaseCommand):
+    help = (
+        "Record Hirebase API responses as gzip-compressed fixtures for the "
+        "hirebase_standin server and ingestion benchmarks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Directory to write fixtures to.")
+        parser.add_argument("--pages", type=int, default=10)
+        parser.add_argument("--limit", type=int, default=100)
+
+    def handle(self, *args, **options):
+        output = Path(options["output"])
+        client = get_hirebase_client()
+        jobs = 0
+        for page in range(1, options["pages"] + 1):
+            data = client.fetch_jobs(page, options["limit"])
+            if data is None:
+                raise CommandError(f"Could not fetch page {page}; see the logs.")
+            path = write_fixture(output, page, data)
+            jobs += len(data.get("jobs", []))
+            self.stdout.write(f"Recorded page {page} to {path}")
+            if page >= (data.get("total_pages") or 0):
+                break
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recorded {jobs} jobs to {output}. Client stats: {client.stats.snapshot()}"
+            )
+        )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from job_board.rendering import rerender_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-render the pre-rendered listing JSON of every job (after changing "
+        "JobListSerializer), or backfill jobs that have none."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only render jobs without pre-rendered JSON.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        rendered = rerender_jobs(
+            missing_only=options["missing"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rendered listing JSON for {rendered} jobs.")
+        )
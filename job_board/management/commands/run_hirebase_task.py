@@ -5,8 +5,29 @@ from job_board.tasks import hirebase_task
 class Command(BaseCommand):
     help = "Enqueue the hirebase_task Celery task to fetch jobs from Hirebase API."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Stop at the stored sync watermark instead of running a full resync.",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["serial", "pipelined", "parallel"],
+            help="Ingestion mode (defaults to HIREBASE_INGESTION_MODE).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Pages in flight at once in parallel mode (defaults to HIREBASE_CONCURRENCY).",
+        )
+
     def handle(self, *args, **options):
-        result = hirebase_task.delay(first_run=True)
+        result = hirebase_task.delay(
+            first_run=not options["incremental"],
+            mode=options["mode"],
+            concurrency=options["concurrency"],
+        )
         self.stdout.write(
             self.style.SUCCESS(f"hirebase_task enqueued! Task ID: {result.id}")
         )
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("job_board", "0007_job_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncState",
+            fields=[
+                (
+                    "source",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("high_water_date_posted", models.DateTimeField(blank=True, null=True)),
+                ("boundary_ids", models.JSONField(blank=True, default=list)),
+                ("last_success_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:04
+
+from django.db import migrations, models
+
+# PostgreSQL-only indexes for the JobListView filters. Each matches the SQL the
+# ORM emits for its lookup:
+#   locations__contains          -> "locations" @> '[...]'
+#   <field>__icontains           -> UPPER("<field>"::text) LIKE UPPER('%...%')
+#   salary_range__min/max__gte   -> ("salary_range" -> 'min') >= '...'
+POSTGRES_INDEXES = [
+    (
+        "job_locations_gin_idx",
+        "USING gin (locations jsonb_path_ops)",
+    ),
+    (
+        "job_job_type_trgm_idx",
+        "USING gin ((UPPER(job_type::text)) gin_trgm_ops)",
+    ),
+    (
+        "job_location_type_trgm_idx",
+        "USING gin ((UPPER(location_type::text)) gin_trgm_ops)",
+    ),
+    (
+        "job_job_title_trgm_idx",
+        "USING gin ((UPPER(job_title::text)) gin_trgm_ops)",
+    ),
+    (
+        "job_company_name_trgm_idx",
+        "USING gin ((UPPER(company_name::text)) gin_trgm_ops)",
+    ),
+    (
+        "job_salary_min_idx",
+        "((salary_range -> 'min'))",
+    ),
+    (
+        "job_salary_max_idx",
+        "((salary_range -> 'max'))",
+    ),
+]
+
+
+def create_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, definition in POSTGRES_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON job_board_job {definition}"
+        )
+
+
+def drop_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _ in POSTGRES_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_board", "0008_syncstate"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["-date_posted", "_id"], name="job_date_posted_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["created_at"], name="job_created_at_idx"),
+        ),
+        migrations.RunPython(create_postgres_indexes, drop_postgres_indexes),
+    ]
@@ -0,0 +1,126 @@
+from django.db import migrations
+
+# Frozen copies of the SQL in job_board.search as of this migration, so later
+# changes there don't change what this migration does.
+# The q filter no longer uses icontains, so the trigram indexes that served it
+# (migration 0009) give way to the search_vector index.
+TITLE_TRIGRAM_INDEXES = [
+    ("job_job_title_trgm_idx", "USING gin ((UPPER(job_title::text)) gin_trgm_ops)"),
+    (
+        "job_company_name_trgm_idx",
+        "USING gin ((UPPER(company_name::text)) gin_trgm_ops)",
+    ),
+]
+POSTGRES_INSTALL = [
+    "ALTER TABLE job_board_job ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(job_title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(company_name, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS job_search_vector_idx "
+    "ON job_board_job USING gin (search_vector)",
+    *(f"DROP INDEX IF EXISTS {name}" for name, _ in TITLE_TRIGRAM_INDEXES),
+]
+POSTGRES_UNINSTALL = [
+    *(
+        f"CREATE INDEX IF NOT EXISTS {name} ON job_board_job {definition}"
+        for name, definition in TITLE_TRIGRAM_INDEXES
+    ),
+    "DROP INDEX IF EXISTS job_search_vector_idx",
+    "ALTER TABLE job_board_job DROP COLUMN IF EXISTS search_vector",
+]
+SQLITE_INSTALL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS job_board_job_fts USING fts5("
+    "_id UNINDEXED, job_title, company_name, "
+    "tokenize = 'unicode61 remove_diacritics 2')",
+    # FTS rows are keyed on the job's _id, not job_board_job's rowid, which
+    # VACUUM and table rebuilds renumber.
+    "CREATE TABLE IF NOT EXISTS job_board_job_fts_ids ("
+    "rowid INTEGER PRIMARY KEY, _id varchar(255) NOT NULL UNIQUE)",
+    """
+    CREATE TRIGGER IF NOT EXISTS job_board_job_fts_ai AFTER INSERT ON job_board_job BEGIN
+        INSERT INTO job_board_job_fts_ids(_id) VALUES (new._id);
+        INSERT INTO job_board_job_fts(rowid, _id, job_title, company_name)
+        VALUES (
+            (SELECT rowid FROM job_board_job_fts_ids WHERE _id = new._id),
+            new._id, new.job_title, new.company_name
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_board_job_fts_ad AFTER DELETE ON job_board_job BEGIN
+        DELETE FROM job_board_job_fts
+        WHERE rowid = (SELECT rowid FROM job_board_job_fts_ids WHERE _id = old._id);
+        DELETE FROM job_board_job_fts_ids WHERE _id = old._id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_board_job_fts_au
+    AFTER UPDATE OF _id, job_title, company_name ON job_board_job BEGIN
+        DELETE FROM job_board_job_fts
+        WHERE rowid = (SELECT rowid FROM job_board_job_fts_ids WHERE _id = old._id);
+        DELETE FROM job_board_job_fts_ids WHERE _id = old._id;
+        INSERT INTO job_board_job_fts_ids(_id) VALUES (new._id);
+        INSERT INTO job_board_job_fts(rowid, _id, job_title, company_name)
+        VALUES (
+            (SELECT rowid FROM job_board_job_fts_ids WHERE _id = new._id),
+            new._id, new.job_title, new.company_name
+        );
+    END
+    """,
+    "DELETE FROM job_board_job_fts",
+    "DELETE FROM job_board_job_fts_ids",
+    "INSERT INTO job_board_job_fts_ids(_id) SELECT _id FROM job_board_job",
+    "INSERT INTO job_board_job_fts(rowid, _id, job_title, company_name) "
+    "SELECT ids.rowid, job._id, job.job_title, job.company_name "
+    "FROM job_board_job job JOIN job_board_job_fts_ids ids ON ids._id = job._id",
+    "INSERT INTO job_board_job_fts(job_board_job_fts) VALUES ('optimize')",
+]
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS job_board_job_fts_ai",
+    "DROP TRIGGER IF EXISTS job_board_job_fts_ad",
+    "DROP TRIGGER IF EXISTS job_board_job_fts_au",
+    "DROP TABLE IF EXISTS job_board_job_fts",
+    "DROP TABLE IF EXISTS job_board_job_fts_ids",
+]
+
+
+def install(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        statements = POSTGRES_INSTALL
+    elif connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            if not cursor.fetchone()[0]:
+                # job_board.search falls back to LIKE.
+                return
+        statements = SQLITE_INSTALL
+    else:
+        return
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def uninstall(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"postgresql": POSTGRES_UNINSTALL, "sqlite": SQLITE_UNINSTALL}
+    for sql in statements.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text search for the /jobs/ ``q`` filter: a generated, GIN-indexed
+    ``search_vector`` column on PostgreSQL, replacing the title and company
+    trigram indexes, or an FTS5 table maintained by triggers on SQLite. See
+    ``job_board.search``.
+    """
+
+    dependencies = [
+        ("job_board", "0009_job_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("job_board", "0010_job_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="rendered_json",
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+    ]
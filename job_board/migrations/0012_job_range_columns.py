@@ -0,0 +1,85 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:22
+
+from django.db import migrations, models
+
+from job_board import ranges
+
+# The salary_range expression indexes from migration 0009 give way to B-tree
+# indexes on the typed columns, which reuse their names.
+JSON_SALARY_INDEXES = [
+    ("job_salary_min_idx", "((salary_range -> 'min'))"),
+    ("job_salary_max_idx", "((salary_range -> 'max'))"),
+]
+
+
+def drop_json_salary_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _ in JSON_SALARY_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def create_json_salary_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, definition in JSON_SALARY_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON job_board_job {definition}"
+        )
+
+
+def fill_range_columns(apps, schema_editor):
+    ranges.backfill_range_columns(model=apps.get_model("job_board", "Job"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_board", "0011_job_rendered_json"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_json_salary_indexes, create_json_salary_indexes),
+        migrations.AddField(
+            model_name="job",
+            name="salary_currency",
+            field=models.CharField(blank=True, editable=False, max_length=3, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="salary_max",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="salary_min",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="yoe_max",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="yoe_min",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(fill_range_columns, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["salary_min"], name="job_salary_min_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["salary_max"], name="job_salary_max_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["yoe_min"], name="job_yoe_min_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["yoe_max"], name="job_yoe_max_idx"),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:24
+
+from django.db import migrations, models
+
+from job_board import locations
+
+# Location filters now go through the Location table, filled from the jobs'
+# locations below, so the GIN index that served locations__contains (migration
+# 0009) is no longer used.
+LOCATIONS_GIN_INDEX = "USING gin (locations jsonb_path_ops)"
+
+
+def drop_locations_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS job_locations_gin_idx")
+
+
+def create_locations_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS job_locations_gin_idx "
+        f"ON job_board_job {LOCATIONS_GIN_INDEX}"
+    )
+
+
+def fill_locations(apps, schema_editor):
+    locations.backfill_job_locations(
+        job_model=apps.get_model("job_board", "Job"),
+        location_model=apps.get_model("job_board", "Location"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_board", "0012_job_range_columns"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Location",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("city", models.CharField(blank=True, default="", max_length=255)),
+                ("country", models.CharField(blank=True, default="", max_length=255)),
+                ("region", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "jobs",
+                    models.ManyToManyField(
+                        blank=True, related_name="location_entries", to="job_board.job"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["country", "region"], name="location_country_idx"
+                    ),
+                    models.Index(fields=["region"], name="location_region_idx"),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="location",
+            constraint=models.UniqueConstraint(
+                fields=("city", "country", "region"), name="location_unique"
+            ),
+        ),
+        migrations.RunPython(fill_locations, migrations.RunPython.noop),
+        migrations.RunPython(drop_locations_gin_index, create_locations_gin_index),
+    ]
@@ -31,6 +31,98 @@ class Job(models.Model):
     job_slug = models.TextField(max_length=100, blank=True, null=True)
     job_meta = models.TextField(max_length=100, blank=True, null=True)
     score = models.TextField(max_length=100, blank=True, null=True)
+    # SHA-256 of the normalized Hirebase payload, used to skip unchanged rows on re-sync.
+    content_hash = models.CharField(max_length=64, blank=True, null=True)
+    # Typed copies of salary_range (annualized) and yoe_range for indexed range
+    # filters (see job_board.ranges).
+    salary_min = models.FloatField(blank=True, null=True, editable=False)
+    salary_max = models.FloatField(blank=True, null=True, editable=False)
+    salary_currency = models.CharField(
+        max_length=3, blank=True, null=True, editable=False
+    )
+    yoe_min = models.FloatField(blank=True, null=True, editable=False)
+    yoe_max = models.FloatField(blank=True, null=True, editable=False)
+    # JobListSerializer output as JSON, joined into listing responses (see job_board.rendering).
+    rendered_json = models.TextField(blank=True, null=True, editable=False)
+
+    class Meta:
+        # Indexes for the JobListView filter paths. The PostgreSQL-only trigram
+        # icontains indexes are created in migration 0009, the q search index in
+        # 0010; location filters go through Location.
+        indexes = [
+            # Listing order and the job_posted (date_posted >= ...) filter.
+            models.Index(fields=["-date_posted", "_id"], name="job_date_posted_id_idx"),
+            # delete_old_jobs.
+            models.Index(fields=["created_at"], name="job_created_at_idx"),
+            # salary_min/max and yoe_min/max range filters.
+            models.Index(fields=["salary_min"], name="job_salary_min_idx"),
+            models.Index(fields=["salary_max"], name="job_salary_max_idx"),
+            models.Index(fields=["yoe_min"], name="job_yoe_min_idx"),
+            models.Index(fields=["yoe_max"], name="job_yoe_max_idx"),
+        ]
+
+    def save(self, *args, update_fields=None, **kwargs):
+        # Derived columns are recomputed by pre_save hooks; make sure a save
+        # limited to their source fields writes them too.
+        if update_fields is not None:
+            from .ranges import RANGE_FIELDS, RANGE_SOURCE_FIELDS
+            from .serializers import JOB_LIST_FIELDS
+
+            update_fields = set(update_fields)
+            if update_fields & RANGE_SOURCE_FIELDS:
+                update_fields.update(RANGE_FIELDS)
+            if update_fields & set(JOB_LIST_FIELDS):
+                update_fields.add("rendered_json")
+        super().save(*args, update_fields=update_fields, **kwargs)
 
     def __str__(self):
         return f"{self.job_title} (ID: {self._id})"
+
+
+class Location(models.Model):
+    """
+    A distinct (city, country, region) from the jobs' ``locations`` JSON.
+
+    Missing parts are stored as empty strings, so each location has exactly
+    one row. Kept in step with ``Job.locations`` by ingestion (see
+    job_board.locations) and used for the location filters and endpoints.
+    """
+
+    city = models.CharField(max_length=255, blank=True, default="")
+    country = models.CharField(max_length=255, blank=True, default="")
+    region = models.CharField(max_length=255, blank=True, default="")
+    jobs = models.ManyToManyField(Job, related_name="location_entries", blank=True)
+
+    class Meta:
+        constraints = [
+            # Also serves city (and city + country) lookups.
+            models.UniqueConstraint(
+                fields=["city", "country", "region"], name="location_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["country", "region"], name="location_country_idx"),
+            models.Index(fields=["region"], name="location_region_idx"),
+        ]
+
+    def __str__(self):
+        return ",".join(part for part in [self.city, self.country, self.region] if part)
+
+
+class SyncState(models.Model):
+    """
+    Persisted progress of incremental ingestion from an external job source.
+
+    ``high_water_date_posted`` is the newest ``date_posted`` seen by the last
+    successful sync and ``boundary_ids`` are the IDs of the jobs posted at
+    exactly that time; incremental syncs stop once they reach older jobs.
+    """
+
+    source = models.CharField(max_length=50, primary_key=True)
+    high_water_date_posted = models.DateTimeField(blank=True, null=True)
+    boundary_ids = models.JSONField(default=list, blank=True)
+    last_success_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} (high water: {self.high_water_date_posted})"
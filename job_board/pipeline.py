@@ -0,0 +1,103 @@
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from .utils import fetch_hirebase_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class PagePrefetcher:
+    """
+    Fetch Hirebase pages on background threads while the caller writes earlier pages.
+
+    At most ``window`` fetches are in flight at any time; a new fetch is only
+    started once the consumer takes a finished page, so a slow database applies
+    backpressure to the network side. Pages are yielded in order. Only the
+    fetches run on worker threads, so database work stays on the calling
+    thread and its connection.
+
+    Usage:
+        with PagePrefetcher(range(2, 50), limit=100, window=2) as prefetcher:
+            for page, data, fetch_seconds in prefetcher:
+                ...
+    """
+
+    def __init__(
+        self,
+        pages: Iterable[int],
+        limit: int = 100,
+        window: int = 2,
+        fetch: Callable[[int, int], Optional[Dict[str, Any]]] = fetch_hirebase_jobs,
+    ):
+        self.limit = limit
+        self.window = max(1, window)
+        self.fetch = fetch
+        self.fetch_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.fetched_pages = 0
+        self._pages = iter(pages)
+        self._pending = deque()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.window, thread_name_prefix="hirebase-prefetch"
+        )
+
+    def _timed_fetch(self, page: int) -> Tuple[Optional[Dict[str, Any]], float]:
+        started = time.monotonic()
+        data = self.fetch(page, self.limit)
+        return data, time.monotonic() - started
+
+    def _fill(self):
+        while len(self._pending) < self.window:
+            page = next(self._pages, None)
+            if page is None:
+                return
+            self._pending.append((page, self._executor.submit(self._timed_fetch, page)))
+
+    def __iter__(self) -> Iterator[Tuple[int, Optional[Dict[str, Any]], float]]:
+        """Yield ``(page, data, fetch_seconds)`` for each page, in page order."""
+        self._fill()
+        while self._pending:
+            page, future = self._pending.popleft()
+            started = time.monotonic()
+            data, fetch_seconds = future.result()
+            self.wait_seconds += time.monotonic() - started
+            self.fetch_seconds += fetch_seconds
+            self.fetched_pages += 1
+            self._fill()
+            yield page, data, fetch_seconds
+
+    def close(self):
+        """Cancel fetches that have not started and release the worker threads."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def pipeline_report(
+    wall_seconds: float, fetch_seconds: float, wait_seconds: float, write_seconds: float
+) -> Dict[str, float]:
+    """
+    Summarize how much network time a pipelined run hid behind database work.
+
+    ``sequential_seconds`` estimates the same run with fetches and writes done
+    one after the other.
+    """
+    sequential_seconds = fetch_seconds + write_seconds
+    return {
+        "wall_seconds": round(wall_seconds, 2),
+        "fetch_seconds": round(fetch_seconds, 2),
+        "fetch_wait_seconds": round(wait_seconds, 2),
+        "write_seconds": round(write_seconds, 2),
+        "overlap_seconds": round(max(0.0, sequential_seconds - wall_seconds), 2),
+        "speedup": round(sequential_seconds / wall_seconds, 2) if wall_seconds else 1.0,
+    }
@@ -0,0 +1,71 @@
+"""
+CDN purges by surrogate key after the jobs table changes.
+
+``purge_surrogate_keys`` hands keys to the backend named by
+``SURROGATE_PURGE_BACKEND``: ``LoggingPurgeBackend`` (the default; it only
+logs, for development and tests) or ``FastlyPurgeBackend``. A backend is any
+class with a ``purge(keys)`` method. Purging never raises: a failed purge
+only means the CDN serves cached responses until they expire.
+"""
+
+import logging
+from typing import List
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingPurgeBackend:
+    """Log the keys that would be purged."""
+
+    def purge(self, keys: List[str]):
+        logger.info(f"Purging surrogate keys: {' '.join(keys)}")
+
+
+class FastlyPurgeBackend:
+    """
+    Purge keys from a Fastly service with the batch surrogate-key purge API.
+
+    Needs ``FASTLY_API_TOKEN`` and ``FASTLY_SERVICE_ID``. With
+    ``FASTLY_SOFT_PURGE`` the objects are marked stale instead of evicted, so
+    Fastly can still serve them if the origin is down.
+    """
+
+    API_URL = "https://api.fastly.com/service/{service_id}/purge"
+    # Fastly accepts at most this many keys per request.
+    MAX_KEYS = 256
+
+    def purge(self, keys: List[str]):
+        headers = {"Fastly-Key": settings.FASTLY_API_TOKEN}
+        if settings.FASTLY_SOFT_PURGE:
+            headers["Fastly-Soft-Purge"] = "1"
+        url = self.API_URL.format(service_id=settings.FASTLY_SERVICE_ID)
+        for start in range(0, len(keys), self.MAX_KEYS):
+            batch = keys[start : start + self.MAX_KEYS]
+            response = requests.post(
+                url,
+                headers={**headers, "Surrogate-Key": " ".join(batch)},
+                timeout=10,
+            )
+            response.raise_for_status()
+
+
+def purge_surrogate_keys(keys: List[str]) -> bool:
+    """
+    Purge ``keys`` through the configured backend.
+
+    Returns:
+        bool: False if there was nothing to purge or the backend failed.
+    """
+    if not keys:
+        return False
+    keys = sorted(set(keys))
+    try:
+        import_string(settings.SURROGATE_PURGE_BACKEND)().purge(keys)
+    except Exception as e:
+        logger.error(f"Could not purge surrogate keys {keys}: {e}")
+        return False
+    return True
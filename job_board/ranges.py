@@ -0,0 +1,109 @@
+"""
+Typed salary and experience columns derived from the JSON ranges.
+
+Hirebase sends ``salary_range`` as ``{"min", "max", "currency", "period"}``
+and ``yoe_range`` as ``{"min", "max"}``. Ingestion copies them into numeric
+columns with B-tree indexes (``salary_min``/``salary_max`` annualized, plus
+``salary_currency``; ``yoe_min``/``yoe_max``), so the ``/jobs/`` range
+filters are index range scans rather than JSON key extraction on every row.
+Salaries are not converted between currencies, since the payload carries no
+exchange rates. ``Job.save()`` keeps the columns current through a
+``pre_save`` hook; ``backfill_job_ranges`` fills them for older rows.
+"""
+
+from typing import Any, Dict, Optional
+
+from .models import Job
+
+# Multipliers that annualize a salary paid per period. A missing period is
+# taken as annual, which is what Hirebase sends for most jobs.
+PERIOD_MULTIPLIERS = {
+    "hour": 2080,
+    "hourly": 2080,
+    "day": 260,
+    "daily": 260,
+    "week": 52,
+    "weekly": 52,
+    "month": 12,
+    "monthly": 12,
+    "year": 1,
+    "yearly": 1,
+    "annual": 1,
+    "annually": 1,
+}
+RANGE_FIELDS = ["salary_min", "salary_max", "salary_currency", "yoe_min", "yoe_max"]
+RANGE_SOURCE_FIELDS = {"salary_range", "yoe_range"}
+
+
+def _number(value) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def range_columns(
+    salary_range: Optional[Dict[str, Any]], yoe_range: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Typed column values for a job's ``salary_range`` and ``yoe_range``.
+
+    Salaries with a period we don't recognise are left empty rather than
+    compared on the wrong scale.
+    """
+    columns = dict.fromkeys(RANGE_FIELDS)
+    if isinstance(salary_range, dict):
+        period = str(salary_range.get("period") or "year").strip().lower()
+        multiplier = PERIOD_MULTIPLIERS.get(period)
+        if multiplier is not None:
+            for bound in ["min", "max"]:
+                value = _number(salary_range.get(bound))
+                if value is not None:
+                    columns[f"salary_{bound}"] = value * multiplier
+        currency = str(salary_range.get("currency") or "").strip().upper()
+        columns["salary_currency"] = currency[:3] or None
+    if isinstance(yoe_range, dict):
+        columns["yoe_min"] = _number(yoe_range.get("min"))
+        columns["yoe_max"] = _number(yoe_range.get("max"))
+    return columns
+
+
+def set_range_columns(sender, instance: Job, update_fields=None, **kwargs):
+    """
+    ``pre_save`` hook: keep the typed columns in step with the JSON ranges.
+
+    ``Job.save()`` adds the columns to ``update_fields`` when a range is saved.
+    """
+    if update_fields is not None and not RANGE_SOURCE_FIELDS & set(update_fields):
+        return
+    for name, value in range_columns(instance.salary_range, instance.yoe_range).items():
+        setattr(instance, name, value)
+
+
+def backfill_range_columns(batch_size: int = 500, model=Job) -> int:
+    """
+    Recompute the typed columns of every job from its JSON ranges.
+
+    Args:
+        batch_size: Jobs read and updated per query.
+        model: The ``Job`` model to update (migrations pass their historical one).
+
+    Returns:
+        int: Number of jobs updated.
+    """
+    updated = 0
+    last_id = None
+    queryset = model.objects.order_by("_id").only("_id", "salary_range", "yoe_range")
+    while True:
+        batch = queryset if last_id is None else queryset.filter(_id__gt=last_id)
+        jobs = list(batch[:batch_size])
+        if not jobs:
+            return updated
+        for job in jobs:
+            for name, value in range_columns(job.salary_range, job.yoe_range).items():
+                setattr(job, name, value)
+        model.objects.bulk_update(jobs, RANGE_FIELDS)
+        updated += len(jobs)
+        last_id = jobs[-1]._id
@@ -0,0 +1,125 @@
+"""
+Pre-rendered JSON for job listings.
+
+Each job stores its ``JobListSerializer`` output as JSON text in
+``Job.rendered_json``. Ingestion renders it while upserting new and changed
+rows, and ``Job.save()`` (admin edits, ``update_or_create``) re-renders it
+through a ``pre_save`` hook, so a listing page is assembled by joining the
+stored fragments instead of serializing every row per request. After
+changing ``JobListSerializer``, run ``rerender_jobs`` to refresh them.
+"""
+
+import json
+from typing import Dict, Iterable
+
+from rest_framework.renderers import JSONRenderer
+
+from .models import Job
+from .serializers import JobListSerializer
+
+_renderer = JSONRenderer()
+# Saving any of these re-renders the fragment.
+RENDERED_FIELDS = {*JobListSerializer.Meta.fields, "rendered_json"}
+
+
+class RenderedJSON(str):
+    """JSON text that ``FragmentJSONRenderer`` inserts into its output as is."""
+
+
+def render_job_json(job: Job) -> str:
+    """Render ``job`` the way the listing endpoint's JSON renderer would."""
+    return _renderer.render(JobListSerializer(job).data).decode()
+
+
+def job_fragments(jobs: Iterable[Job]) -> Dict[str, str]:
+    """
+    The listing JSON of ``jobs`` by ID.
+
+    Jobs without a fragment (rows written before it existed) are rendered
+    on the fly, loading their listing fields in one query.
+    """
+    fragments: Dict[str, str] = {job._id: job.rendered_json for job in jobs}
+    missing = [job_id for job_id, fragment in fragments.items() if not fragment]
+    if missing:
+        for job in Job.objects.filter(_id__in=missing).only(
+            *JobListSerializer.Meta.fields
+        ):
+            fragments[job._id] = render_job_json(job)
+    return fragments
+
+
+def render_jobs_array(jobs: Iterable[Job]) -> RenderedJSON:
+    """Join the stored fragments of ``jobs`` into a JSON array."""
+    jobs = list(jobs)
+    fragments = job_fragments(jobs)
+    return RenderedJSON("[" + ",".join(fragments[job._id] for job in jobs) + "]")
+
+
+def rerender_jobs(missing_only: bool = False, batch_size: int = 500) -> int:
+    """
+    Re-render ``rendered_json`` for every job, or only those without one.
+
+    Returns:
+        int: Number of jobs rendered.
+    """
+    queryset = Job.objects.order_by("_id")
+    if missing_only:
+        queryset = queryset.filter(rendered_json__isnull=True)
+    rendered = 0
+    last_id = None
+    while True:
+        # Keyset batches, so rows rendered by earlier batches aren't skipped.
+        batch = queryset if last_id is None else queryset.filter(_id__gt=last_id)
+        jobs = list(batch.only(*JobListSerializer.Meta.fields)[:batch_size])
+        if not jobs:
+            return rendered
+        for job in jobs:
+            job.rendered_json = render_job_json(job)
+        Job.objects.bulk_update(jobs, ["rendered_json"])
+        rendered += len(jobs)
+        last_id = jobs[-1]._id
+
+
+def rerender_job_json(sender, instance: Job, update_fields=None, **kwargs):
+    """
+    ``pre_save`` hook: keep ``rendered_json`` in step with the saved fields.
+
+    ``Job.save()`` adds ``rendered_json`` to ``update_fields`` when a listing
+    field is saved.
+    """
+    if update_fields is not None and not RENDERED_FIELDS & set(update_fields):
+        return
+    instance.rendered_json = render_job_json(instance)
+
+
+class FragmentJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that splices ``RenderedJSON`` values in without re-encoding.
+
+    Only the top-level values of a dict are checked, which is where the
+    listing envelope keeps its results. Anything else renders as usual.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, dict) or not any(
+            isinstance(value, RenderedJSON) for value in data.values()
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            # Pretty-printing needs the parsed value anyway.
+            data = {
+                key: json.loads(value) if isinstance(value, RenderedJSON) else value
+                for key, value in data.items()
+            }
+            return super().render(data, accepted_media_type, renderer_context)
+        parts = []
+        for key, value in data.items():
+            if isinstance(value, RenderedJSON):
+                encoded = value.encode()
+            elif value is None:
+                # JSONRenderer renders a bare None as an empty body.
+                encoded = b"null"
+            else:
+                encoded = super().render(value, accepted_media_type, renderer_context)
+            parts.append(super().render(key) + b":" + encoded)
+        return b"{" + b",".join(parts) + b"}"
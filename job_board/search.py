@@ -0,0 +1,280 @@
+"""
+Full-text search over job titles and company names for the ``q`` filter.
+
+PostgreSQL keeps a weighted ``search_vector`` tsvector as a stored generated
+column with a GIN index, so every write (ingestion upserts, admin edits,
+``delete_old_jobs``) keeps it current. SQLite keeps an FTS5 table,
+``job_board_job_fts``, in step with ``job_board_job`` through triggers. Its
+rows are keyed on the job's ``_id`` through ``job_board_job_fts_ids``, which
+assigns each job the FTS rowid, rather than on ``job_board_job``'s implicit
+rowid, which ``VACUUM`` and table rebuilds renumber. Both are created by
+migration 0010; on SQLite a table rebuild by a later migration drops the
+triggers, so ``ensure_search_index`` reinstalls them after ``migrate``.
+Databases without either fall back to ``icontains``.
+"""
+
+import logging
+import re
+from typing import List, Optional
+
+from django.db import connections
+from django.db.models import (
+    BooleanField,
+    Expression,
+    F,
+    Field,
+    FloatField,
+    Func,
+    IntegerField,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.db.models.expressions import Col, RawSQL
+
+logger = logging.getLogger(__name__)
+
+JOB_TABLE = "job_board_job"
+FTS_TABLE = "job_board_job_fts"
+FTS_IDS_TABLE = "job_board_job_fts_ids"
+SEARCH_VECTOR_INDEX = "job_search_vector_idx"
+# "simple" neither stems nor drops stop words, which suits titles and company names.
+SEARCH_CONFIG = "simple"
+# Title matches outrank company-name matches.
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(job_title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(company_name, '')), 'B')"
+)
+FTS_COLUMN_WEIGHTS = "0.0, 10.0, 5.0"  # _id, job_title, company_name
+MAX_SEARCH_TERMS = 8
+
+TERM_PATTERN = re.compile(r"\w+")
+
+# The FTS rowid of the job with _id = %s.
+FTS_ROWID_SQL = f"(SELECT rowid FROM {FTS_IDS_TABLE} WHERE _id = %s)"
+FTS_INSERT_SQL = f"""
+    INSERT INTO {FTS_IDS_TABLE}(_id) VALUES (new._id);
+    INSERT INTO {FTS_TABLE}(rowid, _id, job_title, company_name)
+    VALUES ({FTS_ROWID_SQL % "new._id"}, new._id, new.job_title, new.company_name);
+"""
+FTS_DELETE_SQL = f"""
+    DELETE FROM {FTS_TABLE} WHERE rowid = {FTS_ROWID_SQL % "old._id"};
+    DELETE FROM {FTS_IDS_TABLE} WHERE _id = old._id;
+"""
+FTS_TRIGGERS = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {JOB_TABLE} BEGIN
+            {FTS_INSERT_SQL}
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {JOB_TABLE} BEGIN
+            {FTS_DELETE_SQL}
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER {FTS_TABLE}_au
+        AFTER UPDATE OF _id, job_title, company_name ON {JOB_TABLE} BEGIN
+            {FTS_DELETE_SQL}
+            {FTS_INSERT_SQL}
+        END
+    """,
+}
+
+
+class JobColumn(Expression):
+    """
+    A ``job_board_job`` column the model doesn't declare (``search_vector``),
+    qualified with the query's alias for the table so it also works when the
+    queryset is used as a subquery.
+    """
+
+    def __init__(self, column: str, output_field: Field):
+        super().__init__(output_field=output_field)
+        self.column = column
+
+    def resolve_expression(self, query=None, *args, **kwargs):
+        target = self.output_field.clone()
+        target.set_attributes_from_name(self.column)
+        target.model = query.model
+        return Col(query.get_initial_alias(), target)
+
+
+def search_terms(q: str) -> List[str]:
+    """Split a search string into lower-cased word terms, dropping punctuation."""
+    return TERM_PATTERN.findall(q.lower())[:MAX_SEARCH_TERMS]
+
+
+def _sqlite_objects(connection, object_type: str) -> List[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = %s AND name LIKE %s",
+            [object_type, f"{FTS_TABLE}%"],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search_backend(using: str = "default") -> Optional[str]:
+    """Return "postgresql", "fts5" or None when only ``icontains`` is available."""
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        return "postgresql"
+    if connection.vendor == "sqlite" and FTS_TABLE in _sqlite_objects(
+        connection, "table"
+    ):
+        return "fts5"
+    return None
+
+
+def search_jobs(queryset: QuerySet, q: str, relevance: bool = False) -> QuerySet:
+    """
+    Filter ``queryset`` to jobs whose title or company name matches ``q``.
+
+    Every word of ``q`` must match the start of a word in the title or company
+    name. With ``relevance`` the jobs are annotated with ``search_rank`` and
+    ordered by it, newest first among equal ranks; otherwise the existing
+    ordering is kept.
+    """
+    terms = search_terms(q)
+    backend = search_backend(queryset.db) if terms else None
+    if backend is None:
+        return queryset.filter(Q(job_title__icontains=q) | Q(company_name__icontains=q))
+
+    if backend == "postgresql":
+        tsquery = Func(
+            Value(SEARCH_CONFIG),
+            Value(" & ".join(f"{term}:*" for term in terms)),
+            function="to_tsquery",
+            output_field=Field(),
+        )
+        search_vector = JobColumn("search_vector", Field())
+        queryset = queryset.filter(
+            Func(
+                search_vector,
+                tsquery,
+                template="%(expressions)s",
+                arg_joiner=" @@ ",
+                output_field=BooleanField(),
+            )
+        )
+        rank = Func(
+            search_vector, tsquery, function="ts_rank_cd", output_field=FloatField()
+        )
+    else:
+        match = " ".join(f'"{term}"*' for term in terms)
+        queryset = queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT _id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+            )
+        )
+        # bm25() is lower for better matches. It only works in a MATCH query,
+        # so it is looked up by the job's FTS rowid.
+        fts_rowid = Func(
+            F("_id"),
+            template=FTS_ROWID_SQL % "%(expressions)s",
+            output_field=IntegerField(),
+        )
+        rank = Func(
+            Value(match),
+            fts_rowid,
+            template=(
+                f"(SELECT -bm25({FTS_TABLE}, {FTS_COLUMN_WEIGHTS}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %(expressions)s)"
+            ),
+            arg_joiner=f" AND {FTS_TABLE}.rowid = ",
+            output_field=FloatField(),
+        )
+
+    if relevance:
+        queryset = queryset.annotate(search_rank=rank).order_by(
+            "-search_rank", "-date_posted", "_id"
+        )
+    return queryset
+
+
+def install_search_index(connection):
+    """Create the search column/table, its index or triggers, and fill it."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {JOB_TABLE} ADD COLUMN IF NOT EXISTS search_vector "
+                f"tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {SEARCH_VECTOR_INDEX} "
+                f"ON {JOB_TABLE} USING gin (search_vector)"
+            )
+        return
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if not cursor.fetchone()[0]:
+            logger.warning("SQLite was built without FTS5; job search uses LIKE.")
+            return
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "_id UNINDEXED, job_title, company_name, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {FTS_IDS_TABLE} ("
+            "rowid INTEGER PRIMARY KEY, _id varchar(255) NOT NULL UNIQUE)"
+        )
+        # Replaced rather than kept, so triggers from older schemas are upgraded.
+        for name, sql in FTS_TRIGGERS.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(sql)
+    rebuild_search_index(connection)
+
+
+def rebuild_search_index(connection) -> Optional[int]:
+    """
+    Re-derive the search index from ``job_board_job``.
+
+    Returns:
+        int: Jobs indexed, or None when the database has no search index.
+    """
+    if connection.vendor == "postgresql":
+        # The generated column cannot drift; rebuilding the index compacts it.
+        with connection.cursor() as cursor:
+            cursor.execute(f"REINDEX INDEX {SEARCH_VECTOR_INDEX}")
+            cursor.execute(f"ANALYZE {JOB_TABLE}")
+            cursor.execute(f"SELECT count(*) FROM {JOB_TABLE}")
+            return cursor.fetchone()[0]
+    if connection.vendor != "sqlite" or FTS_TABLE not in _sqlite_objects(
+        connection, "table"
+    ):
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(f"DELETE FROM {FTS_IDS_TABLE}")
+        cursor.execute(f"INSERT INTO {FTS_IDS_TABLE}(_id) SELECT _id FROM {JOB_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}(rowid, _id, job_title, company_name) "
+            f"SELECT ids.rowid, job._id, job.job_title, job.company_name "
+            f"FROM {JOB_TABLE} job JOIN {FTS_IDS_TABLE} ids ON ids._id = job._id"
+        )
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+        cursor.execute(f"SELECT count(*) FROM {FTS_TABLE}")
+        return cursor.fetchone()[0]
+
+
+def ensure_search_index(using: str = "default", **kwargs):
+    """
+    ``post_migrate`` hook: reinstall the SQLite triggers if a table rebuild
+    dropped them, or the ``_id`` keys if the index predates them, and refill
+    the FTS table.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    tables = _sqlite_objects(connection, "table")
+    if FTS_TABLE not in tables:
+        return
+    if FTS_IDS_TABLE in tables and set(FTS_TRIGGERS) <= set(
+        _sqlite_objects(connection, "trigger")
+    ):
+        return
+    logger.info("Reinstalling job search triggers and rebuilding the FTS index.")
+    install_search_index(connection)
@@ -1,8 +1,48 @@
 from rest_framework import serializers
 from .models import Job
 
+# What a listing card shows; the long TEXT/JSON columns (description,
+# company_data, requirements_summary, job_meta) are left to ?view=full.
+JOB_LIST_FIELDS = [
+    "_id",
+    "job_title",
+    "company_name",
+    "company_logo",
+    "company_slug",
+    "job_slug",
+    "job_type",
+    "location_type",
+    "locations",
+    "salary_range",
+    "yoe_range",
+    "date_posted",
+    "visa_sponsored",
+    "application_link",
+]
+
 
 class JobSerializer(serializers.ModelSerializer):
+    """
+    Full job representation.
+
+    Pass ``fields`` to output only those fields, e.g. for ``?fields=``.
+    """
+
+    class Meta:
+        model = Job
+        # rendered_json caches JobListSerializer output (see job_board.rendering).
+        exclude = ["rendered_json"]
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class JobListSerializer(JobSerializer):
+    """Compact job representation for listings."""
+
     class Meta:
         model = Job
-        fields = "__all__"
+        fields = JOB_LIST_FIELDS
@@ -0,0 +1,269 @@
+"""
+Offline stand-in for the Hirebase jobs search API.
+
+Serves recorded fixture pages or deterministic synthetic jobs with configurable
+latency and error rates, so ingestion can be exercised and benchmarked without
+calling the paid API. Used by the ``hirebase_standin``,
+``record_hirebase_fixtures`` and ``benchmark_hirebase_ingestion`` commands.
+"""
+
+import gzip
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dates import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_PATTERN = "page-*.json.gz"
+SYNTHETIC_ID_PREFIX = "standin-"
+
+JOB_TYPES = ["Full Time", "Part Time", "Contract", "Internship"]
+LOCATION_TYPES = ["Remote", "Hybrid", "In-Person"]
+PLACES = [
+    ("New York", "United States", "New York"),
+    ("San Francisco", "United States", "California"),
+    ("Austin", "United States", "Texas"),
+    ("London", "United Kingdom", "England"),
+    ("Berlin", "Germany", "Berlin"),
+    ("Toronto", "Canada", "Ontario"),
+    ("Bangalore", "India", "Karnataka"),
+    ("Sydney", "Australia", "New South Wales"),
+]
+TITLES = [
+    "Software Engineer",
+    "Senior Backend Engineer",
+    "Data Scientist",
+    "Product Manager",
+    "DevOps Engineer",
+    "Frontend Developer",
+    "Machine Learning Engineer",
+    "QA Analyst",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOREM = (
+    "We are looking for a motivated engineer to join our team and help build "
+    "reliable, scalable products used by millions of people every day. "
+)
+
+
+def fixture_path(directory: Path, page: int) -> Path:
+    return Path(directory) / f"page-{page:05d}.json.gz"
+
+
+def write_fixture(directory: Path, page: int, data: Dict[str, Any]) -> Path:
+    """Write one API response body as a gzip-compressed fixture."""
+    path = fixture_path(directory, page)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as fixture:
+        json.dump(data, fixture)
+    return path
+
+
+def load_fixture_jobs(
+    directory: Path, now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load the jobs of every recorded page, in page order.
+
+    Their ``date_posted`` values are shifted so the newest job was posted at
+    ``now``, keeping the gaps between jobs. Otherwise fixtures recorded more
+    than 8 days ago would stop ingestion at the first page.
+    """
+    jobs = []
+    for path in sorted(Path(directory).glob(FIXTURE_PATTERN)):
+        with gzip.open(path, "rt", encoding="utf-8") as fixture:
+            jobs.extend(json.load(fixture).get("jobs", []))
+    return redate_jobs(jobs, now)
+
+
+def redate_jobs(
+    jobs: List[Dict[str, Any]], now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """Shift the jobs' ``date_posted`` in place so the newest is ``now``."""
+    posted = [parse_datetime(job.get("date_posted")) for job in jobs]
+    known = [date for date in posted if date is not None]
+    if not known:
+        return jobs
+    now = (now or datetime.now(dt_timezone.utc)).replace(microsecond=0)
+    shift = now - max(known)
+    for job, date in zip(jobs, posted):
+        if date is not None:
+            job["date_posted"] = (date + shift).strftime("%Y-%m-%dT%H:%M:%S.%f")
+    return jobs
+
+
+def synthetic_jobs(
+    count: int, now: Optional[datetime] = None, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Generate ``count`` Hirebase-shaped jobs, newest first.
+
+    Jobs are spaced a few minutes apart going back from ``now`` and use a mix
+    of the timestamp formats Hirebase sends.
+    """
+    rng = random.Random(seed)
+    now = (now or datetime.now(dt_timezone.utc)).replace(microsecond=0)
+    jobs = []
+    for index in range(count):
+        posted = now - timedelta(minutes=5 * index, seconds=rng.randint(0, 240))
+        if index % 3 == 0:
+            date_posted = posted.strftime("%Y-%m-%dT%H:%M:%S.%f")
+        else:
+            date_posted = posted.strftime("%Y-%m-%dT%H:%M:%S")
+        city, country, region = rng.choice(PLACES)
+        company = rng.choice(COMPANIES)
+        salary_min = rng.randrange(40, 200) * 1000
+        yoe_min = rng.randint(0, 8)
+        jobs.append(
+            {
+                "_id": f"{SYNTHETIC_ID_PREFIX}{seed}-{index}",
+                "job_title": rng.choice(TITLES),
+                "description": LOREM * rng.randint(10, 40),
+                "application_link": f"https://jobs.example.com/{seed}/{index}",
+                "job_categories": ["Engineering"],
+                "job_type": rng.choice(JOB_TYPES),
+                "location_type": rng.choice(LOCATION_TYPES),
+                "yoe_range": {"min": yoe_min, "max": yoe_min + rng.randint(1, 5)},
+                "date_posted": date_posted,
+                "company_name": company,
+                "company_link": f"https://{company.lower()}.example.com",
+                "company_logo": f"https://{company.lower()}.example.com/logo.png",
+                "requirements_summary": "Python, Django, PostgreSQL",
+                "locations": [{"city": city, "country": country, "region": region}],
+                "salary_range": {
+                    "min": salary_min,
+                    "max": salary_min + rng.randrange(10, 60) * 1000,
+                    "currency": "USD",
+                    "period": "year",
+                },
+                "company_data": {
+                    "name": company,
+                    "size": rng.choice(["1-10", "11-50", "51-200", "201-1000"]),
+                    "industries": ["Software"],
+                    "description": LOREM * 3,
+                },
+                "visa_sponsored": rng.random() < 0.2,
+                "company_slug": company.lower(),
+                "job_slug": f"{company.lower()}-{index}",
+                "meta": None,
+                "score": str(round(rng.random(), 3)),
+            }
+        )
+    return jobs
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Answer Hirebase search POSTs from the server's in-memory job list."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _send(self, status: int, body: bytes, gzip_body: bool = False):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if gzip_body:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            page = max(1, int(payload.get("page", 1)))
+            limit = max(1, int(payload.get("limit", 100)))
+        except (TypeError, ValueError):
+            self._send(400, b'{"error": "invalid request body"}')
+            return
+
+        time.sleep(server.delay())
+        if server.should_fail():
+            self._send(503, b'{"error": "simulated failure"}')
+            return
+
+        accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        self._send(200, server.page_body(page, limit), gzip_body=accepts_gzip)
+
+
+class HirebaseStandinServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server that mimics the Hirebase jobs search endpoint.
+
+    Attributes:
+        jobs (list): Jobs served, newest first, paginated by each request's limit.
+        latency_ms (float): Base delay added to every response.
+        jitter_ms (float): Extra random delay of up to this many milliseconds.
+        error_rate (float): Fraction of requests answered with a 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        jobs: List[Dict[str, Any]],
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        seed: int = 0,
+    ):
+        super().__init__(address, StandinHandler)
+        self.jobs = jobs
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def delay(self) -> float:
+        with self._lock:
+            self.requests += 1
+            jitter = self._rng.uniform(0, self.jitter_ms)
+        return (self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def page_body(self, page: int, limit: int) -> bytes:
+        total_pages = max(1, -(-len(self.jobs) // limit))
+        jobs = self.jobs[(page - 1) * limit : page * limit]
+        body = {
+            "jobs": jobs,
+            "page": page,
+            "limit": limit,
+            "total_count": len(self.jobs),
+            "total_pages": total_pages,
+        }
+        return json.dumps(body).encode("utf-8")
+
+
+def start_standin_server(
+    jobs: List[Dict[str, Any]], host: str = "127.0.0.1", port: int = 0, **options
+) -> HirebaseStandinServer:
+    """Start a stand-in server on a background thread; ``port=0`` picks a free port."""
+    server = HirebaseStandinServer((host, port), jobs, **options)
+    thread = threading.Thread(
+        target=server.serve_forever, name="hirebase-standin", daemon=True
+    )
+    thread.start()
+    return server
@@ -0,0 +1,136 @@
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+WHITESPACE = " \t\n\r"
+
+
+class StreamedPage:
+    """
+    Incrementally decode a JSON object whose ``array_key`` member is a large array.
+
+    Items of the array are decoded one at a time from ``chunks`` (raw bytes,
+    e.g. ``response.iter_content()``), so memory use is bounded by the largest
+    single item rather than by the whole body. Every other top-level member is
+    decoded into ``meta`` as it is reached; members that follow the array are
+    only available after the items have been consumed or ``finish()`` is called.
+
+    Usage:
+        with StreamedPage(response.iter_content(65536), on_close=response.close) as page:
+            for job in page.items():
+                ...
+            page.finish()
+            total_pages = page.meta.get("total_pages")
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        array_key: str = "jobs",
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.array_key = array_key
+        self.meta: Dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._on_close = on_close
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._events = self._parse()
+
+    def _read_more(self) -> bool:
+        """Append the next chunk to the buffer, dropping already consumed text."""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += self._text_decoder.decode(chunk)
+                return True
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at end of input."""
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                return ""
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}.")
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        while True:
+            self._peek()
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk.
+            if end >= len(self._buffer) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def _parse(self) -> Iterator[Any]:
+        self._expect("{")
+        while True:
+            char = self._peek()
+            if char == "}":
+                self._pos += 1
+                return
+            if char == ",":
+                self._pos += 1
+                continue
+            key = self._decode_value()
+            self._expect(":")
+            if key != self.array_key:
+                self.meta[key] = self._decode_value()
+                continue
+            self._expect("[")
+            while True:
+                char = self._peek()
+                if char == "]":
+                    self._pos += 1
+                    break
+                if char == ",":
+                    self._pos += 1
+                    continue
+                yield self._decode_value()
+
+    def items(self) -> Iterator[Any]:
+        """Yield the items of the streamed array one at a time."""
+        return self._events
+
+    def finish(self):
+        """Consume the rest of the body so every top-level member is in ``meta``."""
+        for _ in self._events:
+            pass
+
+    def close(self):
+        self._events.close()
+        if self._on_close:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,258 @@
+"""
+Search-as-you-type suggestions for job titles and company names.
+
+``SuggestIndex.rebuild()`` reads the distinct titles and company names (with
+their job counts) once and stores them in Redis under a new version; it runs
+after every Hirebase sync and job cleanup. Each web process loads the stored
+vocabulary into an in-memory prefix and trigram index the first time it sees
+a new version, so a keystroke costs one Redis ``GET`` plus a lookup in memory.
+Until the first rebuild has published a version, suggestions are empty and the
+first request enqueues ``refresh_suggest_index``.
+"""
+
+import bisect
+import heapq
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import Count
+
+from . import utils
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_KINDS = ["title", "company"]
+# Prefixes up to this length have their top suggestions precomputed; longer
+# prefixes match few enough keys to rank on the fly.
+PRECOMPUTED_PREFIX_LENGTH = 2
+PRECOMPUTED_TOP = 50
+# Trigrams shared by more terms than this are too common to narrow a fuzzy match.
+MAX_TRIGRAM_POSTINGS = 2000
+FUZZY_MIN_SIMILARITY = 0.5
+
+NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """Case-fold, strip accents and collapse punctuation to single spaces."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+class _LoadedIndex:
+    """In-memory lookup structures for one version of the suggestion vocabulary."""
+
+    def __init__(self, entries: List[List[Any]]):
+        # entries: [text, kind, count], most frequent first.
+        self.entries = entries
+        self.normalized = [normalize(text) for text, _, _ in entries]
+        # Every word start of every term is a key, so "eng" finds "Software Engineer".
+        keys = []
+        for index, term in enumerate(self.normalized):
+            for match in re.finditer(r"\S+", term):
+                keys.append((term[match.start() :], index))
+        keys.sort()
+        self.keys = [key for key, _ in keys]
+        self.key_entries = [index for _, index in keys]
+
+        # Top entries per short prefix, for all kinds (None) and for each kind,
+        # so a kind filter doesn't empty a list filled by the other kind.
+        self.top_by_prefix: Dict[Optional[str], Dict[str, List[int]]] = {
+            kind: defaultdict(list) for kind in [None, *SUGGEST_KINDS]
+        }
+        for key, index in keys:
+            for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1):
+                if len(key) >= length:
+                    self.top_by_prefix[None][key[:length]].append(index)
+                    self.top_by_prefix[entries[index][1]][key[:length]].append(index)
+        for top in self.top_by_prefix.values():
+            for prefix, indexes in top.items():
+                # Entries are stored most frequent first, so the lowest indexes win.
+                top[prefix] = sorted(set(indexes))[:PRECOMPUTED_TOP]
+
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for index, term in enumerate(self.normalized):
+            for gram in trigrams(term):
+                self.postings[gram].append(index)
+
+    def prefix_matches(self, query: str, kind: Optional[str] = None) -> List[int]:
+        """
+        Entry indexes of ``kind`` (any if None) whose title/name has a word
+        starting with ``query``, best first.
+        """
+        if len(query) <= PRECOMPUTED_PREFIX_LENGTH and " " not in query:
+            return self.top_by_prefix[kind].get(query, [])
+        start = bisect.bisect_left(self.keys, query)
+        end = bisect.bisect_left(self.keys, query + "\uffff", lo=start)
+        return [
+            index
+            for index in sorted(set(self.key_entries[start:end]))
+            if kind is None or self.entries[index][1] == kind
+        ]
+
+    def fuzzy_matches(self, query: str) -> List[Tuple[float, int]]:
+        """(similarity, entry index) pairs at or above ``FUZZY_MIN_SIMILARITY``."""
+        query_grams = trigrams(query)
+        postings = sorted(
+            (self.postings[gram] for gram in query_grams if gram in self.postings),
+            key=len,
+        )
+        selective = [p for p in postings if len(p) <= MAX_TRIGRAM_POSTINGS]
+        shared = Counter()
+        for posting in selective or postings[:1]:
+            shared.update(posting)
+        # Score by the share of the query's trigrams found in the term, so a
+        # partly typed query isn't penalised for the rest of a long title.
+        scored = []
+        for index, common in shared.items():
+            similarity = common / len(query_grams)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                scored.append((similarity, index))
+        return scored
+
+
+class SuggestIndex:
+    """
+    Redis-backed vocabulary of job titles and company names for suggestions.
+
+    Usage:
+        SuggestIndex().rebuild()                    # after a sync
+        SuggestIndex().suggest("sofware eng", 10)   # per keystroke
+    """
+
+    KEY_PREFIX = "job_board:suggest:"
+
+    # Seconds before a missing index may enqueue another rebuild.
+    REBUILD_LOCK_TIMEOUT = 300
+
+    _loaded: Optional[Tuple[str, _LoadedIndex]] = None
+    _load_lock = threading.Lock()
+
+    def __init__(self):
+        self.version_key = f"{self.KEY_PREFIX}version"
+        self.data_key_prefix = f"{self.KEY_PREFIX}data:"
+        self.rebuild_lock_key = f"{self.KEY_PREFIX}rebuilding"
+
+    def rebuild(self) -> int:
+        """
+        Recompute the vocabulary from the jobs table and publish it as a new version.
+
+        Returns:
+            int: Number of distinct titles and company names indexed.
+        """
+        entries = []
+        for kind, field in [("title", "job_title"), ("company", "company_name")]:
+            counts = Counter()
+            spellings = defaultdict(Counter)
+            rows = (
+                Job.objects.exclude(**{f"{field}__isnull": True})
+                .exclude(**{field: ""})
+                .values(field)
+                .annotate(jobs=Count("_id"))
+            )
+            for row in rows:
+                text = " ".join(row[field].split())
+                key = normalize(text)
+                if key:
+                    counts[key] += row["jobs"]
+                    spellings[key][text] += row["jobs"]
+            for key, jobs in counts.items():
+                entries.append([spellings[key].most_common(1)[0][0], kind, jobs])
+        entries.sort(key=lambda entry: (-entry[2], entry[0]))
+
+        version = str(time.time_ns())
+        old_version = utils.redis_client.get(self.version_key)
+        pipe = utils.redis_client.pipeline()
+        pipe.set(f"{self.data_key_prefix}{version}", json.dumps(entries))
+        pipe.set(self.version_key, version)
+        pipe.delete(self.rebuild_lock_key)
+        if old_version:
+            # Processes still on the old version reload on their next request.
+            pipe.expire(f"{self.data_key_prefix}{old_version}", 60)
+        pipe.execute()
+        logger.info(f"Suggestion index rebuilt with {len(entries)} terms.")
+        return len(entries)
+
+    def _schedule_rebuild(self):
+        """Enqueue one ``refresh_suggest_index`` per ``REBUILD_LOCK_TIMEOUT``."""
+        from .tasks import refresh_suggest_index
+
+        if utils.redis_client.set(
+            self.rebuild_lock_key, 1, nx=True, ex=self.REBUILD_LOCK_TIMEOUT
+        ):
+            refresh_suggest_index.delay()
+
+    def _index(self) -> Optional[_LoadedIndex]:
+        version = utils.redis_client.get(self.version_key)
+        if version is None:
+            # Never built (or Redis was flushed): rebuild in the background
+            # instead of in every keystroke request that sees the missing key.
+            self._schedule_rebuild()
+            return None
+        loaded = SuggestIndex._loaded
+        if loaded and loaded[0] == version:
+            return loaded[1]
+        with SuggestIndex._load_lock:
+            loaded = SuggestIndex._loaded
+            if loaded and loaded[0] == version:
+                return loaded[1]
+            data = utils.redis_client.get(f"{self.data_key_prefix}{version}")
+            if data is None:
+                return loaded[1] if loaded else None
+            index = _LoadedIndex(json.loads(data))
+            SuggestIndex._loaded = (version, index)
+            return index
+
+    def suggest(
+        self, query: str, limit: int = 10, kind: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Return up to ``limit`` titles/company names for a prefix or misspelled query.
+
+        Prefix matches on any word come first, most jobs first. If they don't
+        fill ``limit``, trigram matches tolerant of typos are added.
+
+        Returns:
+            dict: ``suggestions`` (text, type, job count) and whether any are ``fuzzy``.
+        """
+        query = normalize(query)
+        index = self._index() if query else None
+        if index is None:
+            return {"suggestions": [], "fuzzy": False}
+
+        def wanted(entry_index):
+            return kind is None or index.entries[entry_index][1] == kind
+
+        chosen = index.prefix_matches(query, kind)[:limit]
+        fuzzy = False
+        if len(chosen) < limit:
+            seen = set(chosen)
+            extra = heapq.nsmallest(
+                limit - len(chosen),
+                (
+                    (-score, entry_index)
+                    for score, entry_index in index.fuzzy_matches(query)
+                    if entry_index not in seen and wanted(entry_index)
+                ),
+            )
+            fuzzy = bool(extra)
+            chosen += [entry_index for _, entry_index in extra]
+
+        suggestions = []
+        for entry_index in chosen:
+            text, entry_kind, jobs = index.entries[entry_index]
+            suggestions.append({"text": text, "type": entry_kind, "count": jobs})
+        return {"suggestions": suggestions, "fuzzy": fuzzy}
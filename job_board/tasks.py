@@ -1,19 +1,48 @@
+import hashlib
+import itertools
+import json
 import logging
-from celery import shared_task
-from django.db import transaction
+import requests
+import time
+import uuid
+from celery import chord, shared_task
+from django.conf import settings
+from django.db import DatabaseError, transaction
 from django.utils import timezone
 from datetime import timedelta, datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from pytz import UTC
-from job_board.models import Job
+from job_board.models import Job, SyncState
 from pathlib import Path
 import glob
 from aplica_backend.settings import LOGS_DIR
-from .utils import fetch_hirebase_jobs
+from .cache import bump_dataset_generation
+from .checkpoint import SyncCheckpoint
+from .dates import parse_datetime
+from .suggest import SuggestIndex
+from .telemetry import IngestionMetrics
+from .http_cache import job_surrogate_keys
+from .locations import prune_locations, sync_job_locations
+from .pipeline import PagePrefetcher, pipeline_report
+from .purge import purge_surrogate_keys
+from .ranges import RANGE_FIELDS, range_columns
+from .rendering import render_job_json
+from .utils import (
+    fetch_hirebase_jobs,
+    get_hirebase_client,
+    redis_client,
+    stream_hirebase_jobs,
+)
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+HIREBASE_SOURCE = "hirebase"
+
+# Parallel runs store the page after which outstanding pages should be skipped.
+HIREBASE_CANCEL_KEY_PREFIX = "job_board:hirebase:cancel_after:"
+HIREBASE_CANCEL_TIMEOUT = 60 * 60 * 24  # 24 hours
+
 
 @shared_task
 def dummy_task():
@@ -24,9 +53,24 @@ def dummy_task():
 def delete_old_jobs():
     cutoff = timezone.now() - timedelta(days=7)
     old_jobs = Job.objects.filter(created_at__lt=cutoff)
+    surrogate_keys = job_surrogate_keys(
+        old_jobs.values_list("locations", flat=True).iterator()
+    )
     count = old_jobs.count()
     old_jobs.delete()
     logger.info(f"Deleted {count} jobs older than 7 days.")
+    if count:
+        pruned = prune_locations()
+        logger.info(f"Deleted {pruned} locations without jobs.")
+        bump_dataset_generation()
+        purge_surrogate_keys(surrogate_keys)
+        refresh_suggest_index.delay()
+
+
+@shared_task
+def refresh_suggest_index():
+    """Rebuild the title/company suggestion index from the current jobs."""
+    return SuggestIndex().rebuild()
 
 
 @shared_task
@@ -75,44 +119,267 @@ def cleanup_old_logs():
         logger.error(f"Error during log cleanup: {e}")
 
 
-def parse_datetime(date_string: str) -> Optional[datetime]:
-    """Parse datetime string to Django datetime object with timezone awareness."""
-    if not date_string:
-        return None
+# Columns rewritten when an existing job is re-synced. ``created_at`` is left
+# out so the original ingestion time survives upserts.
+JOB_UPSERT_FIELDS = [
+    "job_title",
+    "description",
+    "application_link",
+    "job_categories",
+    "job_type",
+    "location_type",
+    "yoe_range",
+    "date_posted",
+    "company_name",
+    "company_link",
+    "company_logo",
+    "requirements_summary",
+    "locations",
+    "salary_range",
+    "company_data",
+    "visa_sponsored",
+    "company_slug",
+    "job_slug",
+    "job_meta",
+    "score",
+    "content_hash",
+    *RANGE_FIELDS,
+    "rendered_json",
+    "updated_at",
+]
 
-    # Handle different datetime formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%d",
-        "%Y-%m-%d %H:%M:%S",
-    ]
 
-    for fmt in formats:
-        try:
-            parsed_datetime = datetime.strptime(date_string, fmt)
-            # Make timezone-aware if it's naive
-            if timezone.is_naive(parsed_datetime):
-                parsed_datetime = timezone.make_aware(parsed_datetime, timezone=UTC)
-            return parsed_datetime
-        except Exception:
-            continue
+def get_job_id(job_data: Dict[str, Any]) -> Optional[str]:
+    """Return the Hirebase job ID, which may be sent as ``_id`` or ``id``."""
+    return job_data.get("_id") or job_data.get("id")
 
-    return None
 
+def compute_content_hash(fields: Dict[str, Any]) -> str:
+    """Return a stable SHA-256 fingerprint of normalized job field values."""
+    encoded = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
-@shared_task
-def hirebase_page_task(page: int, limit: int = 100):
-    """Fetch and process a single page of job data from Hirebase API."""
-    data = fetch_hirebase_jobs(page, limit)
-    if not data:
-        return
-    jobs = data.get("jobs", [])
+
+def job_defaults(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a Hirebase job payload to ``Job`` field values, including its content hash."""
+    defaults = {
+        "job_title": job_data.get("job_title"),
+        "description": job_data.get("description", ""),
+        "application_link": job_data.get("application_link") or job_data.get("url", ""),
+        "job_categories": job_data.get("job_categories"),
+        "job_type": job_data.get("job_type"),
+        "location_type": job_data.get("location_type"),
+        "yoe_range": job_data.get("yoe_range"),
+        "date_posted": parse_datetime(job_data.get("date_posted")),
+        "company_name": job_data.get("company_name"),
+        "company_link": job_data.get("company_link"),
+        "company_logo": job_data.get("company_logo"),
+        "requirements_summary": job_data.get("requirements_summary"),
+        "locations": job_data.get("locations"),
+        "salary_range": job_data.get("salary_range"),
+        "company_data": job_data.get("company_data"),
+        "visa_sponsored": job_data.get("visa_sponsored") or False,
+        "company_slug": job_data.get("company_slug"),
+        "job_slug": job_data.get("job_slug"),
+        "job_meta": job_data.get("meta"),
+        "score": job_data.get("score"),
+    }
+    # Hash before defaulting date_posted so a missing date doesn't change it every run.
+    defaults["content_hash"] = compute_content_hash(defaults)
+    if defaults["date_posted"] is None:
+        defaults["date_posted"] = timezone.now()
+    # Derived from the hashed ranges, so they stay out of the hash.
+    defaults.update(range_columns(defaults["salary_range"], defaults["yoe_range"]))
+    return defaults
+
+
+def _upsert_job_row(job: Job) -> List[str]:
+    """Write a single job with ``update_or_create``; used for rows a batch rejected."""
+    defaults = {field: getattr(job, field) for field in JOB_UPSERT_FIELDS}
+    defaults.pop("updated_at")
+    try:
+        with transaction.atomic():
+            Job.objects.update_or_create(_id=job._id, defaults=defaults)
+    except Exception as e:
+        logger.error(f"Error processing Hirebase job {job._id}: {e}")
+        return []
+    return [job._id]
+
+
+def _bulk_upsert_jobs(jobs: List[Job]) -> List[str]:
+    """
+    Insert or update ``jobs`` with a single ``INSERT ... ON CONFLICT`` statement.
+
+    If the database rejects the batch, it is split in half and each half is
+    retried, so only the offending rows end up on the per-row fallback path.
+
+    Returns:
+        list: IDs of the jobs that were written.
+    """
     if not jobs:
+        return []
+    try:
+        with transaction.atomic():
+            Job.objects.bulk_create(
+                jobs,
+                update_conflicts=True,
+                unique_fields=["_id"],
+                update_fields=JOB_UPSERT_FIELDS,
+            )
+    except DatabaseError as e:
+        if len(jobs) == 1:
+            return _upsert_job_row(jobs[0])
+        logger.warning(
+            f"Bulk upsert of {len(jobs)} jobs failed ({e}); splitting the batch."
+        )
+        middle = len(jobs) // 2
+        return _bulk_upsert_jobs(jobs[:middle]) + _bulk_upsert_jobs(jobs[middle:])
+    return [job._id for job in jobs]
+
+
+def _upsert_job_batch(jobs: List[Dict[str, Any]], counts: Dict[str, int]):
+    """Upsert one batch of Hirebase jobs, adding the outcome to ``counts``."""
+    rows: Dict[str, Job] = {}
+    for job_data in jobs:
+        if not isinstance(job_data, dict):
+            logger.warning(f"Skipping job that is not an object: {job_data!r}")
+            counts["failed"] += 1
+            continue
+        job_id = get_job_id(job_data)
+        if not job_id:
+            logger.warning(f"Skipping job without ID: {job_data}")
+            continue
+        rows[job_id] = Job(_id=job_id, **job_defaults(job_data))
+    if not rows:
+        return
+
+    existing_hashes = dict(
+        Job.objects.filter(_id__in=list(rows)).values_list("_id", "content_hash")
+    )
+    pending = []
+    for job_id, job in rows.items():
+        if job_id in existing_hashes and existing_hashes[job_id] == job.content_hash:
+            counts["unchanged"] += 1
+        else:
+            job.rendered_json = render_job_json(job)
+            pending.append(job)
+
+    written_ids = _bulk_upsert_jobs(pending)
+    sync_job_locations({job_id: rows[job_id].locations for job_id in written_ids})
+    created_count = sum(1 for job_id in written_ids if job_id not in existing_hashes)
+    counts["failed"] += len(pending) - len(written_ids)
+    counts["created"] += created_count
+    counts["changed"] += len(written_ids) - created_count
+
+
+def upsert_jobs(jobs: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Upsert Hirebase jobs in bulk, skipping rows whose content is unchanged.
+
+    Jobs are consumed in batches of ``HIREBASE_UPSERT_BATCH_SIZE``, so a
+    streamed page never has to be held in memory at once. For each batch the
+    stored content hashes are fetched in one query and only new or changed
+    rows are written. Works on both PostgreSQL and SQLite, which support
+    ``ON CONFLICT DO UPDATE``.
+
+    Returns:
+        dict: Number of ``created``, ``changed``, ``unchanged`` and ``failed`` jobs.
+    """
+    counts = {"created": 0, "changed": 0, "unchanged": 0, "failed": 0}
+    batch = []
+    for job_data in jobs:
+        batch.append(job_data)
+        if len(batch) >= settings.HIREBASE_UPSERT_BATCH_SIZE:
+            _upsert_job_batch(batch, counts)
+            batch = []
+    _upsert_job_batch(batch, counts)
+    return counts
+
+
+Watermark = Tuple[datetime, Set[str]]
+# Page result when another sync has taken over the run's sync lock.
+LOCK_LOST = "lock_lost"
+
+
+def load_watermark() -> Optional[Watermark]:
+    """Return the Hirebase high-water ``date_posted`` and boundary IDs, if any."""
+    state = SyncState.objects.filter(source=HIREBASE_SOURCE).first()
+    if not state or not state.high_water_date_posted:
+        return None
+    return state.high_water_date_posted, set(state.boundary_ids or [])
+
+
+class _PageTracker:
+    """Record the newest jobs on a page and whether it reaches the sync watermark."""
+
+    def __init__(self, watermark: Optional[Watermark]):
+        self.watermark = watermark
+        self.max_date_posted = None
+        self.max_date_ids = []
+        self.crossed_watermark = False
+
+    def observe(self, jobs: Iterable[Dict[str, Any]]):
+        for job_data in jobs:
+            if not isinstance(job_data, dict):
+                # Left for the upsert to skip and count as failed.
+                yield job_data
+                continue
+            date_posted = parse_datetime(job_data.get("date_posted"))
+            job_id = get_job_id(job_data)
+            if date_posted and job_id:
+                if self.max_date_posted is None or date_posted > self.max_date_posted:
+                    self.max_date_posted = date_posted
+                    self.max_date_ids = [job_id]
+                elif date_posted == self.max_date_posted:
+                    self.max_date_ids.append(job_id)
+                if self.watermark:
+                    high_water, boundary_ids = self.watermark
+                    if date_posted < high_water or (
+                        date_posted == high_water and job_id in boundary_ids
+                    ):
+                        self.crossed_watermark = True
+            yield job_data
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "max_date_posted": (
+                self.max_date_posted.isoformat() if self.max_date_posted else None
+            ),
+            "max_date_ids": self.max_date_ids,
+            "crossed_watermark": self.crossed_watermark,
+        }
+
+
+def process_hirebase_page(
+    page: int, jobs: Iterable[Dict[str, Any]], watermark: Optional[Watermark] = None
+):
+    """
+    Apply the date cutoff to a page of jobs and upsert them.
+
+    ``jobs`` may be a list or a generator over a streamed response; only the
+    first job is inspected before the rest are consumed.
+
+    Returns:
+        "stop" if the page is past the 8-day cutoff, None when the page has no
+        jobs, otherwise the upsert counts, the seconds spent writing them
+        (including decoding, for a streamed page), the page's newest
+        ``date_posted``, the IDs posted at that time and whether the page
+        reached ``watermark``.
+    """
+    jobs = iter(jobs)
+    # Items that aren't objects are passed on for the upsert to count as failed;
+    # the date cutoff is checked on the first job object.
+    skipped = []
+    first_job = None
+    for item in jobs:
+        if isinstance(item, dict):
+            first_job = item
+            break
+        skipped.append(item)
+    if first_job is None and not skipped:
         logger.info(f"No jobs found on page {page}.")
         return
-    date_posted = jobs[0].get("date_posted")
-    parsed_date = parse_datetime(date_posted)
+    parsed_date = first_job and parse_datetime(first_job.get("date_posted"))
     if parsed_date:
         days_diff = (timezone.now() - parsed_date).days
         logger.info(
@@ -128,96 +395,574 @@ def hirebase_page_task(page: int, limit: int = 100):
             f"Could not parse date_posted for first job on page {page}. Proceeding with page."
         )
 
-    page_created_count = 0
-    page_updated_count = 0
-    for job_data in jobs:
+    tracker = _PageTracker(watermark)
+    started = time.monotonic()
+    first = [first_job] if first_job is not None else []
+    counts = upsert_jobs(tracker.observe(itertools.chain(skipped, first, jobs)))
+    counts["write_seconds"] = time.monotonic() - started
+    logger.info(
+        f"Page {page}: Created {counts['created']} jobs, Changed {counts['changed']} jobs, "
+        f"Unchanged {counts['unchanged']} jobs, Failed {counts['failed']} jobs."
+    )
+    counts.update(tracker.summary())
+    return counts
+
+
+def fetch_and_process_page(
+    page: int, limit: int, watermark: Optional[Watermark] = None
+):
+    """
+    Fetch a page (streamed when ``HIREBASE_STREAMING`` is on) and process it.
+
+    Returns:
+        tuple: The ``process_hirebase_page`` result (with ``parse_seconds``
+        added for a processed page), the page's top-level metadata such as
+        ``total_pages`` (None if the fetch failed), and the seconds spent
+        fetching (time to headers when streaming).
+    """
+    started = time.monotonic()
+    if not settings.HIREBASE_STREAMING:
+        data = fetch_hirebase_jobs(page, limit)
+        if not data:
+            return None, None, time.monotonic() - started
+        parse_seconds = getattr(data, "decode_seconds", 0.0)
+        fetch_seconds = time.monotonic() - started - parse_seconds
+        result = process_hirebase_page(page, data.get("jobs", []), watermark)
+        if isinstance(result, dict):
+            result["parse_seconds"] = parse_seconds
+        return result, data, fetch_seconds
+
+    page_stream = stream_hirebase_jobs(page, limit)
+    fetch_seconds = time.monotonic() - started
+    if page_stream is None:
+        return None, None, fetch_seconds
+    timings = {"parse_seconds": 0.0}
+    try:
+        with page_stream:
+            result = process_hirebase_page(
+                page, _timed_items(page_stream.items(), timings), watermark
+            )
+            finish_started = time.monotonic()
+            page_stream.finish()
+            timings["parse_seconds"] += time.monotonic() - finish_started
+    except (requests.RequestException, ValueError) as e:
+        logger.error(f"Error while streaming Hirebase page {page}: {e}")
+        return None, None, fetch_seconds
+    if isinstance(result, dict):
+        result["parse_seconds"] = timings["parse_seconds"]
+        result["write_seconds"] = max(
+            0.0, result["write_seconds"] - timings["parse_seconds"]
+        )
+    return result, page_stream.meta, fetch_seconds
+
+
+def _timed_items(items: Iterable[Any], timings: Dict[str, float]) -> Iterator[Any]:
+    """Yield from ``items``, adding the time spent producing them to ``parse_seconds``."""
+    items = iter(items)
+    while True:
+        started = time.monotonic()
         try:
-            with transaction.atomic():
-                job_id = job_data.get("_id") or job_data.get("id")
-                if not job_id:
-                    logger.warning(f"Skipping job without ID: {job_data}")
-                    continue
-                date_posted = parse_datetime(job_data.get("date_posted"))
-                _, created = Job.objects.update_or_create(
-                    _id=job_id,
-                    defaults={
-                        "job_title": job_data.get("job_title"),
-                        "description": job_data.get("description", ""),
-                        "application_link": job_data.get("application_link")
-                        or job_data.get("url", ""),
-                        "job_categories": job_data.get("job_categories"),
-                        "job_type": job_data.get("job_type"),
-                        "location_type": job_data.get("location_type"),
-                        "yoe_range": job_data.get("yoe_range"),
-                        "date_posted": date_posted or timezone.now(),
-                        "company_name": job_data.get("company_name"),
-                        "company_link": job_data.get("company_link"),
-                        "company_logo": job_data.get("company_logo"),
-                        "requirements_summary": job_data.get("requirements_summary"),
-                        "locations": job_data.get("locations"),
-                        "salary_range": job_data.get("salary_range"),
-                        "company_data": job_data.get("company_data"),
-                        "visa_sponsored": job_data.get("visa_sponsored"),
-                        "company_slug": job_data.get("company_slug"),
-                        "job_slug": job_data.get("job_slug"),
-                        "job_meta": job_data.get("meta"),
-                        "score": job_data.get("score"),
-                    },
-                )
-                if created:
-                    page_created_count += 1
-                else:
-                    page_updated_count += 1
-        except Exception as e:
-            logger.error(
-                f"Error processing Hirebase job {job_data.get('id', job_data.get('_id', 'unknown'))}: {e}"
+            item = next(items)
+        except StopIteration:
+            timings["parse_seconds"] += time.monotonic() - started
+            return
+        timings["parse_seconds"] += time.monotonic() - started
+        yield item
+
+
+def _cancel_key(run_id: str) -> str:
+    return f"{HIREBASE_CANCEL_KEY_PREFIX}{run_id}"
+
+
+def _cancel_pages_after(run_id: str, page: int):
+    """Tell in-flight page tasks of a parallel run to skip pages after ``page``."""
+    key = _cancel_key(run_id)
+    current = redis_client.get(key)
+    if current is None or page < int(current):
+        redis_client.set(key, page, ex=HIREBASE_CANCEL_TIMEOUT)
+
+
+def _is_page_cancelled(run_id: str, page: int) -> bool:
+    cancel_after = redis_client.get(_cancel_key(run_id))
+    return cancel_after is not None and page > int(cancel_after)
+
+
+@shared_task
+def hirebase_page_task(
+    page: int,
+    limit: int = 100,
+    run_id: Optional[str] = None,
+    use_watermark: bool = False,
+    lock_token: Optional[str] = None,
+):
+    """
+    Fetch and process a single page of job data from Hirebase API.
+
+    With ``use_watermark`` the page reports whether it reached the stored sync
+    watermark. When called for a ``hirebase_task`` run (``run_id`` set) the
+    outcome is recorded on the run's checkpoint, and a page that ends the sync
+    makes later pages of the same run skip their fetch. With ``lock_token``
+    the run's sync lock is refreshed first; if another sync has taken it over,
+    the page is skipped and "lock_lost" returned.
+    """
+    if run_id and _is_page_cancelled(run_id, page):
+        logger.info(f"Skipping page {page}; run {run_id} was stopped.")
+        return "cancelled"
+    if lock_token and not SyncCheckpoint().refresh_lock(lock_token):
+        logger.warning(f"Skipping page {page}; another sync took over run {run_id}.")
+        return LOCK_LOST
+    watermark = load_watermark() if use_watermark else None
+    result, _, fetch_seconds = fetch_and_process_page(page, limit, watermark)
+    if isinstance(result, dict):
+        result["fetch_seconds"] = fetch_seconds
+    if run_id:
+        _record_page(SyncCheckpoint(), page, result)
+        if result == "stop" or (
+            isinstance(result, dict) and result["crossed_watermark"]
+        ):
+            _cancel_pages_after(run_id, page)
+    return result
+
+
+def _lock_lost(results: Iterable[Any]) -> bool:
+    if any(result == LOCK_LOST for result in results):
+        logger.warning("Stopping Hirebase task. Another sync holds the sync lock.")
+        return True
+    return False
+
+
+def _record_page(checkpoint: SyncCheckpoint, page: int, result):
+    """Mark a processed page as completed, or a page that couldn't be fetched as failed."""
+    if isinstance(result, dict):
+        checkpoint.mark_completed(page)
+    elif result is None:
+        logger.warning(f"Page {page} could not be fetched; added to the retry list.")
+        checkpoint.mark_failed(page)
+
+
+def _new_sync_state(run_id: str, mode: str, first_run: bool) -> Dict[str, Any]:
+    return {
+        "run_id": run_id,
+        "mode": mode,
+        "first_run": first_run,
+        "started_at": time.time(),
+        "totals": {"created": 0, "changed": 0, "unchanged": 0, "failed": 0},
+        "unchanged_pages": 0,
+        "fetched_pages": 0,
+        "fetch_seconds": 0.0,
+        "parse_seconds": 0.0,
+        "write_seconds": 0.0,
+        "failed_pages": [],
+        "high_water": None,
+        "high_water_ids": [],
+    }
+
+
+def _apply_page_result(
+    state: Dict[str, Any], page: int, result, first_run: bool
+) -> bool:
+    """
+    Fold a page result into the running sync state.
+
+    Returns:
+        bool: True if the sync should stop after this page.
+    """
+    if state.get("record_telemetry", True):
+        IngestionMetrics().record_page(result)
+    if result == "stop":
+        logger.info("Stopping Hirebase task. 8 days old jobs found.")
+        return True
+    if result is None:
+        state["failed_pages"].append(page)
+        return False
+    if not isinstance(result, dict):
+        return False
+    for key in state["totals"]:
+        state["totals"][key] += result[key]
+    if "fetch_seconds" in result:
+        state["fetched_pages"] += 1
+        state["fetch_seconds"] += result["fetch_seconds"]
+    state["parse_seconds"] += result.get("parse_seconds", 0.0)
+    state["write_seconds"] += result["write_seconds"]
+    if result["max_date_posted"]:
+        page_high_water = datetime.fromisoformat(result["max_date_posted"])
+        high_water = state["high_water"] and datetime.fromisoformat(state["high_water"])
+        if not high_water or page_high_water > high_water:
+            state["high_water"] = result["max_date_posted"]
+            state["high_water_ids"] = result["max_date_ids"]
+        elif page_high_water == high_water:
+            state["high_water_ids"] += result["max_date_ids"]
+    if result["crossed_watermark"]:
+        logger.info(f"Stopping Hirebase task. Page {page} reached the sync watermark.")
+        return True
+    if not result["created"] and not result["changed"]:
+        state["unchanged_pages"] += 1
+    else:
+        state["unchanged_pages"] = 0
+    if state["unchanged_pages"] == 5 and not first_run:
+        logger.info(
+            "Stopping Hirebase task. 5 consecutive pages without new or changed jobs found."
+        )
+        return True
+    return False
+
+
+def _save_watermark(state: Dict[str, Any]):
+    """Advance the stored watermark to the newest job seen by a successful run."""
+    sync_state, _ = SyncState.objects.get_or_create(source=HIREBASE_SOURCE)
+    if state["high_water"]:
+        high_water = datetime.fromisoformat(state["high_water"])
+        current = sync_state.high_water_date_posted
+        if current is None or high_water > current:
+            sync_state.high_water_date_posted = high_water
+            sync_state.boundary_ids = sorted(set(state["high_water_ids"]))
+        elif high_water == current:
+            sync_state.boundary_ids = sorted(
+                set(sync_state.boundary_ids or []) | set(state["high_water_ids"])
             )
-            continue
+    sync_state.last_success_at = timezone.now()
+    sync_state.save()
+    logger.info(f"Hirebase sync watermark: {sync_state.high_water_date_posted}")
+
+
+def _finish_sync(
+    state: Dict[str, Any], total_pages: int, limit: int, run_id: str, first_run: bool
+):
+    """
+    Retry the run's failed pages once, log the totals and close the checkpoint.
+
+    If every page was eventually fetched, the checkpoint is cleared and the
+    watermark advanced. Otherwise the checkpoint and its retry list are kept,
+    so the next ``hirebase_task`` resumes the run and retries those pages.
+    """
+    retry_pages = state["failed_pages"]
+    if retry_pages:
+        logger.info(f"Retrying pages that could not be fetched: {retry_pages}.")
+        state["failed_pages"] = []
+        for page in retry_pages:
+            result = hirebase_page_task(
+                page, limit, run_id, not first_run, state.get("lock_token")
+            )
+            if _lock_lost([result]):
+                return
+            _apply_page_result(state, page, result, first_run)
+    _log_sync_totals(state, total_pages)
+    if state.get("refresh_derived", True):
+        _refresh_derived_data(state)
+    if state["failed_pages"]:
+        logger.warning(
+            f"Pages {state['failed_pages']} still could not be fetched; keeping them on "
+            "the checkpoint retry list and not advancing the sync watermark."
+        )
+        _record_sync_run(state, "incomplete")
+        SyncCheckpoint().release_lock(state.get("lock_token"))
+        return
+    checkpoint = SyncCheckpoint()
+    checkpoint.clear()
+    _save_watermark(state)
+    _record_sync_run(state, "complete")
+    checkpoint.release_lock(state.get("lock_token"))
+
+
+def _refresh_derived_data(state: Dict[str, Any]):
+    """
+    Refresh data derived from the jobs table if the run wrote anything.
+
+    The CDN purge covers the listings the run's jobs now appear in; a changed
+    job that moved location stays in its old location's cached listings until
+    they expire.
+    """
+    totals = state["totals"]
+    if totals["created"] or totals["changed"]:
+        bump_dataset_generation()
+        written = Job.objects.filter(
+            updated_at__gte=datetime.fromtimestamp(state["started_at"], UTC)
+        )
+        purge_surrogate_keys(
+            job_surrogate_keys(written.values_list("locations", flat=True).iterator())
+        )
+        refresh_suggest_index.delay()
+
+
+def _record_sync_run(state: Dict[str, Any], status: str):
+    """Add the run to the telemetry list of recent syncs."""
+    if not state.get("record_telemetry", True):
+        return
+    finished = time.time()
+    duration = finished - state["started_at"]
+    rows = sum(state["totals"].values())
+    IngestionMetrics().record_run(
+        {
+            "run_id": state["run_id"],
+            "mode": state["mode"],
+            "first_run": state["first_run"],
+            "status": status,
+            "started_at": datetime.fromtimestamp(state["started_at"], UTC).isoformat(),
+            "finished_at": datetime.fromtimestamp(finished, UTC).isoformat(),
+            "finished_timestamp": round(finished, 3),
+            "duration_seconds": round(duration, 3),
+            "rows_per_second": round(rows / duration, 1) if duration else 0.0,
+            **_sync_summary(state),
+            "failed_pages": state["failed_pages"],
+        }
+    )
+
+
+def _log_sync_totals(state: Dict[str, Any], total_pages: int):
+    totals = state["totals"]
+    logger.info(f"Completed processing {total_pages} pages.")
+    logger.info(f"Total created: {totals['created']}")
+    logger.info(f"Total changed: {totals['changed']}")
+    logger.info(f"Total unchanged: {totals['unchanged']}")
+    logger.info(f"Total failed: {totals['failed']}")
+    if state["fetched_pages"]:
+        logger.info(
+            f"Hirebase fetch time: {state['fetch_seconds']:.1f}s over {state['fetched_pages']} pages "
+            f"({state['fetch_seconds'] / state['fetched_pages']:.2f}s per page)."
+        )
+    logger.info(f"JSON parse time: {state['parse_seconds']:.1f}s.")
+    logger.info(f"Database write time: {state['write_seconds']:.1f}s.")
+    logger.info(
+        f"Hirebase client stats (this worker): {get_hirebase_client().stats.snapshot()}"
+    )
+
+
+def _sync_summary(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the run's row counts, processed pages and fetch/parse/write seconds."""
+    return {
+        **state["totals"],
+        "pages": state["fetched_pages"],
+        "fetch_seconds": round(state["fetch_seconds"], 3),
+        "parse_seconds": round(state["parse_seconds"], 3),
+        "write_seconds": round(state["write_seconds"], 3),
+    }
+
+
+def _dispatch_hirebase_window(
+    pages: List[int],
+    total_pages: int,
+    limit: int,
+    concurrency: int,
+    first_run: bool,
+    run_id: str,
+    state: Dict[str, Any],
+):
+    """Run the next ``concurrency`` pages as a chord that reports to hirebase_window_task."""
+    window, remaining = pages[:concurrency], pages[concurrency:]
+    logger.info(f"Dispatching pages {window[0]}-{window[-1]} for run {run_id}.")
+    chord(
+        hirebase_page_task.s(
+            page, limit, run_id, not first_run, state.get("lock_token")
+        )
+        for page in window
+    )(
+        hirebase_window_task.s(
+            window, remaining, total_pages, limit, concurrency, first_run, run_id, state
+        )
+    )
+
+
+@shared_task
+def hirebase_window_task(
+    results,
+    window: List[int],
+    remaining: List[int],
+    total_pages: int,
+    limit: int,
+    concurrency: int,
+    first_run: bool,
+    run_id: str,
+    state: Dict[str, Any],
+):
+    """Chord callback: apply a window of page results and dispatch the next window."""
+    if _lock_lost(results):
+        return
+    stop = False
+    for page, result in zip(window, results):
+        stop = _apply_page_result(state, page, result, first_run) or stop
+    if stop or not remaining:
+        _finish_sync(state, total_pages, limit, run_id, first_run)
+        redis_client.delete(_cancel_key(run_id))
+        return _sync_summary(state)
+    _dispatch_hirebase_window(
+        remaining, total_pages, limit, concurrency, first_run, run_id, state
+    )
+
+
+def _run_pipelined(
+    pages: List[int],
+    limit: int,
+    first_run: bool,
+    state: Dict[str, Any],
+    watermark: Optional[Watermark] = None,
+):
+    """
+    Process pages in order while the next ``HIREBASE_PREFETCH_PAGES`` pages download.
+
+    Prefetched pages are always decoded whole; ``HIREBASE_STREAMING`` only
+    applies to the serial and parallel modes.
+    """
+    if settings.HIREBASE_STREAMING:
+        logger.warning(
+            "HIREBASE_STREAMING is not supported in pipelined mode; "
+            "prefetched pages are decoded whole."
+        )
+    checkpoint = SyncCheckpoint()
+    started = time.monotonic()
+    write_seconds = 0.0
+    with PagePrefetcher(
+        pages,
+        limit=limit,
+        window=settings.HIREBASE_PREFETCH_PAGES,
+        fetch=fetch_hirebase_jobs,
+    ) as prefetcher:
+        for page, data, fetch_seconds in prefetcher:
+            if not checkpoint.refresh_lock(state["lock_token"]):
+                _lock_lost([LOCK_LOST])
+                state["lock_lost"] = True
+                break
+            if not data:
+                _record_page(checkpoint, page, None)
+                _apply_page_result(state, page, None, first_run)
+                continue
+            logger.info(f"Processing page {page}.")
+            write_started = time.monotonic()
+            result = process_hirebase_page(page, data.get("jobs", []), watermark)
+            write_seconds += time.monotonic() - write_started
+            if isinstance(result, dict):
+                parse_seconds = getattr(data, "decode_seconds", 0.0)
+                result["fetch_seconds"] = fetch_seconds - parse_seconds
+                result["parse_seconds"] = parse_seconds
+            _record_page(checkpoint, page, result)
+            if _apply_page_result(state, page, result, first_run):
+                break
+        report = pipeline_report(
+            time.monotonic() - started,
+            prefetcher.fetch_seconds,
+            prefetcher.wait_seconds,
+            write_seconds,
+        )
     logger.info(
-        f"Page {page}: Created {page_created_count} jobs, Updated {page_updated_count} jobs."
+        f"Pipelined {prefetcher.fetched_pages} pages in {report['wall_seconds']}s: "
+        f"fetch {report['fetch_seconds']}s (waited {report['fetch_wait_seconds']}s), "
+        f"write {report['write_seconds']}s, {report['overlap_seconds']}s overlapped "
+        f"({report['speedup']}x vs. sequential)."
     )
-    return page_created_count, page_updated_count
+    state["pipeline"] = report
 
 
 @shared_task
-def hirebase_task(first_run: bool = False):
-    """Main task to fetch pagination info and process each page one by one."""
-    data = fetch_hirebase_jobs(1, 100)
-    if not data:
+def hirebase_task(
+    first_run: bool = False,
+    mode: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    refresh_derived: bool = True,
+    record_telemetry: bool = True,
+):
+    """
+    Main task to fetch pagination info and process every page.
+
+    Args:
+        first_run (bool): Full resync: ignore the stored sync watermark and the
+            consecutive-unchanged-pages stop rule. Incremental runs stop at the
+            first page that reaches the watermark left by the last successful run.
+            If an earlier run was interrupted, it is resumed from its checkpoint
+            (with its own ``first_run``) instead: completed pages are skipped and
+            failed pages retried.
+        mode (str): "serial" processes pages one by one in this task; "pipelined"
+            also processes them in this task but prefetches the next
+            ``HIREBASE_PREFETCH_PAGES`` pages while writing; "parallel" fans pages
+            out as Celery chords of ``concurrency`` pages at a time.
+            Defaults to ``settings.HIREBASE_INGESTION_MODE``.
+        concurrency (int): Pages in flight per window in parallel mode.
+            Defaults to ``settings.HIREBASE_CONCURRENCY``.
+        refresh_derived (bool): Bump the dataset generation, purge the CDN and
+            rebuild the suggestion index after writing. Benchmarks turn it off.
+        record_telemetry (bool): Record page metrics and the run summary served
+            by ``/metrics/`` and ``hirebase_sync_runs``. Benchmarks turn it off.
+    """
+    mode = mode or settings.HIREBASE_INGESTION_MODE
+    concurrency = max(1, concurrency or settings.HIREBASE_CONCURRENCY)
+    limit = settings.HIREBASE_PAGE_LIMIT
+    get_hirebase_client().stats.reset()
+
+    checkpoint = SyncCheckpoint()
+    # Held (and refreshed per page) for the whole run, so a checkpoint is only
+    # resumed once the run that wrote it has stopped.
+    lock_token = uuid.uuid4().hex
+    if not checkpoint.acquire_lock(lock_token):
+        logger.info("Another Hirebase sync is running; skipping this one.")
+        return None
+    resumed = checkpoint.load()
+    if resumed and resumed["limit"] == limit:
+        run_id, first_run = resumed["run_id"], resumed["first_run"]
+        completed_pages = checkpoint.completed_pages()
+        logger.info(
+            f"Resuming run {run_id} started at {resumed['started_at']}: "
+            f"{len(completed_pages)} pages already completed, "
+            f"{len(checkpoint.failed_pages())} pages to retry."
+        )
+    else:
+        run_id, completed_pages = uuid.uuid4().hex, set()
+        checkpoint.start(run_id, first_run, limit)
+
+    state = _new_sync_state(run_id, mode, first_run)
+    state["refresh_derived"] = refresh_derived
+    state["record_telemetry"] = record_telemetry
+    state["lock_token"] = lock_token
+    watermark = None if first_run else load_watermark()
+    if watermark:
+        logger.info(f"Incremental sync down to watermark {watermark[0]}.")
+    # Page 1 carries the pagination info, so it is processed as it is fetched.
+    logger.info("Processing page 1.")
+    result, meta, fetch_seconds = fetch_and_process_page(1, limit, watermark)
+    if meta is None:
         logger.error("Failed to fetch initial pagination info from Hirebase.")
+        _apply_page_result(state, 1, None, first_run)
+        _record_sync_run(state, "failed")
+        checkpoint.release_lock(lock_token)
         return
-    total_pages = data.get("total_pages")
+    total_pages = meta.get("total_pages")
     if not total_pages:
         logger.info("No total_pages info in response; will only process first page.")
         total_pages = 1
-    logger.info(f"Processing {total_pages} pages one by one.")
-    limit = 100
-    total_created = 0
-    total_updated = 0
-    updated_counter = 0
-    for page in range(1, total_pages + 1):
-        logger.info(f"Processing page {page}.")
-        result = hirebase_page_task(page, limit)
-        if result == "stop":
-            logger.info("Stopping Hirebase task. 8 days old jobs found.")
-            break
-        elif result:
-            page_created_count, page_updated_count = result
-            total_created += page_created_count
-            total_updated += page_updated_count
-            if page_updated_count == 100:
-                updated_counter += 1
-            else:
-                updated_counter = 0
-            if updated_counter == 5 and not first_run:
-                logger.info(
-                    "Stopping Hirebase task. 5 consecutive pages with 100 updated jobs found."
-                )
-                break
 
-    logger.info(f"Completed processing {total_pages} pages.")
-    logger.info(f"Total created: {total_created}")
-    logger.info(f"Total updated: {total_updated}")
+    if isinstance(result, dict):
+        result["fetch_seconds"] = fetch_seconds
+    _record_page(checkpoint, 1, result)
+    stop = _apply_page_result(state, 1, result, first_run)
+    pages = [page for page in range(2, total_pages + 1) if page not in completed_pages]
+
+    if mode == "parallel" and not stop and pages:
+        logger.info(
+            f"Processing {len(pages)} pages in parallel, {concurrency} at a time (run {run_id})."
+        )
+        _dispatch_hirebase_window(
+            pages, total_pages, limit, concurrency, first_run, run_id, state
+        )
+        return
+
+    if mode == "pipelined" and not stop and pages:
+        logger.info(
+            f"Processing {len(pages)} pages with {settings.HIREBASE_PREFETCH_PAGES} pages prefetched."
+        )
+        _run_pipelined(pages, limit, first_run, state, watermark)
+        if state.get("lock_lost"):
+            return None
+        _finish_sync(state, total_pages, limit, run_id, first_run)
+        return _sync_summary(state)
+
+    logger.info(f"Processing {len(pages)} pages one by one.")
+    for page in pages:
+        if stop:
+            break
+        logger.info(f"Processing page {page}.")
+        result = hirebase_page_task(page, limit, run_id, not first_run, lock_token)
+        if _lock_lost([result]):
+            return None
+        stop = _apply_page_result(state, page, result, first_run)
+    _finish_sync(state, total_pages, limit, run_id, first_run)
+    return _sync_summary(state)
 
 
 @shared_task
@@ -0,0 +1,187 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import redis
+from django.conf import settings
+
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the per-page fetch/parse/write histogram buckets.
+PAGE_SECONDS_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120]
+# Upper bounds of the per-page rows/sec histogram buckets.
+ROWS_PER_SECOND_BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+PAGE_STAGES = ["fetch", "parse", "write"]
+ROW_OUTCOMES = ["created", "changed", "unchanged", "failed"]
+LAST_RUN_GAUGES = [
+    ("duration_seconds", "Wall time of the last sync run."),
+    ("rows_per_second", "Rows per second of the last sync run."),
+    ("pages", "Pages processed by the last sync run."),
+    ("failed_pages", "Pages the last sync run could not fetch."),
+    ("success", "1 if the last sync run fetched every page."),
+    ("finished_timestamp_seconds", "Unix time the last sync run finished."),
+]
+
+
+def _bucket(value: float, bounds: List[float]) -> str:
+    for bound in bounds:
+        if value <= bound:
+            return str(bound)
+    return "+Inf"
+
+
+def _page_status(result) -> Optional[str]:
+    if isinstance(result, dict):
+        return "processed"
+    if result == "stop":
+        return "stop"
+    if result is None:
+        return "failed"
+    return None
+
+
+class IngestionMetrics:
+    """
+    Redis-backed ingestion telemetry shared by every worker.
+
+    Page timings are kept as cumulative Prometheus histograms (bucket counts,
+    sum and count), so rolling views come from ``rate()`` over the scraped
+    series. Row and page counters are cumulative too. The summaries of the
+    last ``HIREBASE_TELEMETRY_RUNS`` sync runs are kept in a capped list.
+
+    Recording never raises: a Redis outage only loses telemetry.
+    """
+
+    KEY_PREFIX = "job_board:telemetry:"
+
+    def __init__(self, source: str = "hirebase"):
+        self.source = source
+        self.histogram_prefix = f"{self.KEY_PREFIX}{source}:histogram:"
+        self.rows_key = f"{self.KEY_PREFIX}{source}:rows"
+        self.pages_key = f"{self.KEY_PREFIX}{source}:pages"
+        self.runs_key = f"{self.KEY_PREFIX}{source}:runs"
+
+    def _observe(self, pipe, name: str, value: float, bounds: List[float]):
+        key = f"{self.histogram_prefix}{name}"
+        pipe.hincrby(key, _bucket(value, bounds), 1)
+        pipe.hincrbyfloat(key, "sum", value)
+        pipe.hincrby(key, "count", 1)
+
+    def record_page(self, result):
+        """Count a page outcome and, for a processed page, its timings and rows."""
+        status = _page_status(result)
+        if status is None:
+            return
+        try:
+            pipe = utils.redis_client.pipeline(transaction=False)
+            pipe.hincrby(self.pages_key, status, 1)
+            if status == "processed":
+                for outcome in ROW_OUTCOMES:
+                    pipe.hincrby(self.rows_key, outcome, result.get(outcome, 0))
+                page_seconds = 0.0
+                for stage in PAGE_STAGES:
+                    seconds = result.get(f"{stage}_seconds")
+                    if seconds is not None:
+                        page_seconds += seconds
+                        self._observe(pipe, stage, seconds, PAGE_SECONDS_BUCKETS)
+                rows = sum(result.get(outcome, 0) for outcome in ROW_OUTCOMES)
+                if rows and page_seconds:
+                    self._observe(
+                        pipe,
+                        "rows_per_second",
+                        rows / page_seconds,
+                        ROWS_PER_SECOND_BUCKETS,
+                    )
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not record page telemetry: {e}")
+
+    def record_run(self, summary: Dict[str, Any]):
+        """Push a finished run's summary onto the capped list of recent runs."""
+        try:
+            pipe = utils.redis_client.pipeline(transaction=False)
+            pipe.lpush(self.runs_key, json.dumps(summary))
+            pipe.ltrim(self.runs_key, 0, settings.HIREBASE_TELEMETRY_RUNS - 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not record sync run telemetry: {e}")
+
+    def recent_runs(self, count: int = 10) -> List[Dict[str, Any]]:
+        """Return up to ``count`` run summaries, newest first."""
+        return [
+            json.loads(run)
+            for run in utils.redis_client.lrange(self.runs_key, 0, count - 1)
+        ]
+
+    def _histogram_lines(
+        self, metric: str, labels: str, name: str, bounds: List[float]
+    ) -> List[str]:
+        values = utils.redis_client.hgetall(f"{self.histogram_prefix}{name}")
+        lines = []
+        cumulative = 0
+        for bound in [str(bound) for bound in bounds] + ["+Inf"]:
+            cumulative += int(values.get(bound, 0))
+            lines.append(f'{metric}_bucket{{{labels}le="{bound}"}} {cumulative}')
+        lines.append(f"{metric}_sum{{{labels.rstrip(',')}}} {values.get('sum', 0)}")
+        lines.append(f"{metric}_count{{{labels.rstrip(',')}}} {values.get('count', 0)}")
+        return lines
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        source = f'source="{self.source}"'
+        lines = []
+
+        metric = "job_board_ingestion_page_seconds"
+        lines.append(
+            f"# HELP {metric} Seconds spent per page fetching, parsing and writing."
+        )
+        lines.append(f"# TYPE {metric} histogram")
+        for stage in PAGE_STAGES:
+            lines += self._histogram_lines(
+                metric, f'{source},stage="{stage}",', stage, PAGE_SECONDS_BUCKETS
+            )
+
+        metric = "job_board_ingestion_page_rows_per_second"
+        lines.append(f"# HELP {metric} Rows processed per second of page time.")
+        lines.append(f"# TYPE {metric} histogram")
+        lines += self._histogram_lines(
+            metric, f"{source},", "rows_per_second", ROWS_PER_SECOND_BUCKETS
+        )
+
+        metric = "job_board_ingestion_rows_total"
+        rows = utils.redis_client.hgetall(self.rows_key)
+        lines.append(f"# HELP {metric} Ingested rows by outcome.")
+        lines.append(f"# TYPE {metric} counter")
+        for outcome in ROW_OUTCOMES:
+            lines.append(
+                f'{metric}{{{source},outcome="{outcome}"}} {rows.get(outcome, 0)}'
+            )
+
+        metric = "job_board_ingestion_pages_total"
+        pages = utils.redis_client.hgetall(self.pages_key)
+        lines.append(f"# HELP {metric} Pages handled by status.")
+        lines.append(f"# TYPE {metric} counter")
+        for status in ["processed", "stop", "failed"]:
+            lines.append(
+                f'{metric}{{{source},status="{status}"}} {pages.get(status, 0)}'
+            )
+
+        last_runs = self.recent_runs(1)
+        if last_runs:
+            run = last_runs[0]
+            values = {
+                "duration_seconds": run["duration_seconds"],
+                "rows_per_second": run["rows_per_second"],
+                "pages": run["pages"],
+                "failed_pages": len(run["failed_pages"]),
+                "success": int(run["status"] == "complete"),
+                "finished_timestamp_seconds": run["finished_timestamp"],
+            }
+            for name, help_text in LAST_RUN_GAUGES:
+                metric = f"job_board_ingestion_last_run_{name}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric}{{{source}}} {values[name]}")
+        return "\n".join(lines) + "\n"
@@ -1 +1,1726 @@
-# Create your tests here.
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import skipUnless
+from unittest.mock import patch
+
+import redis
+import requests
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from . import utils
+from .cache import bump_dataset_generation, filter_signature
+from .checkpoint import SyncCheckpoint
+from .dates import _match_iso_like, legacy_parse_datetime, parse_datetime
+from .filters import JOB_POSTED_STEP, job_posted_cutoff
+from .http_cache import job_surrogate_keys, listing_surrogate_keys
+from .locations import backfill_job_locations
+from .models import Job, Location, SyncState
+from .pipeline import PagePrefetcher
+from .ranges import backfill_range_columns, range_columns
+from .rendering import rerender_jobs
+from .search import search_backend, search_jobs
+from .serializers import JOB_LIST_FIELDS, JobListSerializer
+from .standin import redate_jobs
+from .streaming import StreamedPage
+from .suggest import SuggestIndex
+from .telemetry import IngestionMetrics
+from .tasks import (
+    delete_old_jobs,
+    fetch_and_process_page,
+    hirebase_task,
+    load_watermark,
+    process_hirebase_page,
+    upsert_jobs,
+)
+from .utils import HirebaseClient
+from .views import JobBatchView, JobListView
+
+
+class IsolatedRedisMixin:
+    """
+    Points ``utils.redis_client``, and the modules that import it by name, at
+    the ``TEST_REDIS_URL`` database, flushed before and after the test, so
+    tests never touch the locks, checkpoints and indexes in the real one.
+    """
+
+    def setUp(self):
+        if settings.TEST_REDIS_URL == utils.REDIS_URL:
+            self.fail(
+                "TEST_REDIS_URL must be a different Redis database than REDIS_URL"
+            )
+        client = redis.StrictRedis.from_url(
+            settings.TEST_REDIS_URL, decode_responses=True
+        )
+        client.flushdb()
+        self.addCleanup(client.flushdb)
+        for target in (
+            "job_board.utils.redis_client",
+            "job_board.tasks.redis_client",
+            "job_board.views.redis_client",
+        ):
+            patcher = patch(target, client)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+class JobListQueryPlanTests(TestCase):
+    """
+    The JobListView filter paths must be answerable from an index.
+
+    The test tables are tiny, so on PostgreSQL sequential scans are disabled
+    for the transaction: a plan that still contains a "Seq Scan" means no
+    index could serve the query at all.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        Job.objects.bulk_create(
+            Job(
+                _id=f"plan-{index}",
+                job_title=f"Software Engineer {index}",
+                company_name="Acme",
+                application_link="https://example.com",
+                job_type="Full Time" if index % 2 else "Contract",
+                location_type="Remote" if index % 3 else "Hybrid",
+                date_posted=now - timedelta(hours=index),
+                locations=[{"city": "Austin", "country": "United States"}],
+                salary_range={"min": 50000 + index * 1000, "max": 90000},
+                yoe_range={"min": index % 6, "max": index % 6 + 2},
+            )
+            for index in range(30)
+        )
+        backfill_range_columns()
+        backfill_job_locations()
+
+    def setUp(self):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def _list_queryset(self, **params):
+        request = Request(APIRequestFactory().get("/jobs/", params))
+        view = JobListView()
+        view.request = request
+        view.format_kwarg = None
+        return view.get_queryset()
+
+    def _plan(self, queryset):
+        return queryset.explain()
+
+    def assertNoSeqScan(self, queryset):
+        plan = self._plan(queryset)
+        if connection.vendor == "postgresql":
+            self.assertNotIn("Seq Scan", plan)
+        else:
+            # SQLite reports a full table scan as "SCAN <table>" without an index.
+            self.assertNotRegex(plan, r"SCAN job_board_job\b(?! USING)")
+
+    def assertUsesIndex(self, queryset, index_name):
+        self.assertIn(index_name, self._plan(queryset))
+
+    def test_default_listing_walks_date_index(self):
+        queryset = self._list_queryset()[:10]
+        self.assertNoSeqScan(queryset)
+        self.assertUsesIndex(queryset, "job_date_posted_id_idx")
+
+    def test_job_posted_filter(self):
+        queryset = self._list_queryset(job_posted="last_24_hour")
+        self.assertNoSeqScan(queryset)
+        self.assertUsesIndex(queryset, "job_date_posted_id_idx")
+
+    def test_delete_old_jobs_filter(self):
+        queryset = Job.objects.filter(created_at__lt=timezone.now() - timedelta(days=7))
+        self.assertUsesIndex(queryset, "job_created_at_idx")
+
+    def test_location_filter(self):
+        self.assertNoSeqScan(self._list_queryset(location="Austin,United States"))
+        self.assertUsesIndex(
+            self._list_queryset(location=",United States").order_by(),
+            "location_country_idx",
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL-only indexes")
+    def test_job_type_and_location_type_filters(self):
+        queryset = self._list_queryset(job_type="full", location_type="remote")
+        self.assertNoSeqScan(queryset)
+        self.assertUsesIndex(
+            self._list_queryset(job_type="full").order_by(), "job_job_type_trgm_idx"
+        )
+        self.assertUsesIndex(
+            self._list_queryset(location_type="remote").order_by(),
+            "job_location_type_trgm_idx",
+        )
+
+    def test_search_filter(self):
+        queryset = self._list_queryset(q="engineer")
+        self.assertNoSeqScan(queryset)
+        if connection.vendor == "postgresql":
+            self.assertUsesIndex(queryset.order_by(), "job_search_vector_idx")
+        else:
+            self.assertIn("VIRTUAL TABLE INDEX", self._plan(queryset))
+
+    def test_salary_filters(self):
+        queryset = self._list_queryset(salary_min="60000", salary_max="100000")
+        self.assertNoSeqScan(queryset)
+        self.assertUsesIndex(
+            self._list_queryset(salary_min="60000").order_by(), "job_salary_min_idx"
+        )
+        self.assertUsesIndex(
+            self._list_queryset(salary_max="100000").order_by(), "job_salary_max_idx"
+        )
+
+    def test_yoe_filters(self):
+        self.assertUsesIndex(
+            self._list_queryset(yoe_min="3").order_by(), "job_yoe_min_idx"
+        )
+        self.assertUsesIndex(
+            self._list_queryset(yoe_max="4").order_by(), "job_yoe_max_idx"
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL-only indexes")
+    def test_combined_filters(self):
+        queryset = self._list_queryset(
+            location="Austin",
+            job_type="full",
+            job_posted="last_7_days",
+            salary_min="50000",
+        )
+        self.assertNoSeqScan(queryset)
+
+
+@skipUnless(search_backend(), "No full-text search backend on this database")
+class JobSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        upsert_jobs(
+            {
+                "_id": job_id,
+                "job_title": title,
+                "company_name": company,
+                "application_link": "https://example.com",
+                "date_posted": (now - timedelta(hours=hours)).isoformat(),
+            }
+            for job_id, title, company, hours in [
+                ("title-match", "Senior Software Engineer", "Acme", 3),
+                ("company-match", "Data Scientist", "Software House", 1),
+                ("older", "Engineering Manager", "Globex", 30),
+                ("unrelated", "Product Designer", "Initech", 2),
+            ]
+        )
+
+    def _search(self, q, sort=None):
+        params = {"q": q}
+        if sort:
+            params["sort"] = sort
+        request = Request(APIRequestFactory().get("/jobs/", params))
+        view = JobListView()
+        view.request = request
+        view.format_kwarg = None
+        return [job._id for job in view.get_queryset()]
+
+    def test_every_word_matches_a_word_prefix(self):
+        self.assertEqual(self._search("soft eng"), ["title-match"])
+        self.assertEqual(self._search("engineer"), ["title-match", "older"])
+        self.assertEqual(self._search("globex"), ["older"])
+
+    def test_recency_is_the_default_order(self):
+        self.assertEqual(self._search("software"), ["company-match", "title-match"])
+
+    def test_relevance_ranks_title_matches_first(self):
+        self.assertEqual(
+            self._search("software", sort="relevance"),
+            ["title-match", "company-match"],
+        )
+
+    def test_search_works_in_a_subquery(self):
+        for relevance in [False, True]:
+            matches = search_jobs(Job.objects.all(), "software", relevance=relevance)
+            self.assertEqual(
+                set(
+                    Job.objects.filter(pk__in=matches.values("pk")).values_list(
+                        "_id", flat=True
+                    )
+                ),
+                {"title-match", "company-match"},
+            )
+
+    def test_punctuation_only_query_falls_back_to_substring_match(self):
+        self.assertEqual(self._search("++"), [])
+
+    def test_index_follows_ingestion_updates_and_deletes(self):
+        upsert_jobs(
+            [
+                {
+                    "_id": "unrelated",
+                    "job_title": "Staff Platform Engineer",
+                    "company_name": "Initech",
+                    "application_link": "https://example.com",
+                    "date_posted": timezone.now().isoformat(),
+                }
+            ]
+        )
+        self.assertEqual(self._search("platform"), ["unrelated"])
+        self.assertEqual(self._search("designer"), [])
+
+        Job.objects.filter(_id="older").delete()
+        self.assertEqual(self._search("engineer"), ["unrelated", "title-match"])
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite rowids")
+    def test_index_survives_renumbered_rowids(self):
+        # As VACUUM or a table rebuild may do.
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE job_board_job SET rowid = -rowid")
+        self.assertEqual(
+            self._search("software", sort="relevance"),
+            ["title-match", "company-match"],
+        )
+        Job.objects.filter(_id="title-match").delete()
+        upsert_jobs(
+            [
+                {
+                    "_id": "company-match",
+                    "job_title": "Software Engineer",
+                    "company_name": "Software House",
+                    "application_link": "https://example.com",
+                    "date_posted": timezone.now().isoformat(),
+                }
+            ]
+        )
+        self.assertEqual(self._search("software"), ["company-match"])
+        self.assertEqual(self._search("data"), [])
+
+
+class JobCursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now().replace(microsecond=0)
+        # Pairs of jobs share a date_posted, so pages split ties on _id.
+        Job.objects.bulk_create(
+            Job(
+                _id=f"cursor-{index:02d}",
+                application_link="https://example.com",
+                date_posted=now - timedelta(minutes=index // 2),
+            )
+            for index in range(25)
+        )
+        rerender_jobs()
+        cls.expected = list(
+            Job.objects.order_by("-date_posted", "_id").values_list("_id", flat=True)
+        )
+
+    def _get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_walks_forward_and_back_without_gaps(self):
+        url, pages, seen = "/jobs/?pagination=cursor&limit=4", [], []
+        while url:
+            data = self._get(url)
+            pages.append(url)
+            seen += [job["_id"] for job in data["results"]]
+            url = data["pagination"]["next"]
+        self.assertEqual(seen, self.expected)
+        self.assertEqual(len(pages), 7)
+        self.assertIsNone(data["pagination"]["count"])
+        self.assertIsNone(data["pagination"]["total_pages"])
+
+        data = self._get(pages[-1])
+        seen = [job["_id"] for job in data["results"]]
+        url = data["pagination"]["previous"]
+        while url:
+            data = self._get(url)
+            seen = [job["_id"] for job in data["results"]] + seen
+            url = data["pagination"]["previous"]
+        self.assertEqual(seen, self.expected)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/jobs/?cursor=not-a-cursor").status_code, 404)
+
+    def test_pages_run_no_count_query(self):
+        data = self._get("/jobs/?pagination=cursor&limit=20")
+        with self.assertNumQueries(1):
+            self._get(data["pagination"]["next"])
+
+
+class JobCountCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Job.objects.bulk_create(
+            Job(
+                _id=f"count-{index}",
+                application_link="https://example.com",
+                job_type="Full Time" if index % 2 else "Contract",
+                date_posted=timezone.now() - timedelta(hours=index),
+            )
+            for index in range(12)
+        )
+
+    def setUp(self):
+        # Counts cached by earlier runs belong to an older generation.
+        bump_dataset_generation()
+
+    def _pagination(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()["pagination"]
+
+    def test_signature_ignores_order_case_and_paging(self):
+        self.assertEqual(
+            filter_signature({"job_type": "Full", "q": "Soft  Eng", "page": "2"}),
+            filter_signature({"q": "soft eng", "job_type": "full ", "limit": "5"}),
+        )
+        self.assertEqual(
+            filter_signature({"salary_min": "abc", "job_posted": "yesterday"}),
+            filter_signature({}),
+        )
+        self.assertNotEqual(
+            filter_signature({"location": "Austin"}),
+            filter_signature({"location": "austin"}),
+        )
+
+    def test_count_is_cached_until_the_generation_changes(self):
+        pagination = self._pagination("/jobs/?job_type=full")
+        self.assertEqual(pagination["count"], 6)
+        self.assertTrue(pagination["count_exact"])
+
+        Job.objects.filter(_id="count-1").delete()
+        with self.assertNumQueries(1):
+            pagination = self._pagination("/jobs/?limit=5&job_type=FULL&page=2")
+        self.assertEqual(pagination["count"], 6)
+
+        bump_dataset_generation()
+        self.assertEqual(self._pagination("/jobs/?job_type=full")["count"], 5)
+
+    @skipUnless(connection.vendor == "postgresql", "Planner estimates need PostgreSQL")
+    @override_settings(JOB_COUNT_ESTIMATE_THRESHOLD=1)
+    def test_broad_query_reports_planner_estimate(self):
+        pagination = self._pagination("/jobs/")
+        self.assertFalse(pagination["count_exact"])
+        self.assertGreater(pagination["count"], 0)
+
+
+class JobResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Job.objects.bulk_create(
+            Job(
+                _id=f"cached-{index}",
+                application_link="https://example.com",
+                location_type="Remote" if index % 2 else "Onsite",
+                date_posted=timezone.now() - timedelta(hours=index),
+            )
+            for index in range(6)
+        )
+        rerender_jobs()
+
+    def setUp(self):
+        bump_dataset_generation()
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [job["_id"] for job in response.json()["results"]]
+
+    def test_equivalent_queries_share_a_cached_page(self):
+        ids = self._ids("/jobs/?location_type=remote&limit=2")
+        self.assertEqual(ids, ["cached-1", "cached-3"])
+        with self.assertNumQueries(0):
+            cached = self._ids("/jobs/?limit=2&page=1&location_type=REMOTE&sort=x")
+        self.assertEqual(cached, ids)
+        # Another page runs its query but reuses the cached count.
+        with self.assertNumQueries(1):
+            self._ids("/jobs/?location_type=remote&limit=2&page=2")
+
+    def test_new_generation_serves_fresh_data(self):
+        self.assertEqual(len(self._ids("/jobs/?location_type=remote")), 3)
+        Job.objects.filter(_id="cached-1").delete()
+        self.assertEqual(len(self._ids("/jobs/?location_type=remote")), 3)
+        bump_dataset_generation()
+        self.assertEqual(len(self._ids("/jobs/?location_type=remote")), 2)
+
+    @override_settings(JOB_RESPONSE_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        self._ids("/jobs/")
+        # Only the count is still cached.
+        with self.assertNumQueries(1):
+            self._ids("/jobs/")
+
+
+class JobFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Job.objects.create(
+            _id="fields-1",
+            job_title="Backend Engineer",
+            description="A long description",
+            application_link="https://example.com",
+            date_posted=timezone.now(),
+        )
+
+    def setUp(self):
+        bump_dataset_generation()
+
+    def _get(self, url, status=200):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def test_listing_is_compact_by_default(self):
+        job = self._get("/jobs/")["results"][0]
+        self.assertEqual(list(job), JOB_LIST_FIELDS)
+
+    def test_full_view(self):
+        job = self._get("/jobs/?view=full")["results"][0]
+        self.assertEqual(job["description"], "A long description")
+        self._get("/jobs/?view=everything", status=400)
+
+    def test_fields_limit_output_and_loaded_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            job = self._get("/jobs/?fields=job_title,_id")["results"][0]
+        self.assertEqual(job, {"_id": "fields-1", "job_title": "Backend Engineer"})
+        self.assertNotIn("description", queries[-1]["sql"])
+        self._get("/jobs/?fields=job_title,password", status=400)
+
+
+class JobRenderedJSONTests(TestCase):
+    def setUp(self):
+        bump_dataset_generation()
+        upsert_jobs(
+            {
+                "_id": f"rendered-{index}",
+                "job_title": f"Engineer {index}",
+                "company_name": "Acme",
+                "application_link": "https://example.com",
+                "locations": [{"city": "Austin"}],
+                "salary_range": {"min": 100000, "max": 150000},
+                "date_posted": (timezone.now() - timedelta(hours=index)).isoformat(),
+            }
+            for index in range(3)
+        )
+
+    def _results(self):
+        response = self.client.get("/jobs/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+    def test_listing_matches_the_serializer(self):
+        self.assertFalse(Job.objects.filter(rendered_json__isnull=True).exists())
+        expected = JobListSerializer(
+            Job.objects.order_by("-date_posted", "_id"), many=True
+        ).data
+        self.assertEqual(self._results(), json.loads(json.dumps(expected)))
+
+    def test_jobs_without_fragments_are_rendered_on_the_fly(self):
+        Job.objects.filter(_id="rendered-1").update(rendered_json=None)
+        results = self._results()
+        self.assertEqual(
+            [job["_id"] for job in results], [f"rendered-{i}" for i in range(3)]
+        )
+        self.assertEqual(results[1]["job_title"], "Engineer 1")
+
+    def test_save_with_update_fields_rerenders(self):
+        job = Job.objects.get(_id="rendered-1")
+        job.job_title = "Principal Engineer"
+        job.save(update_fields=["job_title"])
+        self.assertEqual(
+            json.loads(Job.objects.get(_id="rendered-1").rendered_json)["job_title"],
+            "Principal Engineer",
+        )
+
+    def test_save_rerenders(self):
+        job = Job.objects.get(_id="rendered-0")
+        job.job_title = "Staff Engineer"
+        job.save()
+        self.assertEqual(
+            json.loads(Job.objects.get(_id="rendered-0").rendered_json)["job_title"],
+            "Staff Engineer",
+        )
+
+
+class JobDetailTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        upsert_jobs(
+            [
+                {
+                    "_id": "detail-1",
+                    "job_title": "Backend Engineer",
+                    "description": "A long description",
+                    "application_link": "https://example.com",
+                    "date_posted": timezone.now().isoformat(),
+                }
+            ]
+        )
+
+    def test_conditional_gets(self):
+        response = self.client.get("/jobs/detail-1/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["description"], "A long description")
+        self.assertNotIn("rendered_json", response.json())
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                "/jobs/detail-1/", HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(response.status_code, 304)
+        last_modified = response["Last-Modified"]
+        response = self.client.get(
+            "/jobs/detail-1/", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_with_the_job(self):
+        etag = self.client.get("/jobs/detail-1/")["ETag"]
+        job = Job.objects.get(_id="detail-1")
+        job.job_title = "Staff Engineer"
+        job.save()
+        response = self.client.get("/jobs/detail-1/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["job_title"], "Staff Engineer")
+
+    def test_unknown_job(self):
+        self.assertEqual(self.client.get("/jobs/missing/").status_code, 404)
+
+
+class HTTPCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Job.objects.bulk_create(
+            Job(
+                _id=f"http-{index}",
+                application_link="https://example.com",
+                date_posted=timezone.now() - timedelta(days=index),
+                created_at=timezone.now() - timedelta(days=10 * index),
+                locations=[{"city": "Austin", "country": "United States"}],
+            )
+            for index in range(2)
+        )
+        backfill_job_locations()
+
+    def setUp(self):
+        bump_dataset_generation()
+
+    def test_listing_headers_and_revalidation(self):
+        response = self.client.get("/jobs/?job_type=full")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("s-maxage=", response["Cache-Control"])
+        self.assertEqual(response["Surrogate-Key"], "jobs jobs:unscoped")
+        etag = response["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/jobs/?job_type=full", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        bump_dataset_generation()
+        response = self.client.get("/jobs/?job_type=full", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_job_posted_listings_change_every_step(self):
+        now = timezone.now()
+        url = "/jobs/?job_posted=last_24_hour"
+        with patch("django.utils.timezone.now", return_value=now):
+            etag = self.client.get(url)["ETag"]
+            signature = filter_signature({"job_posted": "last_24_hour"})
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+
+        with patch("django.utils.timezone.now", return_value=now + JOB_POSTED_STEP):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(
+                filter_signature({"job_posted": "last_24_hour"}), signature
+            )
+
+    def test_job_posted_cutoff_starts_at_the_step(self):
+        now = datetime(2026, 1, 2, 10, 30, tzinfo=dt_timezone.utc)
+        self.assertEqual(
+            job_posted_cutoff(timedelta(hours=24), now),
+            datetime(2026, 1, 1, 10, 0, tzinfo=dt_timezone.utc),
+        )
+
+    def test_location_endpoints_are_tagged(self):
+        response = self.client.get("/location-field/?field=city")
+        self.assertEqual(response.json(), {"citys": ["Austin"]})
+        self.assertEqual(response["Surrogate-Key"], "locations")
+        self.assertIn("ETag", response)
+
+    def test_surrogate_keys(self):
+        self.assertEqual(
+            listing_surrogate_keys("Austin, United States"),
+            ["jobs", "jobs:city:austin", "jobs:country:united-states"],
+        )
+        self.assertEqual(
+            job_surrogate_keys([[{"city": "Austin", "region": "Texas"}], None]),
+            ["jobs:city:austin", "jobs:region:texas", "jobs:unscoped", "locations"],
+        )
+        self.assertEqual(job_surrogate_keys([]), [])
+
+    def test_delete_old_jobs_purges_the_deleted_jobs_listings(self):
+        with patch("job_board.tasks.refresh_suggest_index.delay"), self.assertLogs(
+            "job_board.purge"
+        ) as logs:
+            delete_old_jobs()
+        self.assertEqual(Job.objects.count(), 1)
+        self.assertIn("jobs:country:united-states", logs.output[0])
+
+
+class JobFacetsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        rows = [
+            ("Full Time", "Remote", "United States", 120000, 2, True),
+            ("Full Time", "Onsite", "Germany", 60000, 5, False),
+            ("Contract", "Remote", "United States", None, None, False),
+        ]
+        Job.objects.bulk_create(
+            Job(
+                _id=f"facet-{index}",
+                application_link="https://example.com",
+                date_posted=timezone.now(),
+                job_type=job_type,
+                location_type=location_type,
+                locations=[
+                    {"city": "A", "country": country},
+                    {"city": "B", "country": country},
+                ],
+                salary_range={"min": salary} if salary else None,
+                yoe_range={"min": yoe} if yoe is not None else None,
+                visa_sponsored=visa,
+            )
+            for index, (
+                job_type,
+                location_type,
+                country,
+                salary,
+                yoe,
+                visa,
+            ) in enumerate(rows)
+        )
+        backfill_range_columns()
+        backfill_job_locations()
+
+    def setUp(self):
+        bump_dataset_generation()
+
+    def _facets(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_counts_every_facet_in_the_database(self):
+        # One UNION ALL of a GROUP BY per facet.
+        with self.assertNumQueries(1):
+            data = self._facets("/jobs/facets/")
+        facets = data["facets"]
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(
+            facets["job_type"],
+            [{"value": "Full Time", "count": 2}, {"value": "Contract", "count": 1}],
+        )
+        self.assertEqual(
+            facets["country"],
+            [
+                {"value": "United States", "count": 2},
+                {"value": "Germany", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            facets["visa_sponsored"],
+            [{"value": True, "count": 1}, {"value": False, "count": 2}],
+        )
+        self.assertEqual(
+            [bucket["count"] for bucket in facets["salary"]], [0, 1, 1, 0, 0]
+        )
+        self.assertEqual([bucket["count"] for bucket in facets["yoe"]], [0, 1, 0, 1, 0])
+
+    def test_filters_apply_and_results_are_cached(self):
+        data = self._facets("/jobs/facets/?location_type=remote")
+        self.assertEqual(data["count"], 2)
+        with self.assertNumQueries(0):
+            cached = self._facets("/jobs/facets/?location_type=REMOTE&page=3")
+        self.assertEqual(cached, data)
+
+
+class JobRangeColumnsTests(TestCase):
+    def setUp(self):
+        bump_dataset_generation()
+        upsert_jobs(
+            {
+                "_id": f"range-{index}",
+                "job_title": "Engineer",
+                "application_link": "https://example.com",
+                "salary_range": salary_range,
+                "yoe_range": yoe_range,
+            }
+            for index, (salary_range, yoe_range) in enumerate(
+                [
+                    ({"min": 50, "max": 60, "currency": "usd", "period": "hour"}, None),
+                    ({"min": 90000, "max": 120000, "currency": "EUR"}, {"min": 2}),
+                    ({"min": "8000", "period": "month"}, {"min": 5, "max": 8}),
+                ]
+            )
+        )
+
+    def _ids(self, query):
+        response = self.client.get(f"/jobs/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return sorted(job["_id"] for job in response.json()["results"])
+
+    def test_range_columns(self):
+        self.assertEqual(
+            range_columns({"min": 50, "max": 60, "period": "Hourly"}, {"max": 3}),
+            {
+                "salary_min": 104000.0,
+                "salary_max": 124800.0,
+                "salary_currency": None,
+                "yoe_min": None,
+                "yoe_max": 3.0,
+            },
+        )
+        self.assertEqual(
+            range_columns({"min": 10, "period": "fortnight"}, "n/a")["salary_min"],
+            None,
+        )
+
+    def test_ingestion_and_save_fill_the_columns(self):
+        job = Job.objects.get(_id="range-0")
+        self.assertEqual((job.salary_min, job.salary_max), (104000.0, 124800.0))
+        self.assertEqual(job.salary_currency, "USD")
+        job.yoe_range = {"min": 1, "max": 2}
+        job.save()
+        self.assertEqual(Job.objects.get(_id="range-0").yoe_min, 1.0)
+
+    def test_save_with_update_fields_writes_the_columns(self):
+        job = Job.objects.get(_id="range-1")
+        job.salary_range = {"min": 70000, "max": 80000, "currency": "gbp"}
+        job.save(update_fields=["salary_range"])
+        job = Job.objects.get(_id="range-1")
+        self.assertEqual((job.salary_min, job.salary_max), (70000.0, 80000.0))
+        self.assertEqual((job.salary_currency, job.yoe_min), ("GBP", 2.0))
+
+        job.salary_range = None
+        job.save(update_fields=["job_title"])
+        self.assertEqual(Job.objects.get(_id="range-1").salary_min, 70000.0)
+
+    def test_filters_use_annualized_salaries_and_experience(self):
+        self.assertEqual(self._ids("salary_min=95000"), ["range-0", "range-2"])
+        self.assertEqual(self._ids("salary_max=120000"), ["range-1"])
+        self.assertEqual(self._ids("yoe_min=2"), ["range-1", "range-2"])
+        self.assertEqual(self._ids("yoe_min=3&yoe_max=8"), ["range-2"])
+
+
+class JobLocationTests(TestCase):
+    def setUp(self):
+        bump_dataset_generation()
+        upsert_jobs(
+            {
+                "_id": f"location-{index}",
+                "job_title": "Engineer",
+                "application_link": "https://example.com",
+                "locations": locations,
+            }
+            for index, locations in enumerate(
+                [
+                    [{"city": "Austin", "country": "United States", "region": "TX"}],
+                    [
+                        {"city": " Berlin ", "country": "Germany"},
+                        {"city": "Austin", "country": "United States"},
+                    ],
+                    [{"country": "Germany"}],
+                ]
+            )
+        )
+
+    def _ids(self, location):
+        response = self.client.get("/jobs/", {"location": location})
+        self.assertEqual(response.status_code, 200)
+        return sorted(job["_id"] for job in response.json()["results"])
+
+    def test_ingestion_links_distinct_locations(self):
+        self.assertEqual(Location.objects.count(), 4)
+        self.assertEqual(
+            sorted(map(str, Job.objects.get(_id="location-1").location_entries.all())),
+            ["Austin,United States", "Berlin,Germany"],
+        )
+
+    def test_location_filters(self):
+        self.assertEqual(self._ids("Austin"), ["location-0", "location-1"])
+        self.assertEqual(self._ids(",Germany"), ["location-1", "location-2"])
+        self.assertEqual(self._ids("Berlin, Germany"), ["location-1"])
+        self.assertEqual(self._ids("Austin,,TX"), ["location-0"])
+        # All parts must match the same location.
+        self.assertEqual(self._ids("Berlin,United States"), [])
+
+    def test_location_endpoints(self):
+        response = self.client.get("/locations/", {"search": "austin"})
+        self.assertEqual(
+            response.json(),
+            {"locations": ["Austin,United States", "Austin,United States,TX"]},
+        )
+        response = self.client.get("/location-field/", {"field": "country"})
+        self.assertEqual(response.json(), {"countrys": ["Germany", "United States"]})
+
+    def test_changed_and_deleted_jobs_update_locations(self):
+        job = Job.objects.get(_id="location-0")
+        job.locations = [{"city": "Paris", "country": "France"}]
+        job.save()
+        self.assertEqual(self._ids("Paris"), ["location-0"])
+        self.assertEqual(self._ids("Austin"), ["location-1"])
+
+        Job.objects.filter(_id="location-1").update(
+            created_at=timezone.now() - timedelta(days=8)
+        )
+        with patch("job_board.tasks.refresh_suggest_index.delay"):
+            delete_old_jobs()
+        self.assertEqual(
+            sorted(map(str, Location.objects.all())), ["Germany", "Paris,France"]
+        )
+
+
+class JobBatchTests(TestCase):
+    def setUp(self):
+        bump_dataset_generation()
+        upsert_jobs(
+            {
+                "_id": f"batch-{index}",
+                "job_title": f"Engineer {index}",
+                "application_link": "https://example.com",
+                "location_type": "Remote" if index % 2 else "Onsite",
+                "date_posted": (timezone.now() - timedelta(hours=index)).isoformat(),
+            }
+            for index in range(5)
+        )
+
+    def _batch(self, queries, status=200):
+        response = self.client.post(
+            "/jobs/batch/", {"queries": queries}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def test_pages_match_the_listing(self):
+        queries = [
+            {"location_type": "remote"},
+            {"limit": 2, "page": 2},
+            {"location_type": "onsite", "limit": 2},
+        ]
+        # A count and a page of IDs per query, then one query for every job.
+        with self.assertNumQueries(7):
+            pages = self._batch(queries)["results"]
+        for query, page in zip(queries, pages):
+            expected = self.client.get("/jobs/", query).json()
+            self.assertEqual(page["results"], expected["results"])
+            self.assertEqual(
+                page["pagination"]["count"], expected["pagination"]["count"]
+            )
+        self.assertEqual(pages[1]["pagination"]["total_pages"], 3)
+
+    def test_batches_are_cached(self):
+        queries = [{"location_type": "Remote"}, {"page": "9"}]
+        data = self._batch(queries)
+        self.assertEqual(data["results"][1]["results"], [])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self._batch([{"location_type": "remote"}, {"page": 9}]), data
+            )
+
+    def test_invalid_batches(self):
+        self._batch([], status=400)
+        self._batch([{}] * (JobBatchView.MAX_QUERIES + 1), status=400)
+        self._batch(["remote"], status=400)
+        self._batch([{"page": 0}], status=400)
+
+
+class HirebaseUpsertTests(TestCase):
+    def _payload(self, index, **fields):
+        return {
+            "_id": f"upsert-{index}",
+            "job_title": f"Engineer {index}",
+            "application_link": "https://example.com",
+            "date_posted": "2024-01-01T00:00:00Z",
+            "locations": [{"city": "Austin", "country": "United States"}],
+            **fields,
+        }
+
+    def test_first_sync_creates_every_job(self):
+        counts = upsert_jobs(self._payload(index) for index in range(3))
+        self.assertEqual(
+            counts, {"created": 3, "changed": 0, "unchanged": 0, "failed": 0}
+        )
+        job = Job.objects.get(_id="upsert-1")
+        self.assertEqual(job.job_title, "Engineer 1")
+        self.assertEqual(json.loads(job.rendered_json)["job_title"], "Engineer 1")
+        self.assertEqual(job.location_entries.get().city, "Austin")
+
+    def test_identical_resync_writes_nothing(self):
+        upsert_jobs(self._payload(index) for index in range(3))
+        updated_at = dict(Job.objects.values_list("_id", "updated_at"))
+        # Only the lookup of the stored content hashes.
+        with self.assertNumQueries(1):
+            counts = upsert_jobs(self._payload(index) for index in range(3))
+        self.assertEqual(
+            counts, {"created": 0, "changed": 0, "unchanged": 3, "failed": 0}
+        )
+        self.assertEqual(dict(Job.objects.values_list("_id", "updated_at")), updated_at)
+
+    def test_one_changed_field_updates_one_job(self):
+        upsert_jobs(self._payload(index) for index in range(3))
+        updated_at = dict(Job.objects.values_list("_id", "updated_at"))
+        counts = upsert_jobs(
+            [
+                self._payload(0),
+                self._payload(1, job_title="Staff Engineer"),
+                self._payload(2),
+            ]
+        )
+        self.assertEqual(
+            counts, {"created": 0, "changed": 1, "unchanged": 2, "failed": 0}
+        )
+        job = Job.objects.get(_id="upsert-1")
+        self.assertEqual(job.job_title, "Staff Engineer")
+        self.assertEqual(json.loads(job.rendered_json)["job_title"], "Staff Engineer")
+        self.assertNotEqual(job.updated_at, updated_at["upsert-1"])
+        self.assertEqual(
+            dict(Job.objects.exclude(_id="upsert-1").values_list("_id", "updated_at")),
+            {
+                job_id: value
+                for job_id, value in updated_at.items()
+                if job_id != "upsert-1"
+            },
+        )
+
+    def test_rejected_row_does_not_block_the_batch(self):
+        # application_link is NOT NULL, so the database rejects this row.
+        jobs = [self._payload(index) for index in range(4)]
+        jobs[2].update(application_link=None, url=None)
+        with self.assertLogs("job_board.tasks", "WARNING") as logs:
+            counts = upsert_jobs(jobs)
+        self.assertEqual(
+            counts, {"created": 3, "changed": 0, "unchanged": 0, "failed": 1}
+        )
+        self.assertEqual(
+            set(Job.objects.values_list("_id", flat=True)),
+            {"upsert-0", "upsert-1", "upsert-3"},
+        )
+        self.assertIn("upsert-2", logs.output[-1])
+
+    def test_items_that_are_not_objects_are_skipped(self):
+        with self.assertLogs("job_board.tasks", "WARNING"):
+            counts = upsert_jobs(["garbage", self._payload(0), None])
+        self.assertEqual(
+            counts, {"created": 1, "changed": 0, "unchanged": 0, "failed": 2}
+        )
+        self.assertTrue(Job.objects.filter(_id="upsert-0").exists())
+
+    def test_page_starting_with_items_that_are_not_objects(self):
+        posted = timezone.now().isoformat()
+        for junk in [None, "junk"]:
+            with self.assertLogs("job_board.tasks", "WARNING"):
+                result = process_hirebase_page(
+                    2, [junk, self._payload(0, date_posted=posted)], None
+                )
+            self.assertEqual(result["failed"], 1)
+            self.assertEqual(result["created"] + result["unchanged"], 1)
+        self.assertTrue(Job.objects.filter(_id="upsert-0").exists())
+        with self.assertLogs("job_board.tasks", "WARNING"):
+            result = process_hirebase_page(2, ["junk"], None)
+        self.assertEqual(result["failed"], 1)
+
+
+class BenchmarkIngestionTests(IsolatedRedisMixin, TestCase):
+    def test_fixtures_are_redated(self):
+        jobs = [
+            {"_id": "a", "date_posted": "2020-01-10T12:00:00"},
+            {"_id": "b", "date_posted": "2020-01-09T12:00:00.500000"},
+            {"_id": "c"},
+        ]
+        now = timezone.now().replace(microsecond=0)
+        redate_jobs(jobs, now)
+        self.assertEqual(parse_datetime(jobs[0]["date_posted"]), now)
+        self.assertEqual(
+            parse_datetime(jobs[1]["date_posted"]),
+            now - timedelta(days=1) + timedelta(microseconds=500000),
+        )
+        self.assertNotIn("date_posted", jobs[2])
+
+    def _benchmark(self, **options):
+        call_command(
+            "benchmark_hirebase_ingestion",
+            jobs=5,
+            runs=1,
+            latency_ms=0,
+            jitter_ms=0,
+            stdout=StringIO(),
+            **options,
+        )
+
+    def test_refuses_to_overwrite_existing_jobs(self):
+        Job.objects.create(
+            _id="standin-0-1",
+            job_title="Real job",
+            application_link="https://example.com",
+            date_posted=timezone.now(),
+        )
+        with self.assertRaisesMessage(CommandError, "--force"):
+            self._benchmark()
+        self.assertEqual(Job.objects.get().job_title, "Real job")
+
+    def test_only_created_jobs_are_deleted_and_nothing_is_recorded(self):
+        Job.objects.create(
+            _id="standin-0-1",
+            application_link="https://example.com",
+            date_posted=timezone.now(),
+        )
+        with patch("job_board.tasks.refresh_suggest_index.delay") as refresh, patch(
+            "job_board.purge.FastlyPurgeBackend.purge"
+        ) as fastly, patch(
+            "job_board.telemetry.IngestionMetrics.record_page"
+        ) as record_page, patch(
+            "job_board.telemetry.IngestionMetrics.record_run"
+        ) as record_run, override_settings(
+            SURROGATE_PURGE_BACKEND="job_board.purge.FastlyPurgeBackend"
+        ):
+            self._benchmark(force=True)
+        refresh.assert_not_called()
+        fastly.assert_not_called()
+        record_page.assert_not_called()
+        record_run.assert_not_called()
+        self.assertEqual(
+            list(Job.objects.values_list("_id", flat=True)), ["standin-0-1"]
+        )
+
+
+def page_result(**fields):
+    """A ``process_hirebase_page`` result for a page of one unchanged job."""
+    return {
+        "created": 0,
+        "changed": 0,
+        "unchanged": 1,
+        "failed": 0,
+        "write_seconds": 0.0,
+        "max_date_posted": None,
+        "max_date_ids": [],
+        "crossed_watermark": False,
+        **fields,
+    }
+
+
+class HirebaseSyncTestCase(IsolatedRedisMixin, TestCase):
+    """
+    Runs ``hirebase_task`` against mocked Hirebase pages.
+
+    ``results`` maps a page to its ``process_hirebase_page`` result, or to a
+    list of results for successive fetches; None is a failed fetch. Other
+    pages hold one unchanged job.
+    """
+
+    total_pages = 3
+
+    def setUp(self):
+        super().setUp()
+        self.checkpoint = SyncCheckpoint()
+        self.fetched = []
+        self.results = {}
+
+    def _fetch(self, page, limit, watermark):
+        self.fetched.append(page)
+        result = self.results.get(page, page_result())
+        if isinstance(result, list):
+            result = result.pop(0)
+        if result is None:
+            return None, None, 0.0
+        return result, {"total_pages": self.total_pages}, 0.0
+
+    def _sync(self, fetch=None, **kwargs):
+        with patch(
+            "job_board.tasks.fetch_and_process_page", side_effect=fetch or self._fetch
+        ):
+            return hirebase_task(**{"first_run": True, "mode": "serial", **kwargs})
+
+
+class HirebaseSyncLockTests(HirebaseSyncTestCase):
+    def test_skips_while_another_sync_holds_the_lock(self):
+        self.checkpoint.acquire_lock("live")
+        self.checkpoint.start("live-run", True, settings.HIREBASE_PAGE_LIMIT)
+        self.assertIsNone(self._sync())
+        self.assertEqual(self.fetched, [])
+        self.assertEqual(self.checkpoint.load()["run_id"], "live-run")
+
+    def test_resumes_a_checkpoint_once_its_lock_expired(self):
+        self.checkpoint.start("dead-run", True, settings.HIREBASE_PAGE_LIMIT)
+        self.checkpoint.mark_completed(2)
+        summary = self._sync()
+        self.assertEqual(self.fetched, [1, 3])
+        self.assertEqual(summary["unchanged"], 2)
+        self.assertIsNone(self.checkpoint.load())
+        self.assertIsNone(utils.redis_client.get(self.checkpoint.lock_key))
+
+    def test_stops_when_another_sync_takes_over(self):
+        def fetch(page, limit, watermark):
+            if page == 2:
+                utils.redis_client.set(self.checkpoint.lock_key, "other")
+            return self._fetch(page, limit, watermark)
+
+        self.assertIsNone(self._sync(fetch))
+        self.assertEqual(self.fetched, [1, 2])
+        self.assertIsNotNone(self.checkpoint.load())
+        self.assertEqual(utils.redis_client.get(self.checkpoint.lock_key), "other")
+
+
+class SuggestTests(IsolatedRedisMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        jobs = [
+            ("Software Engineer", "Acme"),
+            ("Software Engineer", "Acme"),
+            ("Software Engineer", "Acme"),
+            ("Sales Manager", "Acme"),
+            ("Sales Manager", "Acme"),
+            ("Data Scientist", "Stripe"),
+        ]
+        Job.objects.bulk_create(
+            Job(
+                _id=f"suggest-{index}",
+                job_title=title,
+                company_name=company,
+                application_link="https://example.com",
+                date_posted=now,
+            )
+            for index, (title, company) in enumerate(jobs)
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.index = SuggestIndex()
+        SuggestIndex._loaded = None
+
+    def tearDown(self):
+        SuggestIndex._loaded = None
+
+    def _texts(self, result):
+        return [(item["text"], item["type"]) for item in result["suggestions"]]
+
+    def test_prefix_matches_any_word_most_jobs_first(self):
+        self.index.rebuild()
+        result = self.index.suggest("s", 10)
+        self.assertFalse(result["fuzzy"])
+        self.assertEqual(
+            self._texts(result),
+            [
+                ("Software Engineer", "title"),
+                ("Sales Manager", "title"),
+                ("Data Scientist", "title"),
+                ("Stripe", "company"),
+            ],
+        )
+        self.assertEqual(
+            self._texts(self.index.suggest("eng", 10)), [("Software Engineer", "title")]
+        )
+        self.assertEqual(self.index.suggest("eng", 10)["suggestions"][0]["count"], 3)
+
+    def test_fuzzy_matches_fill_in_for_typos(self):
+        self.index.rebuild()
+        result = self.index.suggest("sofware enginer", 10)
+        self.assertTrue(result["fuzzy"])
+        self.assertEqual(self._texts(result)[0], ("Software Engineer", "title"))
+
+    def test_kind_filter_on_precomputed_prefixes(self):
+        # Only the top entry per short prefix is kept, and for "s" that is a
+        # title, so a shared list would leave no companies to return.
+        with patch("job_board.suggest.PRECOMPUTED_TOP", 1):
+            self.index.rebuild()
+            self.assertEqual(
+                self._texts(self.index.suggest("s", 10, "company")),
+                [("Stripe", "company")],
+            )
+            self.assertEqual(
+                self._texts(self.index.suggest("s", 10, "title"))[0],
+                ("Software Engineer", "title"),
+            )
+        self.assertEqual(self._texts(self.index.suggest("acm", 10, "title")), [])
+
+    def test_missing_index_is_rebuilt_in_the_background(self):
+        with patch("job_board.tasks.refresh_suggest_index.delay") as refresh:
+            self.assertEqual(
+                self.index.suggest("soft", 10), {"suggestions": [], "fuzzy": False}
+            )
+            self.index.suggest("softw", 10)
+        refresh.assert_called_once_with()
+
+
+class HirebaseParallelSyncTests(HirebaseSyncTestCase):
+    total_pages = 5
+
+    def setUp(self):
+        super().setUp()
+        self.windows = []
+
+    def _chord(self, header):
+        """Run the chord's page tasks in order, then its callback with their results."""
+        header = list(header)
+        self.windows.append([task.args[0] for task in header])
+        return lambda callback: callback([task() for task in header])
+
+    def _sync(self, **kwargs):
+        with patch("job_board.tasks.chord", side_effect=self._chord):
+            return super()._sync(mode="parallel", concurrency=2, **kwargs)
+
+    def test_pages_are_fetched_in_windows(self):
+        self._sync()
+        self.assertEqual(self.windows, [[2, 3], [4, 5]])
+        self.assertEqual(self.fetched, [1, 2, 3, 4, 5])
+        self.assertIsNone(self.checkpoint.load())
+        self.assertIsNone(utils.redis_client.get(self.checkpoint.lock_key))
+        self.assertIsNotNone(SyncState.objects.get().last_success_at)
+
+    def test_stopping_page_ends_the_run(self):
+        self.results[3] = "stop"
+        self._sync()
+        self.assertEqual(self.windows, [[2, 3]])
+        self.assertEqual(self.fetched, [1, 2, 3])
+        self.assertIsNone(self.checkpoint.load())
+
+    def test_stopping_page_cancels_later_pages_in_its_window(self):
+        self.results[2] = page_result(crossed_watermark=True)
+        self._sync()
+        self.assertEqual(self.windows, [[2, 3]])
+        self.assertEqual(self.fetched, [1, 2])
+
+
+def hirebase_response(status, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body or {}).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+class HirebaseClientTests(TestCase):
+    def setUp(self):
+        self.client = HirebaseClient(
+            endpoint="https://hirebase.test/api/jobs",
+            api_key="key",
+            max_retries=2,
+            backoff_base=1,
+            backoff_max=10,
+        )
+        sleep = patch("job_board.utils.time.sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _post(self, *outcomes):
+        return patch.object(self.client.session, "post", side_effect=outcomes)
+
+    def test_transient_errors_are_retried_with_backoff(self):
+        with self._post(
+            hirebase_response(503),
+            requests.Timeout(),
+            hirebase_response(200, {"jobs": [1]}),
+        ) as post, patch(
+            "job_board.utils.random.uniform", side_effect=lambda low, high: high
+        ), self.assertLogs(
+            "job_board.utils", "ERROR"
+        ):
+            data = self.client.fetch_jobs(3)
+        self.assertEqual(data, {"jobs": [1]})
+        self.assertEqual(post.call_args.kwargs["json"]["page"], 3)
+        self.assertEqual([c.args[0] for c in self.sleep.call_args_list], [1, 2])
+        stats = self.client.stats.snapshot()
+        self.assertEqual((stats["requests"], stats["retries"]), (3, 2))
+        self.assertEqual((stats["successes"], stats["failures"]), (1, 2))
+
+    def test_retry_after_is_honoured_up_to_the_backoff_cap(self):
+        with self._post(
+            hirebase_response(429, headers={"Retry-After": "3"}),
+            hirebase_response(429, headers={"Retry-After": "120"}),
+            hirebase_response(200, {"jobs": []}),
+        ), self.assertLogs("job_board.utils", "ERROR"):
+            self.assertEqual(self.client.fetch_jobs(1), {"jobs": []})
+        self.assertEqual([c.args[0] for c in self.sleep.call_args_list], [3.0, 10])
+
+    def test_client_errors_are_not_retried(self):
+        with self._post(hirebase_response(400)) as post, self.assertLogs(
+            "job_board.utils", "ERROR"
+        ):
+            self.assertIsNone(self.client.fetch_jobs(1))
+        self.assertEqual(post.call_count, 1)
+        self.sleep.assert_not_called()
+
+    def test_gives_up_after_max_retries(self):
+        with self._post(
+            *[requests.ConnectionError("refused")] * 3
+        ) as post, self.assertLogs("job_board.utils", "ERROR"):
+            self.assertIsNone(self.client.fetch_jobs(1))
+        self.assertEqual(post.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+
+
+class PagePrefetcherTests(TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.started = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _fetch(self, page, limit):
+        with self.lock:
+            self.started.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later pages finish first.
+        time.sleep((10 - page) * 0.005)
+        with self.lock:
+            self.in_flight -= 1
+        return {"page": page, "limit": limit}
+
+    def test_pages_are_yielded_in_order(self):
+        with PagePrefetcher(range(2, 8), limit=5, window=3, fetch=self._fetch) as pages:
+            results = [(page, data) for page, data, _ in pages]
+        self.assertEqual(
+            results, [(page, {"page": page, "limit": 5}) for page in range(2, 8)]
+        )
+        self.assertLessEqual(self.max_in_flight, 3)
+        self.assertEqual(pages.fetched_pages, 6)
+
+    def test_fetches_wait_for_the_consumer(self):
+        with PagePrefetcher(range(2, 8), window=2, fetch=self._fetch) as pages:
+            page, _, _ = next(iter(pages))
+            time.sleep(0.1)
+            self.assertEqual(page, 2)
+            # The first window plus the fetch that replaced the consumed page.
+            self.assertEqual(sorted(self.started), [2, 3, 4])
+
+
+class HirebasePipelinedSyncTests(HirebaseSyncTestCase):
+    total_pages = 5
+
+    def _sync(self, **kwargs):
+        processed = []
+
+        def process(page, jobs, watermark):
+            processed.append(page)
+            return page_result()
+
+        with patch(
+            "job_board.tasks.fetch_hirebase_jobs",
+            side_effect=lambda page, limit: {"jobs": [{"_id": f"job-{page}"}]},
+        ), patch("job_board.tasks.process_hirebase_page", side_effect=process):
+            summary = super()._sync(mode="pipelined", **kwargs)
+        return summary, processed
+
+    def test_pages_are_written_in_order(self):
+        summary, processed = self._sync()
+        self.assertEqual(processed, [2, 3, 4, 5])
+        self.assertEqual(summary["unchanged"], 5)
+        self.assertIsNone(self.checkpoint.load())
+
+    @override_settings(HIREBASE_STREAMING=True)
+    def test_streaming_is_reported_as_unsupported(self):
+        with self.assertLogs("job_board.tasks", "WARNING") as logs:
+            self._sync()
+        self.assertIn("not supported in pipelined mode", logs.output[0])
+
+
+class StreamedPageTests(TestCase):
+    body = {
+        "total_pages": 12,
+        "jobs": [
+            {"_id": "a", "job_title": "Ingénieur logiciel", "score": 12345.678},
+            {"_id": "b", "locations": [{"city": "Zürich"}], "score": 1e-3},
+            [],
+            'text with "quotes" and ] brackets',
+        ],
+        "page": 3,
+    }
+
+    def _chunks(self, size):
+        encoded = json.dumps(self.body, ensure_ascii=False, indent=1).encode()
+        return [encoded[start : start + size] for start in range(0, len(encoded), size)]
+
+    def test_items_match_a_whole_body_decode_at_any_chunk_size(self):
+        for size in [1, 2, 3, 7, 64, 100000]:
+            with StreamedPage(self._chunks(size)) as page:
+                items = []
+                for item in page.items():
+                    # Members before the array are decoded by the first item.
+                    self.assertEqual(page.meta, {"total_pages": 12})
+                    items.append(item)
+                page.finish()
+            self.assertEqual(items, self.body["jobs"])
+            self.assertEqual(page.meta, {"total_pages": 12, "page": 3})
+
+    @override_settings(HIREBASE_STREAMING=True, HIREBASE_UPSERT_BATCH_SIZE=2)
+    def test_streamed_page_is_upserted_in_batches(self):
+        posted = timezone.now().isoformat()
+        self.body = {
+            "jobs": [
+                {
+                    "_id": f"streamed-{index}",
+                    "application_link": "x",
+                    "date_posted": posted,
+                }
+                for index in range(3)
+            ],
+            "total_pages": 4,
+        }
+        with patch(
+            "job_board.tasks.stream_hirebase_jobs",
+            return_value=StreamedPage(self._chunks(16)),
+        ):
+            result, meta, _ = fetch_and_process_page(1, 100)
+        self.assertEqual(result["created"], 3)
+        self.assertEqual(meta, {"total_pages": 4})
+        self.assertEqual(Job.objects.filter(_id__startswith="streamed-").count(), 3)
+
+    def test_truncated_body_raises(self):
+        with StreamedPage(self._chunks(5)[:-3]) as page:
+            with self.assertRaises(ValueError):
+                list(page.items())
+
+    def test_close_releases_the_response_once(self):
+        closed = []
+        page = StreamedPage(self._chunks(10), on_close=lambda: closed.append(True))
+        next(page.items())
+        page.close()
+        page.close()
+        self.assertEqual(closed, [True])
+
+
+class HirebaseWatermarkTests(HirebaseSyncTestCase):
+    total_pages = 5
+
+    def setUp(self):
+        super().setUp()
+        self.high_water = timezone.now().replace(microsecond=0) - timedelta(hours=2)
+        SyncState.objects.create(
+            source="hirebase",
+            high_water_date_posted=self.high_water,
+            boundary_ids=["seen"],
+        )
+
+    def _job(self, job_id, posted):
+        return {
+            "_id": job_id,
+            "application_link": "x",
+            "date_posted": posted.isoformat(),
+        }
+
+    def test_page_reaches_the_watermark_at_an_older_or_boundary_job(self):
+        newer = self.high_water + timedelta(minutes=5)
+        cases = [
+            ([self._job("new", newer)], False),
+            # Posted at the watermark but not seen by the last run.
+            ([self._job("new", newer), self._job("tied", self.high_water)], False),
+            ([self._job("new", newer), self._job("seen", self.high_water)], True),
+            ([self._job("old", self.high_water - timedelta(seconds=1))], True),
+        ]
+        for jobs, crossed in cases:
+            result = process_hirebase_page(2, jobs, load_watermark())
+            self.assertEqual(result["crossed_watermark"], crossed)
+            if jobs[0]["_id"] == "new":
+                self.assertEqual(result["max_date_posted"], newer.isoformat())
+                self.assertEqual(result["max_date_ids"], ["new"])
+
+    def test_incremental_sync_stops_at_the_watermark_and_advances_it(self):
+        newest = self.high_water + timedelta(hours=1)
+        self.results[1] = page_result(
+            max_date_posted=newest.isoformat(), max_date_ids=["a", "b"], created=2
+        )
+        self.results[3] = page_result(crossed_watermark=True)
+        watermarks = []
+
+        def fetch(page, limit, watermark):
+            watermarks.append(watermark)
+            return self._fetch(page, limit, watermark)
+
+        with patch("job_board.tasks.refresh_suggest_index.delay"):
+            summary = self._sync(fetch, first_run=False)
+        self.assertEqual(self.fetched, [1, 2, 3])
+        self.assertEqual(watermarks, [(self.high_water, {"seen"})] * 3)
+        self.assertEqual(summary["created"], 2)
+        state = SyncState.objects.get()
+        self.assertEqual(state.high_water_date_posted, newest)
+        self.assertEqual(state.boundary_ids, ["a", "b"])
+
+    def test_full_resync_ignores_the_watermark(self):
+        with patch("job_board.tasks.load_watermark") as load:
+            self._sync()
+        load.assert_not_called()
+        self.assertEqual(self.fetched, [1, 2, 3, 4, 5])
+
+
+class HirebaseCheckpointTests(HirebaseSyncTestCase):
+    def test_failed_page_is_retried_at_the_end_of_the_run(self):
+        self.results[2] = [None, page_result()]
+        with self.assertLogs("job_board.tasks", "WARNING"):
+            summary = self._sync()
+        self.assertEqual(self.fetched, [1, 2, 3, 2])
+        self.assertEqual(summary["unchanged"], 3)
+        self.assertIsNone(self.checkpoint.load())
+        self.assertIsNotNone(SyncState.objects.get().last_success_at)
+
+    def test_page_that_keeps_failing_is_retried_by_the_next_run(self):
+        self.results[2] = [None, None, page_result()]
+        with self.assertLogs("job_board.tasks", "WARNING"):
+            self._sync()
+        self.assertEqual(self.fetched, [1, 2, 3, 2])
+        self.assertEqual(self.checkpoint.completed_pages(), {1, 3})
+        self.assertEqual(self.checkpoint.failed_pages(), {2: 2})
+        self.assertFalse(SyncState.objects.exists())
+
+        self.fetched = []
+        # A resumed run keeps its own first_run, so no watermark is loaded.
+        with patch("job_board.tasks.load_watermark") as load:
+            self._sync(first_run=False)
+        load.assert_not_called()
+        self.assertEqual(self.fetched, [1, 2])
+        self.assertIsNone(self.checkpoint.load())
+        self.assertIsNotNone(SyncState.objects.get().last_success_at)
+
+    def test_checkpoint_for_another_page_limit_is_not_resumed(self):
+        self.checkpoint.start("old-run", True, settings.HIREBASE_PAGE_LIMIT + 1)
+        self.checkpoint.mark_completed(2)
+        self._sync()
+        self.assertEqual(self.fetched, [1, 2, 3])
+
+
+class ParseDatetimeTests(TestCase):
+    def test_timestamps_are_parsed_to_utc(self):
+        expected = datetime(2024, 5, 1, 12, 30, 15, tzinfo=dt_timezone.utc)
+        for value in [
+            "2024-05-01T12:30:15",
+            "2024-05-01 12:30:15",
+            "2024-05-01T12:30:15Z",
+            "2024-05-01T12:30:15+00:00",
+            "2024-05-01T14:30:15+02:00",
+            "2024-05-01T07:30:15-0500",
+            " 2024-05-01T12:30:15Z ",
+        ]:
+            self.assertEqual(parse_datetime(value), expected, value)
+        self.assertEqual(
+            parse_datetime("2024-05-01"), datetime(2024, 5, 1, tzinfo=dt_timezone.utc)
+        )
+
+    def test_fractions_of_any_length(self):
+        for value, microsecond in [
+            ("2024-05-01T12:30:15.1Z", 100000),
+            ("2024-05-01T12:30:15.123456Z", 123456),
+            ("2024-05-01T12:30:15.123456789Z", 123456),
+            ("2024-05-01T12:30:15,5", 500000),
+        ]:
+            self.assertEqual(parse_datetime(value).microsecond, microsecond, value)
+            # The pattern used where fromisoformat is stricter (older Pythons).
+            self.assertEqual(_match_iso_like(value).microsecond, microsecond, value)
+
+    def test_unparseable_values(self):
+        for value in [
+            None,
+            "",
+            "yesterday",
+            "2024-13-01",
+            "2024-02-30T00:00:00",
+            1714566615,
+        ]:
+            self.assertIsNone(parse_datetime(value), value)
+
+    def test_agrees_with_the_legacy_parser(self):
+        for value in [
+            "2024-05-01T12:30:15",
+            "2024-05-01T12:30:15.250000",
+            "2024-05-01",
+            "2024-05-01 12:30:15",
+        ]:
+            self.assertEqual(parse_datetime(value), legacy_parse_datetime(value), value)
+
+
+class IngestionTelemetryTests(IsolatedRedisMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.metrics = IngestionMetrics()
+
+    def test_pages_and_runs_render_as_prometheus_metrics(self):
+        self.metrics.record_page(
+            page_result(
+                created=2,
+                unchanged=2,
+                fetch_seconds=0.25,
+                parse_seconds=0.05,
+                write_seconds=0.1,
+            )
+        )
+        self.metrics.record_page(None)
+        self.metrics.record_page("stop")
+        self.metrics.record_page("cancelled")
+        self.metrics.record_run(
+            {
+                "status": "complete",
+                "duration_seconds": 12.5,
+                "rows_per_second": 80.0,
+                "pages": 3,
+                "failed_pages": [],
+                "finished_timestamp": 1700000000.0,
+            }
+        )
+        lines = self.metrics.render_prometheus().splitlines()
+        source = 'source="hirebase"'
+        for line in [
+            "# TYPE job_board_ingestion_page_seconds histogram",
+            f'job_board_ingestion_page_seconds_bucket{{{source},stage="fetch",le="0.1"}} 0',
+            f'job_board_ingestion_page_seconds_bucket{{{source},stage="fetch",le="0.25"}} 1',
+            f'job_board_ingestion_page_seconds_bucket{{{source},stage="fetch",le="+Inf"}} 1',
+            f'job_board_ingestion_page_seconds_sum{{{source},stage="fetch"}} 0.25',
+            f'job_board_ingestion_page_seconds_count{{{source},stage="write"}} 1',
+            # 4 rows in 0.4 seconds of page time.
+            f'job_board_ingestion_page_rows_per_second_bucket{{{source},le="10"}} 1',
+            f'job_board_ingestion_rows_total{{{source},outcome="created"}} 2',
+            f'job_board_ingestion_rows_total{{{source},outcome="failed"}} 0',
+            f'job_board_ingestion_pages_total{{{source},status="processed"}} 1',
+            f'job_board_ingestion_pages_total{{{source},status="failed"}} 1',
+            f'job_board_ingestion_pages_total{{{source},status="stop"}} 1',
+            f"job_board_ingestion_last_run_success{{{source}}} 1",
+            f"job_board_ingestion_last_run_duration_seconds{{{source}}} 12.5",
+        ]:
+            self.assertIn(line, lines)
+        type_lines = [line for line in lines if line.startswith("# TYPE")]
+        self.assertEqual(len(type_lines), len(set(type_lines)))
+
+    def test_no_runs_means_no_last_run_gauges(self):
+        text = self.metrics.render_prometheus()
+        self.assertIn(
+            'job_board_ingestion_rows_total{source="hirebase",outcome="created"} 0',
+            text,
+        )
+        self.assertNotIn("last_run", text)
+
+    def test_metrics_endpoint(self):
+        response = self.client.get("/metrics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response["Content-Type"].startswith("text/plain; version=0.0.4")
+        )
+        self.assertIn("job_board_ingestion_pages_total", response.content.decode())
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_endpoint_requires_the_token(self):
+        with self.assertLogs("django.request", "WARNING"):
+            self.assertEqual(self.client.get("/metrics/").status_code, 401)
+            response = self.client.get("/metrics/", HTTP_AUTHORIZATION="Bearer wrong")
+            self.assertEqual(response.status_code, 401)
+        response = self.client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, 200)
@@ -1,10 +1,24 @@
 from django.urls import path
-from .views import JobListView, LocationListView, LocationFieldListView
+from .views import (
+    JobBatchView,
+    JobDetailView,
+    JobFacetsView,
+    JobListView,
+    JobSuggestView,
+    LocationListView,
+    LocationFieldListView,
+    MetricsView,
+)
 
 urlpatterns = [
     path("jobs/", JobListView.as_view(), name="job-list"),
+    path("jobs/suggest/", JobSuggestView.as_view(), name="job-suggest"),
+    path("jobs/facets/", JobFacetsView.as_view(), name="job-facets"),
+    path("jobs/batch/", JobBatchView.as_view(), name="job-batch"),
+    path("jobs/<str:_id>/", JobDetailView.as_view(), name="job-detail"),
     path("locations/", LocationListView.as_view(), name="location-list"),
     path(
         "location-field/", LocationFieldListView.as_view(), name="location-field-list"
     ),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
 ]
@@ -1,61 +1,324 @@
 import os
 import logging
+import random
+import threading
+import redis
 import requests
+from collections import deque
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any
 import time
+from .streaming import StreamedPage
 
 logger = logging.getLogger(__name__)
 
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+redis_client = redis.StrictRedis.from_url(REDIS_URL, decode_responses=True)
+
+# Bytes read from the socket at a time when streaming a page.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class RequestStats:
+    """
+    Thread-safe latency and outcome counters for Hirebase API requests.
+
+    Latencies of the most recent requests are kept for percentile estimates.
+    """
+
+    def __init__(self, sample_size: int = 1000):
+        self._lock = threading.Lock()
+        self._sample_size = sample_size
+        self.reset()
+
+    def reset(self):
+        """Clear all counters and latency samples."""
+        with self._lock:
+            self.requests = 0
+            self.successes = 0
+            self.failures = 0
+            self.retries = 0
+            self.total_seconds = 0.0
+            self.max_seconds = 0.0
+            self._latencies = deque(maxlen=self._sample_size)
+
+    def record(self, seconds: float, success: bool):
+        """Record the outcome and latency of one HTTP attempt."""
+        with self._lock:
+            self.requests += 1
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self._latencies.append(seconds)
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a summary of the recorded requests.
+
+        Returns:
+            dict: Request/success/failure/retry counts and latency figures in milliseconds.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            requests_count = self.requests
+            summary = {
+                "requests": requests_count,
+                "successes": self.successes,
+                "failures": self.failures,
+                "retries": self.retries,
+                "total_ms": round(self.total_seconds * 1000, 1),
+                "avg_ms": (
+                    round(self.total_seconds * 1000 / requests_count, 1)
+                    if requests_count
+                    else 0.0
+                ),
+                "max_ms": round(self.max_seconds * 1000, 1),
+            }
+        for name, quantile in (("p50_ms", 0.5), ("p95_ms", 0.95)):
+            summary[name] = (
+                round(latencies[int(quantile * (len(latencies) - 1))] * 1000, 1)
+                if latencies
+                else 0.0
+            )
+        return summary
+
+
+class DecodedPage(dict):
+    """A decoded page body that also records how long JSON decoding took."""
+
+    decode_seconds = 0.0
+
+
+class HirebaseClient:
+    """
+    Reusable client for the Hirebase jobs search API.
+
+    Requests go through a pooled keep-alive ``requests.Session`` that accepts
+    compressed responses. Timeouts, connection errors, 429 and 5xx responses
+    are retried with exponential backoff and full jitter; other errors are
+    returned as ``None`` immediately.
+
+    Attributes:
+        stats (RequestStats): Latency and outcome counters for every attempt.
+    """
+
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        api_key: Optional[str] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        pool_size: Optional[int] = None,
+    ):
+        self.endpoint = endpoint or os.environ.get("JOB_API_ENDPOINT")
+        self.api_key = api_key or os.environ.get("JOB_API_KEY")
+        self.connect_timeout = connect_timeout or settings.HIREBASE_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout or settings.HIREBASE_READ_TIMEOUT
+        self.max_retries = (
+            settings.HIREBASE_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.backoff_base = backoff_base or settings.HIREBASE_BACKOFF_BASE
+        self.backoff_max = backoff_max or settings.HIREBASE_BACKOFF_MAX
+        pool_size = pool_size or settings.HIREBASE_POOL_SIZE
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+                "x-api-key": self.api_key or "",
+            }
+        )
+        self.stats = RequestStats()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay before retry number ``attempt``."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * (2**attempt))
+        )
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        try:
+            return min(self.backoff_max, float(response.headers["Retry-After"]))
+        except (KeyError, ValueError):
+            return None
+
+    def _post(
+        self, page: int, payload: Dict[str, Any], stream: bool = False
+    ) -> Optional[requests.Response]:
+        """
+        POST ``payload``, retrying transient failures.
+
+        Returns:
+            Response: The 200 response, or None if the page could not be fetched.
+        """
+        if not self.endpoint or not self.api_key:
+            logger.error(
+                "Missing JOB_API_ENDPOINT or JOB_API_KEY in environment variables."
+            )
+            return None
+
+        for attempt in range(self.max_retries + 1):
+            delay = None
+            started = time.monotonic()
+            try:
+                response = self.session.post(
+                    self.endpoint,
+                    json=payload,
+                    timeout=(self.connect_timeout, self.read_timeout),
+                    stream=stream,
+                )
+                if response.status_code == 200:
+                    self.stats.record(time.monotonic() - started, success=True)
+                    return response
+                self.stats.record(time.monotonic() - started, success=False)
+                logger.error(
+                    f"Failed to fetch jobs from Hirebase (page {page}): {response.status_code} - {response.text}"
+                )
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    return None
+                delay = self._retry_after(response)
+            except requests.Timeout:
+                self.stats.record(time.monotonic() - started, success=False)
+                logger.error(
+                    f"Timeout while fetching jobs from Hirebase (page {page}) "
+                    f"(connect {self.connect_timeout}s, read {self.read_timeout}s)."
+                )
+            except requests.RequestException as e:
+                self.stats.record(time.monotonic() - started, success=False)
+                logger.error(
+                    f"Exception while fetching jobs from Hirebase (page {page}): {e}"
+                )
+
+            if attempt < self.max_retries:
+                if delay is None:
+                    delay = self.backoff_delay(attempt)
+                self.stats.record_retry()
+                logger.info(
+                    f"Retrying Hirebase fetch (page {page}) in {delay:.1f} seconds "
+                    f"(attempt {attempt + 2} of {self.max_retries + 1})."
+                )
+                time.sleep(delay)
+        return None
+
+    def fetch_jobs(
+        self,
+        page: int,
+        limit: int = 100,
+        sort_by: str = "date_posted",
+        sort_order: str = "desc",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of jobs.
+
+        Returns:
+            DecodedPage: Decoded response body, or None if the page could not be fetched.
+        """
+        payload = {
+            "page": page,
+            "limit": limit,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+        }
+        response = self._post(page, payload)
+        if response is None:
+            return None
+        started = time.monotonic()
+        try:
+            data = DecodedPage(response.json())
+        except ValueError as e:
+            logger.error(f"Invalid JSON from Hirebase (page {page}): {e}")
+            return None
+        data.decode_seconds = time.monotonic() - started
+        return data
+
+    def stream_jobs(
+        self,
+        page: int,
+        limit: int = 100,
+        sort_by: str = "date_posted",
+        sort_order: str = "desc",
+    ) -> Optional[StreamedPage]:
+        """
+        Fetch one page of jobs, decoding the ``jobs`` array one item at a time.
+
+        Only establishing the response is retried; errors while reading the
+        body surface from ``StreamedPage.items()``. Latency stats cover the
+        time to the response headers.
+
+        Returns:
+            StreamedPage: The page being streamed, or None if it could not be fetched.
+        """
+        payload = {
+            "page": page,
+            "limit": limit,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+        }
+        response = self._post(page, payload, stream=True)
+        if response is None:
+            return None
+        return StreamedPage(
+            response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+            array_key="jobs",
+            on_close=response.close,
+        )
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HirebaseClient] = None
+_client_lock = threading.Lock()
+
+
+def get_hirebase_client() -> HirebaseClient:
+    """
+    Return the process-wide Hirebase client, creating it on first use.
+
+    The client is created lazily so each forked Celery worker process opens
+    its own connection pool.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HirebaseClient()
+    return _client
+
 
 def fetch_hirebase_jobs(
     page: int,
     limit: int = 100,
     sort_by: str = "date_posted",
     sort_order: str = "desc",
-    retries: int = 3,
 ) -> Optional[Dict[str, Any]]:
-    endpoint: Optional[str] = os.environ.get("JOB_API_ENDPOINT")
-    api_key: Optional[str] = os.environ.get("JOB_API_KEY")
+    """Fetch one page of jobs with the shared Hirebase client."""
+    return get_hirebase_client().fetch_jobs(page, limit, sort_by, sort_order)
 
-    if not endpoint or not api_key:
-        logger.error(
-            "Missing JOB_API_ENDPOINT or JOB_API_KEY in environment variables."
-        )
-        return None
 
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": api_key,
-    }
-    payload = {
-        "page": page,
-        "limit": limit,
-        "sort_by": sort_by,
-        "sort_order": sort_order,
-    }
-    try:
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=300)
-        if response.status_code != 200:
-            logger.error(
-                f"Failed to fetch jobs from Hirebase (page {page}): {response.status_code} - {response.text}"
-            )
-            return None
-        return response.json()
-    except requests.Timeout:
-        logger.error(
-            f"Timeout while fetching jobs from Hirebase (page {page}): request exceeded 5 minutes."
-        )
-        if retries > 0:
-            logger.info(f"Retrying fetch_hirebase_jobs (page {page}) after timeout.")
-            time.sleep(1)
-            return fetch_hirebase_jobs(page, limit, sort_by, sort_order, retries)
-        return None
-    except Exception as e:
-        logger.error(f"Exception while fetching jobs from Hirebase (page {page}): {e}")
-        if retries > 0:
-            logger.info(
-                f"Retrying fetch_hirebase_jobs (page {page}) in {retries} seconds..."
-            )
-            time.sleep(1)
-            return fetch_hirebase_jobs(page, limit, sort_by, sort_order, retries - 1)
-        return None
+def stream_hirebase_jobs(
+    page: int,
+    limit: int = 100,
+    sort_by: str = "date_posted",
+    sort_order: str = "desc",
+) -> Optional[StreamedPage]:
+    """Stream one page of jobs with the shared Hirebase client."""
+    return get_hirebase_client().stream_jobs(page, limit, sort_by, sort_order)
@@ -2,23 +2,98 @@
 
 from rest_framework import generics
 from .models import Job
-from .serializers import JobSerializer
-from rest_framework.pagination import PageNumberPagination
+from .serializers import JobListSerializer, JobSerializer
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from django.db import models
 from rest_framework.views import APIView
-import redis
-import os
-from django.utils import timezone
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.http import condition
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Dict, List, Tuple
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from .cache import (
+    dataset_generation,
+    estimate_count,
+    filter_signature,
+    get_cached_count,
+    get_cached_response,
+    normalize_filters,
+    response_cache_key,
+    set_cached_count,
+    set_cached_response,
+)
+from .http_cache import GenerationCacheMixin, generation_etag, listing_surrogate_keys
+from .rendering import (
+    FragmentJSONRenderer,
+    RenderedJSON,
+    job_fragments,
+    render_jobs_array,
+)
+from .facets import compute_facets
+from .filters import filter_jobs
+from .locations import linked_locations
+from .suggest import SUGGEST_KINDS, SuggestIndex
+from .telemetry import IngestionMetrics
+from .utils import redis_client
 
-REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
-redis_client = redis.StrictRedis.from_url(REDIS_URL, decode_responses=True)
+
+def count_jobs(queryset, params) -> Tuple[int, bool]:
+    """
+    Return ``(count, exact)`` for ``queryset``, the jobs matching ``params``.
+
+    Served from the count cache when possible; see ``JobPagination``.
+    """
+    signature = filter_signature(params)
+    cached = get_cached_count(signature)
+    if cached is not None:
+        return cached
+    count, exact = None, True
+    threshold = settings.JOB_COUNT_ESTIMATE_THRESHOLD
+    if threshold:
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= threshold:
+            count, exact = estimate, False
+    if count is None:
+        count = queryset.count()
+    set_cached_count(signature, count, exact)
+    return count, exact
+
+
+class CountedPaginator(Paginator):
+    """Django paginator that takes its count from a callable instead of COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count_source, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_source = count_source
+
+    @cached_property
+    def count(self):
+        return self.count_source(self.object_list)
 
 
 class JobPagination(PageNumberPagination):
     """
     Custom pagination class for jobs API.
 
+    The total is cached in Redis per normalized filter set for the current
+    dataset generation (see job_board.cache), so it is counted once per sync
+    rather than once per request. With ``JOB_COUNT_ESTIMATE_THRESHOLD`` set,
+    PostgreSQL queries the planner expects to match at least that many rows
+    report the planner's estimate instead of counting them; ``count_exact``
+    in the response is false when the count is an estimate.
+
     Attributes:
         page_query_param (str): Query parameter for page number (page).
         page_size_query_param (str): Query parameter for page size (limit).
@@ -31,6 +106,18 @@ class JobPagination(PageNumberPagination):
     max_page_size = 100
     page_size = 10
 
+    def django_paginator_class(self, queryset, page_size):
+        return CountedPaginator(queryset, page_size, count_source=self.get_count)
+
+    def get_count(self, queryset):
+        """
+        Return the number of jobs matching the request's filters.
+
+        Sets ``count_exact`` to False when the count is a planner estimate.
+        """
+        count, self.count_exact = count_jobs(queryset, self.request.query_params)
+        return count
+
     def get_paginated_response(self, data):
         """
         Return a paginated response with pagination info and results.
@@ -45,6 +132,7 @@ class JobPagination(PageNumberPagination):
             {
                 "pagination": {
                     "count": self.page.paginator.count,
+                    "count_exact": self.count_exact,
                     "page": self.page.number,
                     "limit": self.get_page_size(self.request),
                     "next": self.get_next_link(),
@@ -56,27 +144,317 @@ class JobPagination(PageNumberPagination):
         )
 
 
-class JobListView(generics.ListAPIView):
+class JobCursorPagination(BasePagination):
+    """
+    Keyset pagination on (date_posted, _id) for infinite scroll and deep crawls.
+
+    Each page is read straight off the (date_posted DESC, _id) index starting
+    from the position in an opaque cursor, so page 1000 costs the same as page 1.
+    No COUNT query is run: ``count``, ``count_exact``, ``page`` and ``total_pages``
+    are null in the otherwise unchanged ``JobPagination`` envelope.
+
+    Attributes:
+        cursor_query_param (str): Query parameter carrying the cursor token (cursor).
+        page_size_query_param (str): Query parameter for page size (limit).
+        max_page_size (int): Maximum allowed page size.
+        page_size (int): Default page size.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    max_page_size = JobPagination.max_page_size
+    page_size = JobPagination.page_size
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, job, reverse):
+        position = {"d": job.date_posted.isoformat(), "i": job._id, "r": int(reverse)}
+        token = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return (
+                datetime.fromisoformat(position["d"]),
+                str(position["i"]),
+                bool(position["r"]),
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_page_size(request)
+        self.base_url = remove_query_param(
+            request.build_absolute_uri(), PageNumberPagination.page_query_param
+        )
+        position = self.decode_cursor(request)
+        reverse = bool(position and position[2])
+
+        if position:
+            date_posted, job_id = position[0], position[1]
+            if reverse:
+                # Rows before the cursor, read backwards and flipped below.
+                queryset = queryset.filter(
+                    models.Q(date_posted__gt=date_posted)
+                    | models.Q(date_posted=date_posted, _id__lt=job_id),
+                    date_posted__gte=date_posted,
+                )
+            else:
+                # The redundant bound lets the index range start at the cursor.
+                queryset = queryset.filter(
+                    models.Q(date_posted__lt=date_posted)
+                    | models.Q(date_posted=date_posted, _id__gt=job_id),
+                    date_posted__lte=date_posted,
+                )
+        if reverse:
+            queryset = queryset.order_by("date_posted", "-_id")
+        else:
+            queryset = queryset.order_by("-date_posted", "_id")
+
+        rows = list(queryset[: self.limit + 1])
+        has_more = len(rows) > self.limit
+        rows = rows[: self.limit]
+        if reverse:
+            rows.reverse()
+
+        self.next_link = self.previous_link = None
+        if rows:
+            if has_more or reverse:
+                self.next_link = self.encode_cursor(rows[-1], reverse=False)
+            if position and (has_more or not reverse):
+                self.previous_link = self.encode_cursor(rows[0], reverse=True)
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "pagination": {
+                    "count": None,
+                    "count_exact": None,
+                    "page": None,
+                    "limit": self.limit,
+                    "next": self.next_link,
+                    "previous": self.previous_link,
+                    "total_pages": None,
+                },
+                "results": data,
+            }
+        )
+
+
+class ResponseCacheMixin:
+    """
+    Serve JSON responses from the Redis response cache (see job_board.cache).
+
+    Views set ``response_cache_name``, add to ``response_cache_params``
+    whatever besides the filters shapes the body, and return
+    ``cached_response()`` from ``get`` when it isn't None. Successful
+    responses are stored as they are finalized.
+    """
+
+    response_cache_name = None
+
+    def response_cache_params(self):
+        """
+        The request's query reduced to what determines the response body.
+
+        Parameter order, the case of case-insensitive filters, ignored values
+        and defaults don't change the result, so they don't change the cache
+        key either. Returns None for responses that aren't cached: non-JSON
+        renderings or a disabled cache.
+        """
+        if not settings.JOB_RESPONSE_CACHE_TIMEOUT:
+            return None
+        if self.request.accepted_renderer.format != "json":
+            return None
+        return normalize_filters(self.request.query_params)
+
+    def cached_response(self):
+        params = self.response_cache_params()
+        self.response_cache_key = (
+            response_cache_key(self.response_cache_name, params)
+            if params is not None
+            else None
+        )
+        if self.response_cache_key:
+            body = get_cached_response(self.response_cache_key)
+            if body is not None:
+                return HttpResponse(body, content_type="application/json")
+        return None
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "response_cache_key", None) and response.status_code == 200:
+            if isinstance(response, Response):
+                response.render()
+                set_cached_response(self.response_cache_key, response.content)
+        return response
+
+
+class JobListView(ResponseCacheMixin, GenerationCacheMixin, generics.ListAPIView):
     """
     ListAPIView for retrieving jobs with filtering, search, and pagination.
 
     Query Parameters:
-        q (str): Search by job title or company name (case-insensitive, partial match).
+        q (str): Full-text search on job title and company name; every word must
+            match the start of a word (see job_board.search).
+        sort (str): 'recency' (default, newest first) or 'relevance' (best search
+            match first; only applies with q).
         location (str): Filter by city, country, region (comma-separated: city,country,region).
         job_type (str): Filter by job type (case-insensitive, partial match).
         location_type (str): Filter by location type (case-insensitive, partial match).
         job_posted (str): Filter by posting date ('last_24_hour', 'last_3_days', 'last_7_days').
-        salary_min (float): Filter jobs with minimum salary >= this value.
-        salary_max (float): Filter jobs with maximum salary <= this value.
+        salary_min (float): Filter jobs with minimum annual salary >= this value.
+        salary_max (float): Filter jobs with maximum annual salary <= this value.
+        yoe_min (float): Filter jobs asking for at least this many years of experience.
+        yoe_max (float): Filter jobs asking for at most this many years of experience.
         page (int): Page number for pagination.
         limit (int): Page size for pagination.
+        pagination (str): 'cursor' to use keyset pagination (see JobCursorPagination)
+            instead of page numbers; follow the returned next/previous links.
+        cursor (str): Opaque position token from a cursor-mode next/previous link.
+        fields (str): Comma-separated job fields to return; only those columns
+            are loaded from the database.
+        view (str): 'list' (default, the compact JobListSerializer fields) or
+            'full' for every field. Ignored when fields is given.
 
     Returns:
         Paginated list of jobs with applied filters and search.
+
+    JSON pages are cached in Redis for the current dataset generation, keyed by
+    the normalized query (see ``ResponseCacheMixin``), so popular listings
+    are served without querying or serializing until the next sync. Pages
+    in the default list view are joined from each job's pre-rendered JSON
+    (see job_board.rendering) rather than serialized row by row. Responses
+    carry a generation ETag, ``Cache-Control`` and surrogate keys for the CDN
+    (see job_board.http_cache).
     """
 
-    serializer_class = JobSerializer
+    serializer_class = JobListSerializer
     pagination_class = JobPagination
+    renderer_classes = [FragmentJSONRenderer, BrowsableAPIRenderer]
+    response_cache_name = "job_list"
+    VIEWS = {"list", "full"}
+
+    def requested_fields(self):
+        """
+        The job fields to return, or None for every field.
+
+        Raises:
+            ValidationError: For unknown field names or an unknown view.
+        """
+        query = self.request.query_params
+        if query.get("fields"):
+            fields = [name.strip() for name in query["fields"].split(",")]
+            fields = [name for name in fields if name]
+            known = list(JobSerializer().fields)
+            unknown = [name for name in fields if name not in known]
+            if unknown:
+                raise ValidationError(
+                    {
+                        "fields": f"Unknown fields: {', '.join(unknown)}. "
+                        f"Must be among: {', '.join(known)}"
+                    }
+                )
+            return fields
+        view = query.get("view") or "list"
+        if view not in self.VIEWS:
+            raise ValidationError(
+                {
+                    "view": f"Invalid view. Must be one of: {', '.join(sorted(self.VIEWS))}"
+                }
+            )
+        if view == "full":
+            return None
+        return list(JobListSerializer.Meta.fields)
+
+    def get_serializer_class(self):
+        query = self.request.query_params
+        if query.get("fields") or query.get("view") == "full":
+            return JobSerializer
+        return JobListSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def uses_cursor_pagination(self):
+        params = self.request.query_params
+        return params.get("pagination") == "cursor" or "cursor" in params
+
+    @property
+    def paginator(self):
+        """The page-number paginator, or the cursor paginator when requested."""
+        if not hasattr(self, "_paginator"):
+            if self.uses_cursor_pagination():
+                if self.request.query_params.get("sort") == "relevance":
+                    raise ValidationError(
+                        {"sort": "Cursor pagination only supports sort=recency."}
+                    )
+                self._paginator = JobCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def response_cache_params(self):
+        params = super().response_cache_params()
+        if params is None:
+            return None
+        query = self.request.query_params
+        if "q" in params and query.get("sort") == "relevance":
+            params["sort"] = "relevance"
+        # Links in the body are absolute.
+        params["url"] = self.request.build_absolute_uri(self.request.path)
+        params["limit"] = self.paginator.get_page_size(self.request)
+        fields = self.requested_fields()
+        params["fields"] = sorted(set(fields)) if fields is not None else None
+        if self.uses_cursor_pagination():
+            params["cursor"] = query.get("cursor") or ""
+        else:
+            page = query.get(JobPagination.page_query_param) or "1"
+            params["page"] = str(int(page)) if page.isdigit() else page
+        return params
+
+    def get_surrogate_keys(self):
+        return listing_surrogate_keys(self.request.query_params.get("location"))
+
+    @method_decorator(condition(etag_func=generation_etag))
+    def get(self, request, *args, **kwargs):
+        cached = self.cached_response()
+        if cached is not None:
+            return cached
+        return self.list(request, *args, **kwargs)
+
+    def uses_rendered_json(self):
+        """Whether results can be joined from ``Job.rendered_json``."""
+        query = self.request.query_params
+        return (
+            isinstance(self.request.accepted_renderer, FragmentJSONRenderer)
+            and not query.get("fields")
+            and query.get("view", "list") == "list"
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.uses_rendered_json():
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset()).only(
+            "_id", "date_posted", "rendered_json"
+        )
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(render_jobs_array(page))
 
     def get_queryset(self):
         """
@@ -85,65 +463,215 @@ class JobListView(generics.ListAPIView):
         Returns:
             QuerySet: Filtered queryset of Job objects.
         """
-        queryset = Job.objects.all().order_by("-date_posted")
-        q = self.request.query_params.get("q")
-        if q:
-            queryset = queryset.filter(
-                models.Q(job_title__icontains=q) | models.Q(company_name__icontains=q)
+        queryset = Job.objects.all().order_by("-date_posted", "_id")
+        fields = self.requested_fields()
+        if fields is not None:
+            # Cursor links are built from date_posted and _id.
+            queryset = queryset.only("_id", "date_posted", *fields)
+        query = self.request.query_params
+        return filter_jobs(queryset, query, relevance=query.get("sort") == "relevance")
+
+
+def _job_validators(request, _id):
+    """
+    The ``content_hash`` and ``updated_at`` of job ``_id``, read once per request.
+
+    Only these two columns are loaded, so a conditional GET answered with 304
+    never reads the job's description or JSON columns.
+    """
+    if not hasattr(request, "job_validators"):
+        request.job_validators = (
+            Job.objects.filter(_id=_id).values("content_hash", "updated_at").first()
+        )
+    return request.job_validators
+
+
+def job_etag(request, _id):
+    """Strong ETag of the job's representation, which changes with either validator."""
+    validators = _job_validators(request, _id)
+    if validators is None:
+        return None
+    updated = int(validators["updated_at"].timestamp() * 1_000_000)
+    return f'"{validators["content_hash"] or "job"}-{updated:x}"'
+
+
+def job_last_modified(request, _id):
+    validators = _job_validators(request, _id)
+    return validators["updated_at"] if validators else None
+
+
+class JobFacetsView(ResponseCacheMixin, GenerationCacheMixin, APIView):
+    """
+    Job counts per filter chip for the jobs matching the ``/jobs/`` filters.
+
+    Takes the same filter parameters as JobListView and returns the number of
+    matching jobs and their counts by job_type, location_type, country,
+    visa_sponsored and salary/experience bucket (see job_board.facets). The
+    counts are aggregated in the database and cached for the current dataset
+    generation per normalized filter set.
+    """
+
+    response_cache_name = "job_facets"
+
+    def get_surrogate_keys(self):
+        return listing_surrogate_keys(self.request.query_params.get("location"))
+
+    @method_decorator(condition(etag_func=generation_etag))
+    def get(self, request, *args, **kwargs):
+        cached = self.cached_response()
+        if cached is not None:
+            return cached
+        return Response(
+            compute_facets(filter_jobs(Job.objects.all(), request.query_params))
+        )
+
+
+class JobBatchView(ResponseCacheMixin, APIView):
+    """
+    Several ``/jobs/`` listings in one request, e.g. the home page shelves.
+
+    POST ``{"queries": [{...}, ...]}`` with up to ``MAX_QUERIES`` objects of
+    JobListView filter parameters plus ``sort``, ``page`` and ``limit``.
+    Returns ``{"results": [...]}`` with one page per query, in order, in the
+    ``/jobs/`` envelope without next/previous links. A page past the last
+    one is empty.
+
+    Each page costs one query for its job IDs plus its count, which comes
+    from the ``/jobs/`` count cache. The jobs of all pages are then loaded in
+    one query and each distinct job's pre-rendered JSON (see
+    job_board.rendering) is spliced into every page that lists it. Whole
+    responses are cached for the current dataset generation per normalized
+    batch.
+    """
+
+    renderer_classes = [FragmentJSONRenderer, BrowsableAPIRenderer]
+    response_cache_name = "job_batch"
+    MAX_QUERIES = 10
+
+    def get_queries(self) -> List[Dict[str, str]]:
+        """
+        The request's filter sets, with values as query-string text.
+
+        Raises:
+            ValidationError: For a missing or malformed ``queries`` list.
+        """
+        data = self.request.data
+        queries = data.get("queries") if isinstance(data, dict) else None
+        if not isinstance(queries, list) or not 0 < len(queries) <= self.MAX_QUERIES:
+            raise ValidationError(
+                {"queries": f"Must be a list of 1 to {self.MAX_QUERIES} objects."}
+            )
+        if not all(isinstance(query, dict) for query in queries):
+            raise ValidationError({"queries": "Each query must be an object."})
+        return [
+            {
+                str(name): str(value)
+                for name, value in query.items()
+                if isinstance(value, (str, int, float)) and not isinstance(value, bool)
+            }
+            for query in queries
+        ]
+
+    def page_number(self, params: Dict[str, str]) -> int:
+        page = params.get(JobPagination.page_query_param) or "1"
+        if not page.isdigit() or int(page) < 1:
+            raise ValidationError({"page": f"Invalid page: {page}"})
+        return int(page)
+
+    def page_size(self, params: Dict[str, str]) -> int:
+        try:
+            limit = int(params[JobPagination.page_size_query_param])
+        except (KeyError, ValueError):
+            return JobPagination.page_size
+        if limit <= 0:
+            return JobPagination.page_size
+        return min(limit, JobPagination.max_page_size)
+
+    def response_cache_params(self):
+        if super().response_cache_params() is None:
+            return None
+        batch = []
+        for params in self.queries:
+            normalized = normalize_filters(params)
+            if "q" in normalized and params.get("sort") == "relevance":
+                normalized["sort"] = "relevance"
+            normalized["page"] = self.page_number(params)
+            normalized["limit"] = self.page_size(params)
+            batch.append(normalized)
+        return {"queries": batch}
+
+    def post(self, request, *args, **kwargs):
+        self.queries = self.get_queries()
+        cached = self.cached_response()
+        if cached is not None:
+            return cached
+        pages = []
+        for params in self.queries:
+            page, limit = self.page_number(params), self.page_size(params)
+            queryset = filter_jobs(
+                Job.objects.order_by("-date_posted", "_id"),
+                params,
+                relevance=params.get("sort") == "relevance",
             )
-        location = self.request.query_params.get("location")
-        if location:
-            # Expecting format: city,country,region (any can be omitted)
-            parts = [p.strip() for p in location.split(",")]
-            city = parts[0] if len(parts) > 0 and parts[0] else None
-            country = parts[1] if len(parts) > 1 and parts[1] else None
-            region = parts[2] if len(parts) > 2 and parts[2] else None
-            location_filters = models.Q()
-            if city:
-                location_filters &= models.Q(locations__contains=[{"city": city}])
-            if country:
-                location_filters &= models.Q(locations__contains=[{"country": country}])
-            if region:
-                location_filters &= models.Q(locations__contains=[{"region": region}])
-            queryset = queryset.filter(location_filters)
-        job_type = self.request.query_params.get("job_type")
-        if job_type:
-            queryset = queryset.filter(job_type__icontains=job_type)
-        location_type = self.request.query_params.get("location_type")
-        if location_type:
-            queryset = queryset.filter(location_type__icontains=location_type)
-        job_posted = self.request.query_params.get("job_posted")
-        if job_posted:
-            now = timezone.now()
-            if job_posted == "last_24_hour":
-                since = now - timezone.timedelta(hours=24)
-                queryset = queryset.filter(date_posted__gte=since)
-            elif job_posted == "last_3_days":
-                since = now - timezone.timedelta(days=3)
-                queryset = queryset.filter(date_posted__gte=since)
-            elif job_posted == "last_7_days":
-                since = now - timezone.timedelta(days=7)
-                queryset = queryset.filter(date_posted__gte=since)
-        salary_min = self.request.query_params.get("salary_min")
-        salary_max = self.request.query_params.get("salary_max")
-        if salary_min is not None:
-            try:
-                salary_min = float(salary_min)
-                queryset = queryset.filter(salary_range__min__gte=salary_min)
-            except ValueError:
-                pass
-        if salary_max is not None:
-            try:
-                salary_max = float(salary_max)
-                queryset = queryset.filter(salary_range__max__lte=salary_max)
-            except ValueError:
-                pass
-        return queryset
-
-
-class LocationListView(APIView):
-    """
-    API view to return all unique locations from the Job model.
+            count, exact = count_jobs(queryset, params)
+            offset = (page - 1) * limit
+            ids = list(queryset.values_list("_id", flat=True)[offset : offset + limit])
+            pagination = {
+                "count": count,
+                "count_exact": exact,
+                "page": page,
+                "limit": limit,
+                "next": None,
+                "previous": None,
+                "total_pages": max(1, -(-count // limit)),
+            }
+            pages.append((pagination, ids))
+
+        unique_ids = {job_id for _, ids in pages for job_id in ids}
+        fragments = job_fragments(
+            Job.objects.filter(_id__in=unique_ids).only("_id", "rendered_json")
+        )
+        renderer = FragmentJSONRenderer()
+        rendered = [
+            renderer.render(
+                {
+                    "pagination": pagination,
+                    "results": RenderedJSON(
+                        "["
+                        + ",".join(fragments[i] for i in ids if i in fragments)
+                        + "]"
+                    ),
+                }
+            ).decode()
+            for pagination, ids in pages
+        ]
+        return Response({"results": RenderedJSON("[" + ",".join(rendered) + "]")})
+
+
+class JobDetailView(generics.RetrieveAPIView):
+    """
+    Retrieve one job with every field.
+
+    Responses carry a strong ``ETag`` (from the job's content hash and
+    ``updated_at``) and ``Last-Modified``. Requests with a matching
+    ``If-None-Match`` or a current ``If-Modified-Since`` get a 304 after a
+    single query on those two columns.
+    """
+
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    lookup_field = "_id"
+
+    @method_decorator(
+        condition(etag_func=job_etag, last_modified_func=job_last_modified)
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class LocationListView(GenerationCacheMixin, APIView):
+    """
+    API view to return all unique locations of current jobs (see job_board.locations).
 
     Query Parameters:
         search (str): Optional. Case-insensitive substring to filter locations.
@@ -156,6 +684,10 @@ class LocationListView(APIView):
     CACHE_KEY = "job_board:unique_locations"
     CACHE_TIMEOUT = 60 * 30  # 30 minutes
 
+    def get_surrogate_keys(self):
+        return ["locations"]
+
+    @method_decorator(condition(etag_func=generation_etag))
     def get(self, request, *args, **kwargs):
         """
         Get all unique locations, using Redis cache if available.
@@ -164,33 +696,31 @@ class LocationListView(APIView):
             Response: JSON response with a list of unique locations.
         """
         search = request.query_params.get("search", "").strip().lower()
-        locations_list = redis_client.lrange(self.CACHE_KEY, 0, -1)
+        # Cached per dataset generation, so a sync's purge never refills the CDN
+        # from a stale list.
+        cache_key = f"{self.CACHE_KEY}:{dataset_generation()}"
+        locations_list = redis_client.lrange(cache_key, 0, -1)
         if not locations_list:
             locations_set = set()
-            for job in Job.objects.exclude(locations=None):
-                for loc in job.locations:
-                    city = (loc.get("city") or "").strip()
-                    country = (loc.get("country") or "").strip()
-                    region = (loc.get("region") or "").strip()
-                    fields = [city, country, region]
-                    filtered_fields = [f for f in fields if f]
-                    if filtered_fields:
-                        locations_set.add(",".join(filtered_fields))
+            for parts in linked_locations().values_list("city", "country", "region"):
+                filtered_fields = [f for f in parts if f]
+                if filtered_fields:
+                    locations_set.add(",".join(filtered_fields))
             locations_list = sorted(list(locations_set))
             if locations_list:
                 # Store in Redis as a list
-                redis_client.delete(self.CACHE_KEY)
-                redis_client.rpush(self.CACHE_KEY, *locations_list)
-                redis_client.expire(self.CACHE_KEY, self.CACHE_TIMEOUT)
+                redis_client.delete(cache_key)
+                redis_client.rpush(cache_key, *locations_list)
+                redis_client.expire(cache_key, self.CACHE_TIMEOUT)
         # Filter by search if provided
         if search:
             locations_list = [loc for loc in locations_list if search in loc.lower()]
         return Response({"locations": locations_list[:100]})
 
 
-class LocationFieldListView(APIView):
+class LocationFieldListView(GenerationCacheMixin, APIView):
     """
-    API view to return a unique list of cities, countries, or regions from the Job model.
+    API view to return a unique list of cities, countries, or regions of current jobs.
 
     Query Parameters:
         field (str): Required. One of 'city', 'country', or 'region'.
@@ -204,6 +734,10 @@ class LocationFieldListView(APIView):
     CACHE_TIMEOUT = 60 * 30  # 30 minutes
     VALID_FIELDS = {"city", "country", "region"}
 
+    def get_surrogate_keys(self):
+        return ["locations"]
+
+    @method_decorator(condition(etag_func=generation_etag))
     def get(self, request, *args, **kwargs):
         """
         Get all unique values for the requested field, using Redis cache if available.
@@ -220,16 +754,16 @@ class LocationFieldListView(APIView):
                 },
                 status=400,
             )
-        cache_key = f"{self.CACHE_KEY_PREFIX}_{field}"
+        cache_key = f"{self.CACHE_KEY_PREFIX}_{field}:{dataset_generation()}"
         values_list = redis_client.lrange(cache_key, 0, -1)
         if not values_list:
-            values_set = set()
-            for job in Job.objects.exclude(locations=None):
-                for loc in job.locations:
-                    value = (loc.get(field) or "").strip()
-                    if value:
-                        values_set.add(value)
-            values_list = sorted(list(values_set))
+            values_list = list(
+                linked_locations()
+                .exclude(**{field: ""})
+                .order_by(field)
+                .values_list(field, flat=True)
+                .distinct()
+            )
             if values_list:
                 redis_client.delete(cache_key)
                 redis_client.rpush(cache_key, *values_list)
@@ -237,3 +771,61 @@ class LocationFieldListView(APIView):
         if search:
             values_list = [v for v in values_list if search in v.lower()]
         return Response({f"{field}s": values_list[:100]})
+
+
+class JobSuggestView(APIView):
+    """
+    Search-as-you-type suggestions for job titles and company names.
+
+    Served from the precomputed ``SuggestIndex`` (refreshed after each Hirebase
+    sync) rather than the jobs table, so it is cheap enough to call per keystroke.
+
+    Query Parameters:
+        q (str): Required. Prefix or possibly misspelled title/company name.
+        type (str): Optional. 'title' or 'company' to restrict suggestions.
+        limit (int): Optional. Number of suggestions (default 10, max 25).
+
+    Returns:
+        JSON response with ``suggestions`` (text, type, job count) and ``fuzzy``,
+        true when typo-tolerant matches were added to fill the list.
+    """
+
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 25
+
+    def get(self, request, *args, **kwargs):
+        q = request.query_params.get("q", "").strip()
+        kind = request.query_params.get("type") or None
+        if kind is not None and kind not in SUGGEST_KINDS:
+            return Response(
+                {"error": f"Invalid type. Must be one of: {', '.join(SUGGEST_KINDS)}"},
+                status=400,
+            )
+        try:
+            limit = int(request.query_params.get("limit", self.DEFAULT_LIMIT))
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+        limit = min(max(limit, 1), self.MAX_LIMIT)
+        return Response(SuggestIndex().suggest(q, limit, kind))
+
+
+class MetricsView(View):
+    """
+    Prometheus scrape endpoint for ingestion telemetry.
+
+    Serves the per-page fetch/parse/write histograms, row and page counters
+    and last-run gauges recorded by the Hirebase sync. When ``METRICS_TOKEN``
+    is set, requests must send ``Authorization: Bearer <token>``.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def get(self, request, *args, **kwargs):
+        token = settings.METRICS_TOKEN
+        if token and not constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            return HttpResponse(status=401)
+        return HttpResponse(
+            IngestionMetrics().render_prometheus(), content_type=self.CONTENT_TYPE
+        )